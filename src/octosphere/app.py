@@ -1,25 +1,47 @@
 """FastHTML UI for Octosphere bridge."""
 import asyncio
+import gzip
+import hashlib
+import hmac
 import json
 import logging
+import mimetypes
 import os
 import re
 import secrets
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from html import escape
 from pathlib import Path
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
+
+try:
+    # orjson parses the small Jetstream messages several times faster when installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 import websockets
 from fasthtml.common import *
 from starlette.responses import RedirectResponse, FileResponse
 from starlette.background import BackgroundTask
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 
-from octosphere.atproto.client import AtprotoClient
+from atproto_identity.resolver import IdResolver
+
+from octosphere.atproto.client import AtprotoAuth, AtprotoClient
 from octosphere.atproto.models import OCTOSPHERE_PUBLICATION_NSID
-from octosphere.bridge import sync_publications
-from octosphere.database import db, encrypt_password, users, synced_publications, NotFoundError
+from octosphere.bridge import DEFAULT_SYNC_CONCURRENCY, sync_publications
+from octosphere.cache import TTLCache
+from octosphere.database import db, bluesky_handles, count_synced_publications, decrypt_password, delete_synced_publications, encrypt_password, get_user_summary, record_synced_publications, set_user_active, synced_publication_keys, upsert_user, users, NotFoundError
 from octosphere.octopus.client import OctopusClient
 from octosphere.orcid import OrcidClient, OrcidProfile
+from octosphere.panels import dashboard_panel, loading_indicator, results_table, step1_panel, step2_panel, sync_results_panel, sync_stats
 from octosphere.settings import Settings
 from octosphere.tasks import task_sync_user
 import threading
@@ -72,10 +94,67 @@ def _configure_logging():
 _configure_logging()
 logger = logging.getLogger(__name__)
 
-# In-memory sync status tracking (for polling-based loading indicator)
+# In-memory sync status tracking (streamed to the syncing panel)
 # Format: {orcid: {"status": "syncing"|"complete"|"error", "results": [...], "error": str, "bsky_handle": str}}
+# Writers always publish a fully built dict with a single assignment, so the
+# readers can use plain (GIL-atomic) get/pop without taking the lock.
 _sync_status: dict[str, dict] = {}
 _sync_lock = threading.Lock()
+# /sync_status streams waiting on each ORCID, as (event loop, asyncio.Event)
+# pairs so sync worker threads can wake them without polling
+_sync_watchers: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+
+def _set_sync_status(orcid: str, status: dict) -> None:
+    """Publish a user's sync status and wake any stream watching it."""
+    with _sync_lock:
+        _sync_status[orcid] = status
+        watchers = tuple(_sync_watchers.get(orcid, ()))
+    for loop, changed in watchers:
+        loop.call_soon_threadsafe(changed.set)
+
+# Shared worker pool for syncs triggered from request handlers, so the
+# HTTP worker is released as soon as the job is queued
+_sync_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="sync")
+
+# Small pool for independent Octopus lookups a single request can overlap
+_octopus_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="octopus")
+
+# Publications fetched in validate_octopus, reused by setup_sync a moment later
+# Format: {octopus_user_id: [publication, ...]}
+_pub_cache = TTLCache(ttl=60)
+
+# Octopus publication counts for the dashboard, keyed by octopus_user_id.
+# Seeded whenever onboarding fetches the list, so the first dashboard view
+# after enabling sync does not go back to Octopus for the count.
+_pub_counts = TTLCache(ttl=600)
+
+# Octopus users whose count lookup just failed; while listed, the stats panel
+# shows 0 instead of retrying, so an Octopus outage costs one timeout a minute
+_pub_count_failures = TTLCache(ttl=60)
+
+
+# Octopus author ids that get_user_info has confirmed exist
+_verified_authors = TTLCache(ttl=3600)
+
+
+def _octopus_author_known(orcid: str, octopus_user_id: str) -> bool:
+    """Whether an Octopus author id is already known to exist (no lookup needed)."""
+    if _verified_authors.get(octopus_user_id):
+        return True
+    existing = get_user_summary(orcid)
+    return bool(existing) and existing.get("octopus_user_id") == octopus_user_id
+
+
+def _remember_publications(octopus_user_id: str, publications: list) -> None:
+    """Cache a freshly fetched publication list and its dashboard count."""
+    _pub_cache.set(octopus_user_id, publications)
+    _pub_counts.set(octopus_user_id, len(publications))
+
+# One-shot tokens minted when sync_once finishes. The credentials behind them
+# were just used for a sync and saved, so "Enable auto-sync" can skip the login.
+# Format: {token: (orcid, bsky_handle)}
+_autosync_tokens = TTLCache(ttl=30 * 60)
 
 
 def _run_sync_in_background(
@@ -83,38 +162,71 @@ def _run_sync_in_background(
     octopus_user_id: str,
     bsky_handle: str,
     bsky_password: str,
-    already_synced: set,
+    already_synced: set | None = None,
+    publications: list | None = None,
 ):
-    """Run sync in background thread and update _sync_status when done."""
+    """Run sync in background thread and update _sync_status when done.
+
+    already_synced defaults to the user's recorded (publication, version)
+    pairs, looked up here so the request that queued the sync never waits on it.
+    """
+    synced: list = []
+
+    def report(done: int, total: int) -> None:
+        _set_sync_status(orcid, {
+            "status": "syncing",
+            "bsky_handle": bsky_handle,
+            "done": done,
+            "total": total,
+            "recent": synced[-10:],  # newest rows, shown while the sync runs
+        })
+
     try:
         octopus = _octopus_client()
-        atproto = _atproto_client()
-        auth = atproto.create_session(bsky_handle, bsky_password)
+        atproto, auth = _bsky_login(bsky_handle, bsky_password)
+        if already_synced is None:
+            already_synced = synced_publication_keys(orcid)
         
-        results = sync_publications(octopus, atproto, auth, octopus_user_id, already_synced=already_synced)
+        results = sync_publications(
+            octopus, atproto, auth, octopus_user_id,
+            already_synced=already_synced, publications=publications, on_progress=report,
+            max_workers=settings.sync_concurrency if settings else DEFAULT_SYNC_CONCURRENCY,
+            on_result=synced.append,
+        )
         
-        # Record synced publications in database
-        for r in results:
-            synced_publications.insert(
-                orcid=orcid,
-                octopus_pub_id=r.publication_id,
-                octopus_version_id=r.version_id,
-                at_uri=r.uri,
-            )
+        # Record synced publications in database (one transaction for the batch)
+        record_synced_publications(orcid, results)
         
-        with _sync_lock:
-            _sync_status[orcid] = {
-                "status": "complete",
-                "results": results,
-                "bsky_handle": bsky_handle,
-            }
+        _set_sync_status(orcid, {
+            "status": "complete",
+            "results": results,
+            "bsky_handle": bsky_handle,
+        })
     except Exception as e:
-        with _sync_lock:
-            _sync_status[orcid] = {
-                "status": "error",
-                "error": str(e),
-                "bsky_handle": bsky_handle,
-            }
+        _set_sync_status(orcid, {
+            "status": "error",
+            "error": str(e),
+            "bsky_handle": bsky_handle,
+        })
+
+
+def _run_manual_sync_in_background(orcid: str, bsky_handle: str):
+    """Run task_sync_user for a dashboard "Sync Now" and update _sync_status when done."""
+    try:
+        task_sync_user(orcid)
+        status = {"status": "complete", "kind": "manual", "bsky_handle": bsky_handle}
+    except Exception as e:
+        status = {"status": "error", "error": str(e), "bsky_handle": bsky_handle}
+    _set_sync_status(orcid, status)
+
+
+def _run_auto_sync_in_background(orcid: str, publications: list | None = None):
+    """Run task_sync_user after auto-sync is enabled; nobody is waiting on the result."""
+    try:
+        task_sync_user(orcid, publications=publications)
+    except Exception:
+        pass  # already logged by task_sync_user; the next scheduled sync retries
+
 
 # Get static/lexicon paths - try CWD first (works on Railway), then fall back to __file__-relative
 def _find_path(name: str) -> Path:
@@ -133,6 +245,61 @@ def _find_path(name: str) -> Path:
 STATIC_PATH = _find_path("static")
 LEXICON_PATH = _find_path("lexicon")
 
+
+def _list_files(root: Path) -> frozenset[str]:
+    """Relative POSIX paths of all files under root (empty if root is missing)."""
+    files = []
+    stack = [(root, "")]
+    while stack:
+        path, prefix = stack.pop()
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir():
+                stack.append((entry.path, f"{prefix}{entry.name}/"))
+            elif entry.is_file():
+                files.append(f"{prefix}{entry.name}")
+    return frozenset(files)
+
+
+# Static content is fixed at deploy time, so unknown names 404 without touching disk
+_STATIC_FILES = _list_files(STATIC_PATH)
+
+
+def _load_lexicons(root: Path) -> dict[str, tuple[bytes, bytes, str]]:
+    """Read each lexicon once: raw bytes, gzip-9 bytes and a content ETag."""
+    lexicons = {}
+    for name in _list_files(root):
+        raw = (root / name).read_bytes()
+        etag = f'W/"{hashlib.md5(raw, usedforsecurity=False).hexdigest()}"'
+        lexicons[name] = (raw, gzip.compress(raw, compresslevel=9), etag)
+    return lexicons
+
+
+# Lexicons are small and fixed at deploy time: serve them from memory, precompressed
+_LEXICONS = _load_lexicons(LEXICON_PATH)
+
+# Static files up to this size are held in memory; larger ones stream from disk
+_STATIC_MEMORY_LIMIT = 256 * 1024
+
+
+def _load_static(root: Path, names: frozenset[str]) -> dict[str, tuple[bytes, str, str, str]]:
+    """Read each small static file once: bytes, content ETag, Last-Modified and media type."""
+    files = {}
+    for name in names:
+        fpath = root / name
+        st = fpath.stat()
+        if st.st_size > _STATIC_MEMORY_LIMIT:
+            continue
+        raw = fpath.read_bytes()
+        etag = f'"{hashlib.md5(raw, usedforsecurity=False).hexdigest()}"'
+        media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        files[name] = (raw, etag, formatdate(st.st_mtime, usegmt=True), media_type)
+    return files
+
+
 settings: Settings | None
 settings_error: str | None = None
 try:
@@ -175,22 +342,25 @@ PUBLIC_ROUTES = [
     r'^/logout$',
     r'^/feed.*$',
 ]
+_PUBLIC_ROUTE_RE = re.compile("|".join(PUBLIC_ROUTES))
 
+# Assets never read the session, so Beforeware skips them outright
+_AUTH_SKIP = [r'/favicon\.ico', r'/static/.*', r'/lexicon/.*']
 
-def auth_before(req, sess):
-    """Beforeware to set auth in request scope and protect private routes."""
-    # Set auth from session (prevents injection via query params)
-    orcid_data = sess.get('orcid')
-    if orcid_data and orcid_data.get('access_token'):
-        req.scope['auth'] = orcid_data
-    else:
-        req.scope['auth'] = None
+
+async def auth_before(req, sess):
+    """Beforeware to set auth in request scope and protect private routes.
+
+    Async because it only touches the session and in-process caches: FastHTML
+    awaits it on the event loop instead of handing each request to a thread.
+    """
+    # Resolve the ORCID profile from the session once per request (prevents
+    # injection via query params); handlers receive it as their `auth` argument
+    req.scope['auth'] = _require_login(sess)
 
     # Check if route requires authentication
-    path = req.url.path
-    for pattern in PUBLIC_ROUTES:
-        if re.match(pattern, path):
-            return None  # Allow access to public routes
+    if _PUBLIC_ROUTE_RE.match(req.url.path):
+        return None  # Allow access to public routes
 
     # Require auth for all other routes
     if not req.scope['auth']:
@@ -199,8 +369,9 @@ def auth_before(req, sess):
     return None
 
 
-# Create Beforeware instance
-bware = Beforeware(auth_before, skip=[])  # We handle skip logic inside auth_before
+# Create Beforeware instance (public pages are handled inside auth_before,
+# since they still need `auth` for the nav)
+bware = Beforeware(auth_before, skip=_AUTH_SKIP)
 
 
 app, rt = fast_app(
@@ -209,34 +380,126 @@ app, rt = fast_app(
     before=bware,
     sess_https_only=os.getenv("ENVIRONMENT", "development") == "production",  # HTTPS-only in production
     same_site='lax',  # Prevent CSRF via cross-site requests
+    # HTML panels compress well; the SSE feed and PNGs are excluded by GZipMiddleware
+    # itself. Level 5 keeps nearly all of level 9's savings on HTML at a fraction of the CPU
+    middleware=[Middleware(GZipMiddleware, minimum_size=512, compresslevel=5)],
 )
 
+# fast_app always registers a catch-all "/{fname}.{ext}" route serving files from
+# the working directory; it would shadow the cached static routes below
+app.router.routes[:] = [r for r in app.router.routes if getattr(r, "path", "") != "/{fname:path}.{ext:static}"]
 
-# Explicit static file serving with absolute path (works on Railway)
-@rt("/static/{fname:path}")
-def static_files(fname: str):
-    fpath = STATIC_PATH / fname
-    if fpath.exists():
-        return FileResponse(fpath)
-    return Response("Not found", status_code=404)
 
+# Static assets aren't fingerprinted, so cache for a day and revalidate by ETag;
+# lexicons may change with any deploy, so clients always revalidate them
+_STATIC_CACHE_CONTROL = "public, max-age=86400"
+_LEXICON_CACHE_CONTROL = "public, no-cache"
 
-# Serve favicon at root for pdsls.dev and other tools that look for octosphere.social/favicon.ico
-@rt("/favicon.ico")
-def favicon():
-    fpath = STATIC_PATH / "octosphere.ico"
-    if fpath.exists():
-        return FileResponse(fpath, media_type="image/x-icon")
-    return Response("Not found", status_code=404)
+
+def _unchanged_since(req, last_modified: str) -> bool:
+    """True if the request's If-Modified-Since is at or after last_modified."""
+    since = req.headers.get("if-modified-since")
+    if not since:
+        return False
+    try:
+        return parsedate_to_datetime(since) >= parsedate_to_datetime(last_modified)
+    except (TypeError, ValueError):
+        return False
+
+
+def _cached_file(req, fpath: Path, cache_control: str, media_type: str | None = None):
+    """Serve a file with Cache-Control, answering a conditional request with 304.
+
+    If-None-Match is checked first; If-Modified-Since is only consulted when
+    the client sent no ETag (RFC 9110 section 13.1.3).
+    """
+    try:
+        st = fpath.stat()  # one stat serves both the existence check and the ETag
+    except OSError:
+        return Response("Not found", status_code=404)
+    if not stat.S_ISREG(st.st_mode):
+        return Response("Not found", status_code=404)
+    resp = FileResponse(fpath, media_type=media_type, stat_result=st, headers={"Cache-Control": cache_control})
+    etag = resp.headers["etag"]
+    if_none_match = req.headers.get("if-none-match")
+    if if_none_match == etag or (if_none_match is None and _unchanged_since(req, resp.headers["last-modified"])):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    return resp
+
+
+def _memory_file(req, name: str, cache_control: str, media_type: str | None = None):
+    """Serve a file from _STATIC_MEMORY, or from disk if it wasn't preloaded."""
+    cached = _STATIC_MEMORY.get(name)
+    if cached is None:
+        return _cached_file(req, STATIC_PATH / name, cache_control, media_type=media_type)
+    raw, etag, last_modified, guessed_type = cached
+    headers = {"ETag": etag, "Last-Modified": last_modified, "Cache-Control": cache_control}
+    if_none_match = req.headers.get("if-none-match")
+    if if_none_match == etag or (if_none_match is None and _unchanged_since(req, last_modified)):
+        return Response(status_code=304, headers=headers)
+    return Response(raw, media_type=media_type or guessed_type, headers=headers)
+
+
+# Pages are revalidated on every load; their ETags hash what they render from,
+# salted with the package source so a deploy never revives an old rendering
+_PAGE_CACHE_CONTROL = "private, no-cache"
+_RENDER_VERSION = hashlib.md5(
+    b"".join(p.read_bytes() for p in sorted(Path(__file__).parent.glob("*.py"))), usedforsecurity=False
+).hexdigest()
+
+
+def _page_etag(req, *parts) -> str:
+    """Weak ETag for a page rendered from parts (and the request's URL and HTMX headers)."""
+    key = "\x1f".join(map(str, (
+        _RENDER_VERSION, req.url, req.headers.get("hx-request"), req.headers.get("hx-history-restore-request"), *parts,
+    )))
+    return f'W/"{hashlib.blake2s(key.encode(), digest_size=12).hexdigest()}"'
+
+
+def _page_not_modified(req, etag: str) -> Response | None:
+    """A 304 if the client already holds etag, else None."""
+    if req.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _PAGE_CACHE_CONTROL})
+    return None
+
+
+def _page_cache_headers(etag: str) -> tuple:
+    return HttpHeader("ETag", etag), HttpHeader("Cache-Control", _PAGE_CACHE_CONTROL)
+
+
+# Behind a reverse proxy that serves /static and /favicon.ico itself (see README),
+# set STATIC_VIA_PROXY=1 so those requests never reach Python
+if os.getenv("STATIC_VIA_PROXY") != "1":
+    # The logo and favicon are on every page, so keep them in memory rather than stat/open per request
+    _STATIC_MEMORY = _load_static(STATIC_PATH, _STATIC_FILES)
+
+    # Explicit static file serving with absolute path (works on Railway)
+    @rt("/static/{fname:path}")
+    def static_files(fname: str, req):
+        if fname not in _STATIC_FILES:
+            return Response("Not found", status_code=404)
+        return _memory_file(req, fname, _STATIC_CACHE_CONTROL)
+
+    # Serve favicon at root for pdsls.dev and other tools that look for octosphere.social/favicon.ico
+    @rt("/favicon.ico")
+    def favicon(req):
+        return _memory_file(req, "octosphere.ico", _STATIC_CACHE_CONTROL, media_type="image/x-icon")
 
 
 # Serve lexicon schemas for discoverability (AT Protocol best practice)
 @rt("/lexicon/{fname:path}")
-def lexicon_files(fname: str):
-    fpath = LEXICON_PATH / fname
-    if fpath.exists():
-        return FileResponse(fpath, media_type="application/json")
-    return Response("Not found", status_code=404)
+def lexicon_files(fname: str, req):
+    lexicon = _LEXICONS.get(fname)
+    if lexicon is None:
+        return Response("Not found", status_code=404)
+    raw, compressed, etag = lexicon
+    headers = {"ETag": etag, "Cache-Control": _LEXICON_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if req.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if "gzip" in req.headers.get("accept-encoding", ""):
+        # Already compressed, so GZipMiddleware passes it through untouched
+        return Response(compressed, media_type="application/json", headers={**headers, "Content-Encoding": "gzip"})
+    return Response(raw, media_type="application/json", headers=headers)
 
 
 
@@ -281,13 +544,13 @@ def _orcid_button(text: str = "Sign in with ORCID", href: str = "/login", compac
     )
 
 
-def _nav(profile: OrcidProfile | None = None):
-    """Render navigation bar."""
+def _build_nav(signed_in: bool):
+    """Build the navigation bar for a signed-in or anonymous visitor."""
     nav_items = [
         Li(A("Home", href="/")),
         Li(A("Feed", href="/feed")),
     ]
-    if profile:
+    if signed_in:
         nav_items.append(Li(A("Dashboard", href="/dashboard")))
         nav_items.append(Li(A("Sign out", href="/logout")))
     else:
@@ -309,6 +572,29 @@ def _nav(profile: OrcidProfile | None = None):
     )
 
 
+# Page chrome depends only on login state, so both variants are rendered to HTML
+# once and emitted as raw strings (no per-request component tree to serialize)
+_NAV_ANON = NotStr(to_xml(_build_nav(signed_in=False)))
+_NAV_AUTH = NotStr(to_xml(_build_nav(signed_in=True)))
+_FONT_AWESOME = Link(rel="stylesheet", href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css")
+_SITE_FOOTER = NotStr(to_xml(Footer(
+    P(
+        A(I(cls="fa-brands fa-github"), href="https://github.com/AndreasThinks/octosphere", style="margin-right: 1rem;"),
+        "Created by ",
+        A("AndreasThinks", href="https://andreasthinks.me/"),
+        " with help from some ✨vibes✨",
+        style="font-size: 0.875rem; color: var(--pico-muted-color);",
+    ),
+    cls="container",
+    style="margin-top: 2rem; padding-top: 1rem; border-top: 1px solid var(--pico-muted-border-color); text-align: center;",
+)))
+
+
+def _nav(profile: OrcidProfile | None = None):
+    """Return the navigation bar for the current visitor."""
+    return _NAV_AUTH if profile else _NAV_ANON
+
+
 def _custom_styles():
     """Return custom CSS styles that work in both light and dark modes."""
     return Style("""
@@ -553,70 +839,54 @@ def _custom_styles():
     """)
 
 
+# Head elements shared by every full page, built once at import. FastHTML
+# only hoists real title/meta/link/style tags into <head>, so these stay FT
+# nodes (which render without being mutated) rather than raw strings.
+_PAGE_HEAD = (
+    Meta(name="color-scheme", content="light dark"),
+    *Favicon('/static/octosphere.ico', '/static/octosphere.ico'),
+    _FONT_AWESOME,
+    _custom_styles(),
+)
+
+
 def _page(title: str, *content, profile: OrcidProfile | None = None):
     """Wrap content in a standard page layout."""
     return (
         Title(f"{title} - Octosphere"),
-        Meta(name="color-scheme", content="light dark"),
-        Favicon('/static/octosphere.ico', '/static/octosphere.ico'),
-        Link(rel="stylesheet", href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css"),
-        _custom_styles(),
+        *_PAGE_HEAD,
         _nav(profile),
         Main(*content, cls="container"),
-        Footer(
-            P(
-                A(I(cls="fa-brands fa-github"), href="https://github.com/AndreasThinks/octosphere", style="margin-right: 1rem;"),
-                "Created by ",
-                A("AndreasThinks", href="https://andreasthinks.me/"),
-                " with help from some ✨vibes✨",
-                style="font-size: 0.875rem; color: var(--pico-muted-color);",
-            ),
-            cls="container",
-            style="margin-top: 2rem; padding-top: 1rem; border-top: 1px solid var(--pico-muted-border-color); text-align: center;",
-        ),
+        _SITE_FOOTER,
     )
 
 
-# Run migrations on startup (only for NEW databases)
-def run_migrations():
-    """Handle database creation for new deployments.
-    
-    NOTE: Enrollment of existing databases is handled in database.py BEFORE
-    fastlite.database() is called. This function only creates new databases.
-    """
-    from pathlib import Path
-    from fastmigrate import create_db, run_migrations as fm_migrate
-    
-    migrations_path = os.getenv("MIGRATIONS_PATH", "migrations")
-    db_path = os.getenv("DATABASE_PATH", "octosphere.db")
-    
-    db_file = Path(db_path)
-    if not db_file.exists():
-        # No database exists - create fresh versioned database
-        print(f"[Octosphere] Creating new database at {db_path}")
-        create_db(Path(db_path))
-        # Apply migrations to set up schema
-        fm_migrate(Path(db_path), Path(migrations_path))
-    else:
-        # Database already exists - enrollment handled by database.py
-        # Don't call fm_migrate() here to avoid duplicate validation errors
-        print(f"[Octosphere] Using existing database at {db_path}")
-
-
 def log_db_status():
     """Log database connection status and counts on startup."""
     try:
-        user_count = len(list(users()))
-        pub_count = len(list(synced_publications()))
+        # Both counts in one statement, so every worker boot pays a single round trip
+        counts = db.q(
+            "SELECT (SELECT COUNT(*) FROM users) AS users, (SELECT COUNT(*) FROM synced_publications) AS pubs"
+        )[0]
+        user_count, pub_count = counts["users"], counts["pubs"]
         print(f"[Octosphere] Database connected: {user_count} users, {pub_count} synced publications")
     except Exception as e:
         print(f"[Octosphere] Database connection error: {e}")
 
 
-run_migrations()
-log_db_status()
+# Startup runs at import because the Procfile starts uvicorn with
+# --lifespan off, so startup events never fire. A new database was already
+# created and migrated by octosphere.database before it connected;
+# SKIP_MIGRATIONS=1 skips that check and this count per worker.
+if os.getenv("SKIP_MIGRATIONS") != "1":
+    log_db_status()
+
+
+# Public identity resolver shared by every client (no per-user state)
+_id_resolver = IdResolver()
 
 
+@lru_cache(maxsize=1)
 def _orcid_client() -> OrcidClient:
     if settings is None:
         raise RuntimeError("Settings not configured")
@@ -630,38 +900,108 @@ def _orcid_client() -> OrcidClient:
     )
 
 
+@lru_cache(maxsize=1)
+def _anonymous_octopus_client() -> OctopusClient:
+    if settings is None:
+        raise RuntimeError("Settings not configured")
+    return OctopusClient(api_url=settings.octopus_api_url, web_url=settings.octopus_web_url)
+
+
 def _octopus_client(profile: OrcidProfile | None = None) -> OctopusClient:
+    if profile is None:
+        return _anonymous_octopus_client()
     if settings is None:
         raise RuntimeError("Settings not configured")
     return OctopusClient(
         api_url=settings.octopus_api_url,
         web_url=settings.octopus_web_url,
-        access_token=profile.access_token if profile else None,
+        access_token=profile.access_token,
     )
 
 
 def _atproto_client() -> AtprotoClient:
+    """New client per call: AtprotoClient holds the logged-in session."""
     if settings is None:
         raise RuntimeError("Settings not configured")
-    return AtprotoClient(settings.atproto_pds_url)
+    return AtprotoClient(settings.atproto_pds_url, resolver=_id_resolver)
+
+
+@lru_cache(maxsize=1)
+def _public_atproto_client() -> AtprotoClient:
+    """Shared client for unauthenticated reads (never call login on it)."""
+    return _atproto_client()
+
+
+# Bluesky sessions by (handle, keyed password digest) so onboarding and the sync
+# it starts share one createSession. 90 minutes stays inside the 2h access JWT.
+_bsky_sessions = TTLCache(ttl=90 * 60, maxsize=1024)
+_BSKY_SESSION_SALT = secrets.token_bytes(16)
+
+
+def _bsky_login(handle: str, app_password: str) -> tuple[AtprotoClient, AtprotoAuth]:
+    """Log in to Bluesky, resuming a recent session for the same credentials."""
+    digest = hmac.new(_BSKY_SESSION_SALT, app_password.encode(), hashlib.sha256).digest()
+    key = (handle.lower(), digest)
+    cached = _bsky_sessions.get(key)
+    if cached is not None:
+        session_string, pds_endpoint = cached
+        atproto = _atproto_client()
+        try:
+            return atproto, atproto.restore_session(session_string, pds_endpoint)
+        except Exception as e:
+            logger.info(f"Cached Bluesky session unusable, logging in again: {e}")
+            _bsky_sessions.pop(key)
+    atproto = _atproto_client()
+    auth = atproto.create_session(handle, app_password)
+    _bsky_sessions.set(key, (atproto.export_session(), auth.pds_endpoint))
+    return atproto, auth
+
+
+def _session_bsky_password(sess) -> str | None:
+    """Decrypt the Bluesky app password stored in the session during onboarding."""
+    token = sess.get("bsky_app_password_enc")
+    if not token:
+        return None
+    try:
+        return decrypt_password(token)
+    except Exception:
+        return None  # Key rotated or cookie tampered with - user reconnects
+
+
+def _clear_bluesky_session(sess) -> None:
+    """Forget the onboarding Bluesky connection (including pre-encryption cookies)."""
+    for key in ("bsky_handle", "bsky_app_password", "bsky_app_password_enc", "bsky_authenticated"):
+        sess.pop(key, None)
+
+
+# One shared (frozen) OrcidProfile per active login, keyed on (orcid, expires_at)
+# so bearer tokens never appear in keys. Entries hold the token, so they expire
+# soon after a user goes idle and are dropped outright at logout.
+_profiles = TTLCache(ttl=15 * 60, maxsize=1024)
 
 
 def _profile_from_session(sess) -> OrcidProfile | None:
     data = sess.get("orcid")
     if not data:
         return None
-    return OrcidProfile(
-        orcid=data.get("orcid", ""),
-        access_token=data.get("access_token", ""),
-        name=data.get("name"),
-    )
+    key = (data.get("orcid", ""), data.get("expires_at"))
+    access_token, name = data.get("access_token", ""), data.get("name")
+    profile = _profiles.get(key)
+    if profile is None or profile.access_token != access_token or profile.name != name:
+        profile = OrcidProfile(orcid=key[0], access_token=access_token, name=name, expires_at=key[1])
+        _profiles.set(key, profile)
+    return profile
 
 
 def _require_login(sess) -> OrcidProfile | None:
     profile = _profile_from_session(sess)
-    if profile and profile.access_token:
-        return profile
-    return None
+    if not profile or not profile.access_token:
+        return None
+    if profile.is_expired():
+        # Send the user back through ORCID instead of failing upstream with a 401
+        sess.pop("orcid", None)
+        return None
+    return profile
 
 
 def _get_user(orcid: str) -> dict | None:
@@ -672,6 +1012,36 @@ def _get_user(orcid: str) -> dict | None:
         return None
 
 
+def _save_user(
+    orcid: str,
+    bsky_handle: str,
+    bsky_password: str,
+    octopus_user_id: str,
+    active: int,
+    encrypted_password: str | None = None,
+) -> None:
+    """Upsert a user's sync settings, skipping the write when nothing changed.
+
+    ``encrypted_password`` is an existing Fernet token for ``bsky_password``
+    (e.g. from the onboarding session); when given it is stored as-is instead
+    of encrypting the password again.
+    """
+    existing = _get_user(orcid)
+    if (
+        existing
+        and existing.get("bsky_handle") == bsky_handle
+        and existing.get("octopus_user_id") == octopus_user_id
+        and existing.get("active") == active
+    ):
+        # Fernet tokens differ on every encryption, so compare the plaintext
+        try:
+            if decrypt_password(existing.get("encrypted_app_password") or "") == bsky_password:
+                return
+        except Exception:
+            pass
+    upsert_user(orcid, bsky_handle, encrypted_password or encrypt_password(bsky_password), octopus_user_id, active)
+
+
 def _strip_html_tags(text: str) -> str:
     """Remove HTML tags from text, returning clean plain text."""
     if not text:
@@ -683,7 +1053,7 @@ def _strip_html_tags(text: str) -> str:
     return clean.strip()
 
 
-def _status_panel(message: str, status: str = "info"):
+def _build_status_panel(message: str, status: str = "info"):
     """Return a styled status panel with proper light/dark mode support."""
     status_cls = {
         "info": "octo-status-info",
@@ -697,24 +1067,130 @@ def _status_panel(message: str, status: str = "info"):
     )
 
 
-@rt("/")
-def index(sess):
-    """Homepage - explains what Octosphere is."""
-    profile = _profile_from_session(sess)
-    
-    if settings_error:
-        return _page(
-            "Configuration Error",
-            Article(
-                Header(H3("Missing configuration")),
-                Pre(settings_error),
-                P("Set the required environment variables and restart."),
-            ),
-            profile=profile,
-        )
-    
-    return _page(
-        "Home",
+@lru_cache(maxsize=32)
+def _status_panel(message: str, status: str = "info"):
+    """Return the shared (never mutated) status panel for a fixed message.
+
+    Messages that embed request data go through _build_status_panel instead,
+    so they do not crowd the cache.
+    """
+    return _build_status_panel(message, status)
+
+
+# htmx SSE extension, used by the live feed and the syncing panel
+_SSE_SCRIPT = Script(src="https://unpkg.com/htmx-ext-sse@2.2.3/sse.js")
+
+# Syncing panel bodies, built once at import; only the stream URL varies per user
+_SYNCING_BODY = (
+    P(
+        Span(aria_busy="true", style="margin-right: 0.5rem;"),
+        "Syncing your publications to the atmosphere...",
+        style="text-align: center; padding: 1rem 0;",
+    ),
+    P(
+        Small("This may take a moment depending on how many publications you have."),
+        style="text-align: center; color: var(--pico-muted-color);",
+    ),
+)
+_STARTING_BODY = (
+    P(
+        Span(aria_busy="true", style="margin-right: 0.5rem;"),
+        "Starting sync...",
+        style="text-align: center; padding: 1rem 0;",
+    ),
+)
+
+
+def _progress_body(done: int, total: int, recent: list | None = None) -> tuple:
+    """Syncing panel body showing progress and the publications synced so far."""
+    return (
+        P(
+            Span(aria_busy="true", style="margin-right: 0.5rem;"),
+            f"Synced {done} of {total} publications...",
+            style="text-align: center; padding: 1rem 0;",
+        ),
+        Progress(value=str(done), max=str(total)),
+        results_table(recent or []),
+    )
+
+
+def _syncing_article(orcid: str, body: tuple = _SYNCING_BODY):
+    """Return the sync panel that follows /sync_status/{orcid}/stream.
+
+    Progress frames replace the inner Div. The stream's "done" event closes it
+    and fetches /sync_status/{orcid} once for the final panel.
+    """
+    return Article(
+        Div(*body, sse_swap="progress", hx_swap="innerHTML"),
+        id="sync-panel",
+        hx_ext="sse",
+        sse_connect=f"/sync_status/{orcid}/stream",
+        sse_close="done",
+        hx_get=f"/sync_status/{orcid}",
+        hx_trigger="sse:done",
+        hx_swap="outerHTML",
+    )
+
+
+def _progress_frame(status: dict | None) -> str:
+    """SSE message carrying the syncing panel body for status."""
+    if not status:
+        body = _STARTING_BODY
+    elif status.get("total"):
+        body = _progress_body(status["done"], status["total"], status.get("recent"))
+    else:
+        body = _SYNCING_BODY
+    return sse_message(Div(*body), event="progress")
+
+
+_SYNC_DONE_EVENT = "event: done\ndata: done\n\n"
+_SYNC_STREAM_KEEPALIVE = 15  # seconds between comment frames on a quiet stream
+# Quiet intervals a stream waits for a missing status (restart, already
+# collected by another tab, URL opened directly) before sending "done"
+_SYNC_STREAM_MISSING_GRACE = 2
+
+
+async def _sync_progress_events(orcid: str):
+    """Yield a progress frame each time orcid's sync status changes, then "done"."""
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    watcher = (loop, changed)
+    with _sync_lock:
+        _sync_watchers.setdefault(orcid, set()).add(watcher)
+    try:
+        last = None
+        missing = 0
+        while True:
+            changed.clear()
+            status = _sync_status.get(orcid)
+            if status and status["status"] != "syncing":
+                yield _SYNC_DONE_EVENT
+                return
+            frame = _progress_frame(status)
+            if frame != last:
+                yield frame
+                last = frame
+            try:
+                await asyncio.wait_for(changed.wait(), _SYNC_STREAM_KEEPALIVE)
+            except asyncio.TimeoutError:
+                missing = missing + 1 if status is None else 0
+                if missing >= _SYNC_STREAM_MISSING_GRACE:
+                    # Nothing to watch: /sync_status renders the final state and the stream closes
+                    yield _SYNC_DONE_EVENT
+                    return
+                yield ": keepalive\n\n"
+    finally:
+        with _sync_lock:
+            watchers = _sync_watchers.get(orcid)
+            if watchers is not None:
+                watchers.discard(watcher)
+                if not watchers:
+                    del _sync_watchers[orcid]
+
+
+def _build_home(signed_in: bool) -> tuple:
+    """Build the homepage body for a signed-in or anonymous visitor."""
+    return (
         # Experimental banner
         Div(
             Strong("Experimental"), " — ",
@@ -776,7 +1252,7 @@ def index(sess):
         ),
         # CTA
         Section(
-            _orcid_button(text="Get started with ORCID", href="/login") if not profile else A(
+            _orcid_button(text="Get started with ORCID", href="/login") if not signed_in else A(
                 "Go to Dashboard",
                 href="/dashboard",
                 role="button",
@@ -784,10 +1260,36 @@ def index(sess):
             ),
             style="text-align: center; padding: 2rem 0;",
         ),
-        profile=profile,
     )
 
 
+# Like the nav, the homepage body only varies with login state
+_HOME_ANON = NotStr("".join(to_xml(el) for el in _build_home(signed_in=False)))
+_HOME_AUTH = NotStr("".join(to_xml(el) for el in _build_home(signed_in=True)))
+
+# Settings are read once at import, so the error body never changes either
+_SETTINGS_ERROR_BODY = NotStr(to_xml(Article(
+    Header(H3("Missing configuration")),
+    Pre(settings_error),
+    P("Set the required environment variables and restart."),
+))) if settings_error else None
+
+
+@rt("/")
+def index(auth, req):
+    """Homepage - explains what Octosphere is."""
+    profile = auth  # resolved once per request by auth_before
+    # The page only varies with login state, so repeat visits revalidate to a 304
+    etag = _page_etag(req, "home", bool(profile), settings_error)
+    if not_modified := _page_not_modified(req, etag):
+        return not_modified
+    
+    if settings_error:
+        return *_page("Configuration Error", _SETTINGS_ERROR_BODY, profile=profile), *_page_cache_headers(etag)
+    
+    return *_page("Home", _HOME_AUTH if profile else _HOME_ANON, profile=profile), *_page_cache_headers(etag)
+
+
 # Jetstream URL for subscribing to social.octosphere.publication records
 JETSTREAM_URL = f"wss://jetstream2.us-east.bsky.network/subscribe?wantedCollections={OCTOSPHERE_PUBLICATION_NSID}"
 
@@ -795,6 +1297,26 @@ JETSTREAM_URL = f"wss://jetstream2.us-east.bsky.network/subscribe?wantedCollecti
 shutdown_event = signal_shutdown()
 
 
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most limit characters, ending in a single-character ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit - 1]}…"
+
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _format_timestamp(timestamp: str) -> str:
+    """Format an ISO-8601 timestamp as e.g. "Jan 05, 2024 at 14:30" (input returned if unparseable).
+
+    Builds the string directly instead of using the locale-aware strftime("%b ...").
+    """
+    try:
+        dt = datetime.fromisoformat(timestamp)  # accepts a trailing "Z" on Python 3.11+
+    except (TypeError, ValueError):
+        return timestamp
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year} at {dt.hour:02d}:{dt.minute:02d}"
+
+
 def PublicationCard(record: dict, did: str, handle: str | None = None, timestamp: str | None = None, uri: str | None = None):
     """Render a publication as a social media-style card.
     
@@ -818,19 +1340,13 @@ def PublicationCard(record: dict, did: str, handle: str | None = None, timestamp
     pdsls_url = f"https://pdsls.dev/{uri}" if uri else None
     
     # Format timestamp for display
-    time_display = ""
-    if timestamp:
-        try:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            time_display = dt.strftime("%b %d, %Y at %H:%M")
-        except Exception:
-            time_display = timestamp
+    time_display = _format_timestamp(timestamp) if timestamp else ""
     
     # Display handle or truncated DID
     author_display = f"@{handle}" if handle else f"{did[:20]}..." if did else "Unknown"
     
     # Truncate content for display (show first 300 chars)
-    display_text = content_text[:300] + "..." if len(content_text) > 300 else content_text
+    display_text = _truncate(content_text, 300)
     
     return Article(
         # Header with author and timestamp
@@ -881,17 +1397,46 @@ def PublicationCard(record: dict, did: str, handle: str | None = None, timestamp
         style="margin-bottom: 1rem;",
     )
 
+# DID -> handle for feed cards; misses are cached too so a bad DID isn't retried per event
+_handle_cache = TTLCache(ttl=3600, maxsize=4096)
+_NO_HANDLE = ""
+
+
+def _resolve_did_handle(did: str) -> str | None:
+    """Resolve a DID to its handle via the DID document (blocking, cached)."""
+    handle = _handle_cache.get(did)
+    if handle is None:
+        try:
+            data = _id_resolver.did.resolve_atproto_data(did)
+            handle = data.handle or _NO_HANDLE
+        except Exception:
+            handle = _NO_HANDLE
+        _handle_cache.set(did, handle)
+    return handle or None
+
+
+async def _close_on_shutdown(ws) -> None:
+    """Close the Jetstream socket once shutdown is signalled, ending its reader."""
+    await shutdown_event.wait()
+    await ws.close()
+
 
 async def jetstream_consumer():
     """Async generator that consumes Jetstream and yields SSE messages."""
     while not shutdown_event.is_set():
         try:
-            async with websockets.connect(JETSTREAM_URL) as ws:
-                while not shutdown_event.is_set():
-                    try:
-                        # Wait for message with timeout to check shutdown
-                        msg = await asyncio.wait_for(ws.recv(), timeout=30.0)
-                        data = json.loads(msg)
+            # Keepalive comes from websocket pings rather than a per-message recv timeout
+            async with websockets.connect(
+                JETSTREAM_URL,
+                compression="deflate",
+                max_size=1 << 20,
+                ping_interval=20,
+                ping_timeout=20,
+            ) as ws:
+                closer = asyncio.create_task(_close_on_shutdown(ws))
+                try:
+                    async for msg in ws:
+                        data = _json_loads(msg)
                         
                         # Jetstream message structure:
                         # {"did": "did:plc:...", "time_us": ..., "kind": "commit", 
@@ -904,15 +1449,16 @@ async def jetstream_consumer():
                                 did = data.get("did", "")
                                 timestamp = record.get("createdAt") or datetime.utcnow().isoformat()
                                 
+                                # Resolve the handle off the event loop (cached after first sight)
+                                handle = await asyncio.to_thread(_resolve_did_handle, did)
+                                
                                 # Render the publication card
-                                card = PublicationCard(record, did, timestamp=timestamp)
+                                card = PublicationCard(record, did, handle=handle, timestamp=timestamp)
                                 yield sse_message(card)
-                                
-                    except asyncio.TimeoutError:
-                        # Send keepalive comment to prevent connection timeout
-                        continue
-                    except websockets.ConnectionClosed:
-                        break
+                except websockets.ConnectionClosed:
+                    pass  # reconnect straight away
+                finally:
+                    closer.cancel()
                         
         except Exception as e:
             # Log error and retry after delay
@@ -920,6 +1466,56 @@ async def jetstream_consumer():
             await asyncio.sleep(5)
 
 
+# Live feed fan-out: one Jetstream connection shared by every /feed/stream client
+_feed_subscribers: set[asyncio.Queue] = set()
+_broadcaster_task: asyncio.Task | None = None
+_FEED_QUEUE_SIZE = 256
+_feed_dropped = 0  # events discarded because a client fell behind
+
+
+def _enqueue_latest(queue: asyncio.Queue, payload) -> None:
+    """Put payload on a subscriber queue, discarding its oldest event when full.
+
+    Never blocks, so a slow SSE client can't stall the Jetstream reader.
+    """
+    global _feed_dropped
+    if queue.full():
+        queue.get_nowait()
+        _feed_dropped += 1
+    queue.put_nowait(payload)
+
+
+async def _jetstream_broadcaster() -> None:
+    """Parse and render each Jetstream event once, then fan it out to all subscribers."""
+    async with aclosing(jetstream_consumer()) as events:
+        async for event in events:
+            # Encode once here rather than once per client in StreamingResponse
+            payload = event.encode()
+            for queue in tuple(_feed_subscribers):
+                _enqueue_latest(queue, payload)
+    # Consumer stopped (shutdown): wake subscribers so their streams end
+    for queue in tuple(_feed_subscribers):
+        _enqueue_latest(queue, None)
+
+
+async def feed_subscription():
+    """Async generator yielding live feed SSE messages (pre-encoded bytes) for one client."""
+    global _broadcaster_task
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_FEED_QUEUE_SIZE)
+    _feed_subscribers.add(queue)
+    if _broadcaster_task is None or _broadcaster_task.done():
+        _broadcaster_task = asyncio.create_task(_jetstream_broadcaster())
+    try:
+        while (event := await queue.get()) is not None:
+            yield event
+    finally:
+        _feed_subscribers.discard(queue)
+        if not _feed_subscribers and _broadcaster_task is not None:
+            # Last client left - drop the upstream connection until someone returns
+            _broadcaster_task.cancel()
+            _broadcaster_task = None
+
+
 def _fetch_historic_publications(limit: int = 50) -> list[dict]:
     """Fetch historic publications from all registered users.
     
@@ -930,21 +1526,15 @@ def _fetch_historic_publications(limit: int = 50) -> list[dict]:
     Returns:
         List of dicts with: did, handle, uri, record, createdAt
     """
-    atproto = _atproto_client()
+    atproto = _public_atproto_client()
     all_publications = []
     
     # Get all users with their handles and resolve to DIDs
     # Include both active=0 (one-time sync) and active=1 (auto-sync) users
-    for user in users():
-        
-        handle = user.get("bsky_handle")
-        if not handle:
-            continue
-        
+    for handle in bluesky_handles():
         # Resolve handle to DID
         try:
-            resolver = atproto._resolver
-            did = resolver.handle.resolve(handle)
+            did = _id_resolver.handle.resolve(handle)
             if not did:
                 continue
         except Exception:
@@ -1008,21 +1598,18 @@ def feed_history():
 @rt("/feed/stream")
 async def feed_stream():
     """SSE endpoint for live feed."""
-    return EventStream(jetstream_consumer())
+    return EventStream(feed_subscription())
 
 
 @rt("/feed")
-def feed(sess):
+def feed(auth):
     """Live feed page - real-time stream of research publications."""
-    profile = _profile_from_session(sess)
+    profile = auth
 
     return (
         Title("Feed - Octosphere"),
-        Meta(name="color-scheme", content="light dark"),
-        Favicon('/static/octosphere.ico', '/static/octosphere.ico'),
-        Link(rel="stylesheet", href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css"),
-        _custom_styles(),
-        Script(src="https://unpkg.com/htmx-ext-sse@2.2.3/sse.js"),
+        *_PAGE_HEAD,
+        _SSE_SCRIPT,
         _nav(profile),
         Main(
             # Experimental banner
@@ -1086,24 +1673,14 @@ def feed(sess):
             ),
             cls="container",
         ),
-        Footer(
-            P(
-                A(I(cls="fa-brands fa-github"), href="https://github.com/AndreasThinks/octosphere", style="margin-right: 1rem;"),
-                "Created by ",
-                A("AndreasThinks", href="https://andreasthinks.me/"),
-                " with help from some ✨vibes✨",
-                style="font-size: 0.875rem; color: var(--pico-muted-color);",
-            ),
-            cls="container",
-            style="margin-top: 2rem; padding-top: 1rem; border-top: 1px solid var(--pico-muted-border-color); text-align: center;",
-        ),
+        _SITE_FOOTER,
     )
 
 
 @rt("/dashboard")
-def dashboard(sess):
+def dashboard(auth):
     """Dashboard - sync panel for logged in users."""
-    profile = _profile_from_session(sess)
+    profile = auth
     
     if not profile:
         return RedirectResponse(url="/login", status_code=303)
@@ -1118,7 +1695,10 @@ def dashboard(sess):
             ),
             style="text-align: center; padding: 1rem 0;",
         ),
+        _SSE_SCRIPT,  # the syncing panel streams progress over SSE
         Div(id="sync-panel", hx_get="/sync_panel", hx_trigger="load"),
+        # Reload the dashboard panel once when a manual sync completes
+        Div(hx_get="/sync_panel", hx_trigger="sync-done from:body", hx_target="#sync-panel", hx_swap="outerHTML"),
         profile=profile,
     )
 
@@ -1133,285 +1713,107 @@ def login(sess, request):
 
 @rt
 def callback(code: str | None = None, state: str | None = None, sess=None):
-    if not code or not state or state != sess.get("orcid_state"):
+    expected = sess.get("orcid_state")
+    if not code or not state or not expected or not secrets.compare_digest(expected, state):
         return _status_panel("Invalid ORCID callback state.", "error")
+    sess.pop("orcid_state", None)  # one-shot: a replayed callback URL is rejected
     profile = _orcid_client().exchange_code(code)
     sess["orcid"] = {
         "orcid": profile.orcid,
         "access_token": profile.access_token,
         "name": profile.name,
+        "expires_at": profile.expires_at,
     }
     return RedirectResponse(url="/dashboard", status_code=303)
 
 
 @rt
 def logout(sess):
-    sess.pop("orcid", None)
+    data = sess.pop("orcid", None)
+    if data:
+        _profiles.pop((data.get("orcid", ""), data.get("expires_at")))
     sess.pop("orcid_state", None)
     sess.pop("octopus_user_id", None)
-    sess.pop("bsky_handle", None)
-    sess.pop("bsky_app_password", None)
-    sess.pop("bsky_authenticated", None)
+    _clear_bluesky_session(sess)
     return RedirectResponse(url="/", status_code=303)
 
 
+# Bluesky handle -> DID for the dashboard's PDSLS link
+_handle_dids = TTLCache(ttl=3600)
+
+
+def _warm_handle_did(handle: str) -> None:
+    """Resolve a handle's DID into _handle_dids (run after the response is sent)."""
+    try:
+        did = _id_resolver.handle.resolve(handle)
+    except Exception:
+        return
+    if did:
+        _handle_dids.set(handle, did)
+
+
+@rt("/sync_panel/stats")
+def sync_panel_stats(auth):
+    """Deferred dashboard stats: Octopus publication count vs. records synced."""
+    if not auth:
+        return _status_panel("Login with ORCID to continue.", "error")
+    existing = get_user_summary(auth.orcid)
+    pub_count = 0
+    synced_count = 0
+    if existing and existing.get("octopus_user_id"):
+        octopus_user_id = existing["octopus_user_id"]
+        pub_count = _pub_counts.get(octopus_user_id)
+        if pub_count is None:
+            pub_count = 0
+            if not _pub_count_failures.get(octopus_user_id):
+                try:
+                    pub_count = len(_octopus_client().get_user_publications(octopus_user_id))
+                    _pub_counts.set(octopus_user_id, pub_count)
+                except Exception:
+                    _pub_count_failures.set(octopus_user_id, True)
+        # Count already synced
+        synced_count = count_synced_publications(auth.orcid)
+    return sync_stats(pub_count, synced_count)
+
+
 @rt
-def sync_panel(sess):
-    profile = _profile_from_session(sess)
+def sync_panel(sess, req, auth):
+    profile = auth
     if not profile:
         return _status_panel("Login with ORCID to continue.", "error")
     
-    # Check if user already has auto-sync enabled (efficient lookup using try/except)
-    existing = _get_user(profile.orcid)
+    # Check if user already has auto-sync enabled (primary-key lookup of the
+    # dashboard columns only; the encrypted password is never needed here)
+    existing = get_user_summary(profile.orcid)
     
     if existing and existing.get("active"):
-        pub_count = 0
-        synced_count = 0
-        if existing.get("octopus_user_id"):
-            octopus = _octopus_client()
-            try:
-                publications = octopus.get_user_publications(existing["octopus_user_id"])
-                pub_count = len(publications)
-            except Exception:
-                pass
-            # Count already synced
-            synced_count = len([s for s in synced_publications() if s.get("orcid") == profile.orcid])
-        
         bsky_handle = existing.get("bsky_handle", "")
         last_sync = existing.get("last_sync")
 
-        # Resolve DID for PDSLS link
-        bsky_did = None
-        try:
-            atproto = _atproto_client()
-            bsky_did = atproto._resolver.handle.resolve(bsky_handle)
-        except Exception:
-            pass
+        # DID for the PDSLS link (cached; a handle rarely changes its DID). On a
+        # miss the panel links to the Bluesky profile and the DID is resolved
+        # after the response, so the panel never waits on identity lookup.
+        bsky_did = _handle_dids.get(bsky_handle) if bsky_handle else None
+        warm_did = BackgroundTask(_warm_handle_did, bsky_handle) if bsky_handle and bsky_did is None else None
         
-        # Format last sync time
-        if last_sync:
-            try:
-                dt = datetime.fromisoformat(last_sync.replace("Z", "+00:00"))
-                last_sync_display = dt.strftime("%b %d, %Y at %H:%M")
-            except Exception:
-                last_sync_display = last_sync
-        else:
-            last_sync_display = "Never"
+        # The panel changes only with these inputs, so a reload that finds
+        # them unchanged is a 304 (unless the DID still needs resolving)
+        etag = _page_etag(req, "dashboard", profile.orcid, bsky_handle, bsky_did, last_sync, generate_csrf_token(sess))
+        if not warm_did and (not_modified := _page_not_modified(req, etag)):
+            return not_modified
         
-        # Calculate sync progress percentage
-        sync_pct = int((synced_count / pub_count * 100)) if pub_count > 0 else 100
-        sync_complete = synced_count >= pub_count and pub_count > 0
+        # Format last sync time
+        last_sync_display = _format_timestamp(last_sync) if last_sync else "Never"
         
-        return Div(
-            # Status Card
-            Article(
-                # Header with status badge
-                Div(
-                    Span(
-                        I(cls="fa-solid fa-circle", style="font-size: 0.5rem; margin-right: 0.5rem;"),
-                        "Auto-sync Active",
-                        cls="octo-badge-success",
-                    ),
-                    style="margin-bottom: 1rem;",
-                ),
-                # Connections section
-                H4(
-                    I(cls="fa-solid fa-link", style="margin-right: 0.5rem; color: var(--pico-muted-color);"),
-                    "Connected Accounts",
-                ),
-                Div(
-                    Div(
-                        Strong("ORCID: "),
-                        A(
-                            profile.orcid,
-                            href=f"https://orcid.org/{profile.orcid}",
-                            target="_blank",
-                        ),
-                        style="margin-bottom: 0.5rem;",
-                    ),
-                    Div(
-                        Strong("Bluesky: "),
-                        A(
-                            f"@{bsky_handle}",
-                            href=f"https://bsky.app/profile/{bsky_handle}",
-                            target="_blank",
-                        ),
-                    ),
-                    style="margin-bottom: 1.5rem;",
-                ),
-            ),
-            # Sync Status Card
-            Article(
-                H4(
-                    I(cls="fa-solid fa-sync", style="margin-right: 0.5rem; color: var(--pico-muted-color);"),
-                    "Sync Status",
-                ),
-                # Progress bar
-                Div(
-                    Div(
-                        style=f"width: {sync_pct}%; background: var(--pico-primary); height: 100%; border-radius: 0.25rem;",
-                    ),
-                    style="background: var(--pico-muted-border-color); height: 0.5rem; border-radius: 0.25rem; margin-bottom: 0.5rem;",
-                ),
-                Div(
-                    Strong(f"{synced_count} of {pub_count} publications synced"),
-                    " ✓" if sync_complete else "",
-                    style="margin-bottom: 0.5rem;",
-                    cls="octo-success-text" if sync_complete else "",
-                ),
-                Small(
-                    I(cls="fa-regular fa-clock", style="margin-right: 0.25rem;"),
-                    f"Last sync: {last_sync_display}",
-                    style="color: var(--pico-muted-color);",
-                ),
-            ),
-            # Actions Card
-            Article(
-                H4(
-                    I(cls="fa-solid fa-bolt", style="margin-right: 0.5rem; color: var(--pico-muted-color);"),
-                    "Actions",
-                ),
-                Div(
-                    Form(
-                        csrf_input(sess),  # CSRF protection
-                        Button(
-                            I(cls="fa-solid fa-rotate", style="margin-right: 0.5rem;"),
-                            "Sync Now",
-                            type="submit",
-                            cls="contrast",
-                            style=" margin-bottom: 0px;",
-                        ),
-                        Div(
-                            Span("Syncing...", aria_busy="true"),
-                            id="sync-loading",
-                            cls="htmx-indicator",
-                            style="display:none; margin-left: 0.5rem;",
-                        ),
-                        hx_post="/manual_sync",
-                        hx_target="#sync-panel",
-                        hx_swap="outerHTML",
-                        hx_indicator="#sync-loading",
-                        style="display: flex; align-items: center;",
-                    ),
-                    A(
-                        I(cls="fa-solid fa-arrow-up-right-from-square", style="margin-right: 0.5rem;"),
-                        "View on PDSLS",
-                        href=f"https://pdsls.dev/at://{bsky_did}/social.octosphere.publication" if bsky_did else f"https://bsky.app/profile/{bsky_handle}",
-                        target="_blank",
-                        role="button",
-                        cls="outline",
-                    ),
-                    style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1rem;",
-                ),
-                Hr(),
-                Form(
-                    csrf_input(sess),  # CSRF protection
-                    Button(
-                        I(cls="fa-solid fa-power-off", style="margin-right: 0.5rem;"),
-                        "Disable auto-sync",
-                        type="submit",
-                        cls="secondary outline",
-                    ),
-                    hx_post="/disable_sync",
-                    hx_target="#sync-panel",
-                    hx_swap="outerHTML",
-                ),
-            ),
-            # Hidden Advanced Options section
-            Details(
-                Summary(
-                    I(cls="fa-solid fa-gear", style="margin-right: 0.5rem;"),
-                    "Advanced options",
-                    style="cursor: pointer; color: var(--pico-muted-color); font-size: 0.875rem;",
-                ),
-                Article(
-                    H4(
-                        I(cls="fa-solid fa-triangle-exclamation octo-danger-text", style="margin-right: 0.5rem;"),
-                        "Danger Zone",
-                        cls="octo-danger-text",
-                    ),
-                    P(
-                        "Delete all your Octosphere publication records from the AT Protocol network "
-                        "and disable auto-sync. This only removes ",
-                        Code("social.octosphere.publication"),
-                        " records — your Bluesky posts, likes, and follows are not affected.",
-                        style="font-size: 0.875rem; color: var(--pico-muted-color);",
-                    ),
-                    Form(
-                        csrf_input(sess),  # CSRF protection
-                        Fieldset(
-                            Label(
-                                "Confirm with your Bluesky app password",
-                                Input(
-                                    id="confirm_password",
-                                    name="confirm_password",
-                                    type="password",
-                                    placeholder="App password",
-                                    required=True,
-                                ),
-                            ),
-                            Small(
-                                "For security, re-enter your app password to confirm this destructive action.",
-                                style="color: var(--pico-muted-color);",
-                            ),
-                        ),
-                        Button(
-                            I(cls="fa-solid fa-trash", style="margin-right: 0.5rem;"),
-                            "Delete All Records & Disconnect",
-                            type="submit",
-                            cls="octo-danger-btn",
-                        ),
-                        Div(
-                            Span("Deleting records...", aria_busy="true"),
-                            id="delete-loading",
-                            cls="htmx-indicator",
-                            style="display:none;",
-                        ),
-                        hx_post="/delete_all_records",
-                        hx_target="#sync-panel",
-                        hx_swap="outerHTML",
-                        hx_indicator="#delete-loading",
-                        hx_confirm="Are you sure? This will permanently delete all your Octosphere publication records from the AT Protocol network.",
-                    ),
-                    Hr(cls="octo-danger-text", style="margin: 1.5rem 0; border-color: var(--octo-danger-border);"),
-                    # Delete Account section
-                    H4(
-                        I(cls="fa-solid fa-user-slash octo-danger-text", style="margin-right: 0.5rem;"),
-                        "Delete Account",
-                        cls="octo-danger-text",
-                    ),
-                    P(
-                        "Remove your Octosphere account entirely. ",
-                        Strong("Note: "),
-                        "This will NOT delete your publication records from the AT Protocol network. "
-                        "Use 'Delete All Records' above first if you want to remove those.",
-                        style="font-size: 0.875rem; color: var(--pico-muted-color);",
-                    ),
-                    Form(
-                        csrf_input(sess),  # CSRF protection
-                        Button(
-                            I(cls="fa-solid fa-user-minus", style="margin-right: 0.5rem;"),
-                            "Delete My Account",
-                            type="submit",
-                            cls="octo-danger-btn",
-                        ),
-                        Div(
-                            Span("Deleting account...", aria_busy="true"),
-                            id="delete-account-loading",
-                            cls="htmx-indicator",
-                            style="display:none;",
-                        ),
-                        hx_post="/delete_account",
-                        hx_indicator="#delete-account-loading",
-                        hx_confirm="Are you sure you want to delete your Octosphere account? This will NOT delete your publication records from the AT Protocol network - use 'Delete All Records' first if you want to remove those.",
-                    ),
-                    cls="octo-danger-zone",
-                    style="margin-top: 1rem;",
-                ),
-                style="margin-top: 1.5rem;",
-            ),
-            id="sync-panel",
+        # Counts are filled in by /sync_panel/stats once the panel has painted
+        panel = dashboard_panel(
+            csrf_input(sess),
+            orcid=profile.orcid,
+            bsky_handle=bsky_handle,
+            bsky_did=bsky_did,
+            last_sync_display=last_sync_display,
         )
+        return (panel, *_page_cache_headers(etag), warm_did) if warm_did else (panel, *_page_cache_headers(etag))
     
     # Step 1: Check if Bluesky is connected (stored in session)
     bsky_handle = sess.get("bsky_handle")
@@ -1419,95 +1821,26 @@ def sync_panel(sess):
     
     if not bsky_authenticated:
         # Step 1: Sign in with Bluesky/AT Proto first
-        return Article(
-            Header(H3("Step 1: Sign in with Bluesky")),
-            P("First, connect your Bluesky account to sync your publications."),
-            Form(
-                csrf_input(sess),  # CSRF protection
-                Fieldset(
-                    Label(
-                        "Bluesky handle",
-                        Input(id="handle", placeholder="user.bsky.social", required=True),
-                        Small("Your full handle including domain, e.g. alice.bsky.social or yourname.com", style="font-weight: normal;"),
-                    ),
-                    Label(
-                        "App password",
-                        Input(id="app_password", type="password", required=True),
-                        Small(
-                            "You need to generate an app password at ",
-                            A("bsky.app/settings/app-passwords", href="https://bsky.app/settings/app-passwords", target="_blank"),
-                            style="font-weight: normal;",
-                        ),
-                    ),
-                ),
-                Button("Sign in with Bluesky", type="submit", cls="contrast"),
-                Div(
-                    Span("Connecting to Bluesky...", aria_busy="true"),
-                    id="loading",
-                    cls="htmx-indicator",
-                    style="display:none;",
-                ),
-                hx_post="/validate_bluesky",
-                hx_target="#sync-panel",
-                hx_swap="outerHTML",
-                hx_indicator="#loading",
-            ),
-            id="sync-panel",
-        )
+        return step1_panel(csrf_input(sess))
 
     # Step 2: Ask for Octopus author URL (only shown after Bluesky is connected)
-    return Article(
-        Header(H3("Step 2: Connect your Octopus profile")),
-        P(f"Connected to Bluesky as @{bsky_handle}"),
-        P("Now, let's find your Octopus publications."),
-        Form(
-            csrf_input(sess),  # CSRF protection
-            Fieldset(
-                Label(
-                    "Octopus author page URL",
-                    Input(
-                        id="octopus_url",
-                        placeholder="https://www.octopus.ac/authors/your-id",
-                        required=True,
-                    ),
-                ),
-                Small(
-                    "Find this at octopus.ac by clicking your profile. "
-                    "Example: https://www.octopus.ac/authors/cl5smny4a000009ieqml45bhz"
-                ),
-            ),
-            Button("Find my publications", type="submit", cls="contrast"),
-            Div(
-                Span("Looking up publications...", aria_busy="true"),
-                id="loading",
-                cls="htmx-indicator",
-                style="display:none;",
-            ),
-            hx_post="/validate_octopus",
-            hx_target="#sync-panel",
-            hx_swap="outerHTML",
-            hx_indicator="#loading",
-        ),
-        P(A("Disconnect Bluesky", href="/disconnect_bluesky", hx_get="/disconnect_bluesky", hx_target="#sync-panel", cls="secondary")),
-        id="sync-panel",
-    )
+    return step2_panel(csrf_input(sess), bsky_handle)
 
 
 @rt
-def validate_bluesky(handle: str, app_password: str, sess, csrf_token: str | None = None):
+def validate_bluesky(handle: str, app_password: str, sess, auth, csrf_token: str | None = None):
     """Step 1: Validate Bluesky credentials and store in session."""
     # Verify CSRF token
     if not verify_csrf_token(sess, csrf_token):
         return _status_panel("Invalid request. Please try again.", "error")
 
-    profile = _require_login(sess)
+    profile = auth
     if not profile:
         return _status_panel("Login with ORCID first.", "error")
 
     # Validate Bluesky credentials
-    atproto = _atproto_client()
     try:
-        auth = atproto.create_session(handle, app_password)
+        _bsky_login(handle, app_password)
     except Exception as e:
         error_str = str(e)
         logger.warning(f"Bluesky auth failed: {e}")
@@ -1523,100 +1856,30 @@ def validate_bluesky(handle: str, app_password: str, sess, csrf_token: str | Non
     
     # Store Bluesky connection in session
     sess["bsky_handle"] = handle
-    sess["bsky_app_password"] = app_password
+    sess["bsky_app_password_enc"] = encrypt_password(app_password)  # never plaintext in the cookie
     sess["bsky_authenticated"] = True
     
     # Return the sync panel which will now show Step 2 (Octopus connection)
-    return Article(
-        Header(H3("Step 2: Connect your Octopus profile")),
-        P(f"Connected to Bluesky as @{handle}"),
-        P("Now, let's find your Octopus publications."),
-        Form(
-            csrf_input(sess),  # CSRF protection
-            Fieldset(
-                Label(
-                    "Octopus author page URL",
-                    Input(
-                        id="octopus_url",
-                        placeholder="https://www.octopus.ac/authors/your-id",
-                        required=True,
-                    ),
-                ),
-                Small(
-                    "Find this at octopus.ac by clicking your profile. "
-                    "Example: https://www.octopus.ac/authors/cl5smny4a000009ieqml45bhz"
-                ),
-            ),
-            Button("Find my publications", type="submit", cls="contrast"),
-            Div(
-                Span("Looking up publications...", aria_busy="true"),
-                id="loading",
-                cls="htmx-indicator",
-                style="display:none;",
-            ),
-            hx_post="/validate_octopus",
-            hx_target="#sync-panel",
-            hx_swap="outerHTML",
-            hx_indicator="#loading",
-        ),
-        P(A("Disconnect Bluesky", href="/disconnect_bluesky", hx_get="/disconnect_bluesky", hx_target="#sync-panel", cls="secondary")),
-        id="sync-panel",
-    )
+    return step2_panel(csrf_input(sess), handle)
 
 
 @rt
 def disconnect_bluesky(sess):
     """Disconnect Bluesky and return to Step 1."""
-    sess.pop("bsky_handle", None)
-    sess.pop("bsky_app_password", None)
-    sess.pop("bsky_authenticated", None)
+    _clear_bluesky_session(sess)
 
     # Return the Bluesky login form (Step 1)
-    return Article(
-        Header(H3("Step 1: Sign in with Bluesky")),
-        P("First, connect your Bluesky account to sync your publications."),
-        Form(
-            csrf_input(sess),  # CSRF protection
-            Fieldset(
-                Label(
-                    "Bluesky handle",
-                    Input(id="handle", placeholder="user.bsky.social", required=True),
-                    Small("Your full handle including domain, e.g. alice.bsky.social or yourname.com", style="font-weight: normal;"),
-                ),
-                Label(
-                    "App password",
-                    Input(id="app_password", type="password", required=True),
-                    Small(
-                        "You need to generate an app password at ",
-                        A("bsky.app/settings/app-passwords", href="https://bsky.app/settings/app-passwords", target="_blank"),
-                        style="font-weight: normal;",
-                    ),
-                ),
-            ),
-            Button("Sign in with Bluesky", type="submit", cls="contrast"),
-            Div(
-                Span("Connecting to Bluesky...", aria_busy="true"),
-                id="loading",
-                cls="htmx-indicator",
-                style="display:none;",
-            ),
-            hx_post="/validate_bluesky",
-            hx_target="#sync-panel",
-            hx_swap="outerHTML",
-            hx_indicator="#loading",
-        ),
-        id="sync-panel",
-    )
+    return step1_panel(csrf_input(sess))
 
 
 @rt
-def validate_octopus(octopus_url: str, sess, csrf_token: str | None = None):
+def validate_octopus(octopus_url: str, sess, auth, csrf_token: str | None = None):
     """Step 2 result: Validate Octopus URL and show publications with sync button."""
     # Verify CSRF token
     if not verify_csrf_token(sess, csrf_token):
         return _status_panel("Invalid request. Please try again.", "error")
 
-    profile = _require_login(sess)
+    profile = auth
     if not profile:
         return _status_panel("Login with ORCID first.", "error")
 
@@ -1634,20 +1897,29 @@ def validate_octopus(octopus_url: str, sess, csrf_token: str | None = None):
             "error"
         )
 
-    # Verify the Octopus user exists and fetch publications
+    # Verify the Octopus user exists while their publications are fetched
+    # alongside, so the two round trips overlap instead of running back to back.
+    # An author verified recently, or already linked to this ORCID, needs only
+    # the publications request.
     octopus = _octopus_client()
-    try:
-        user_info = octopus.get_user_info(octopus_user_id)
-        if not user_info:
-            return _status_panel("Octopus user not found. Check your author URL.", "error")
-    except Exception as e:
-        logger.warning(f"Octopus profile verification failed: {e}")
-        return _status_panel("Could not verify Octopus profile. Please try again later.", "error")
+    pubs_future = _octopus_executor.submit(octopus.get_user_publications, octopus_user_id)
+    if not _octopus_author_known(profile.orcid, octopus_user_id):
+        try:
+            user_info = octopus.get_user_info(octopus_user_id)
+            if not user_info:
+                pubs_future.cancel()
+                return _status_panel("Octopus user not found. Check your author URL.", "error")
+        except Exception as e:
+            pubs_future.cancel()
+            logger.warning(f"Octopus profile verification failed: {e}")
+            return _status_panel("Could not verify Octopus profile. Please try again later.", "error")
+        _verified_authors.set(octopus_user_id, True)
     
-    # Fetch publications
+    # Collect publications
     try:
-        publications = octopus.get_user_publications(octopus_user_id)
+        publications = pubs_future.result()
         pub_count = len(publications)
+        _remember_publications(octopus_user_id, publications)
     except Exception:
         publications = []
         pub_count = 0
@@ -1655,7 +1927,7 @@ def validate_octopus(octopus_url: str, sess, csrf_token: str | None = None):
     # Store octopus_user_id in session for next step
     sess["octopus_user_id"] = octopus_user_id
     
-    # Build publication preview (show up to 5)
+    # Build publication preview (show up to 5) as a single pre-rendered string
     pub_items = []
     for pub in publications[:5]:
         # API structure: pub.versions[0].title contains the title
@@ -1665,10 +1937,10 @@ def validate_octopus(octopus_url: str, sess, csrf_token: str | None = None):
         else:
             title = pub.get("title") or "Untitled"
         pub_type = pub.get("type") or ""
-        pub_items.append(Li(f"{pub_type}: {title[:60]}{'...' if len(title) > 60 else ''}"))
+        pub_items.append(f"<li>{escape(pub_type)}: {escape(_truncate(title, 60))}</li>")
     
     if pub_count > 5:
-        pub_items.append(Li(f"...and {pub_count - 5} more"))
+        pub_items.append(f"<li>...and {pub_count - 5} more</li>")
     
     # Step 3: Show publications and sync button
     if pub_count == 0:
@@ -1685,12 +1957,7 @@ def validate_octopus(octopus_url: str, sess, csrf_token: str | None = None):
                 csrf_input(sess),  # CSRF protection
                 Button("Enable auto-sync", type="submit", cls="contrast", style="width: 100%;"),
                 Input(type="hidden", name="action", value="auto_sync"),
-                Div(
-                    Span("Setting up auto-sync...", aria_busy="true"),
-                    id="loading-sync",
-                    cls="htmx-indicator",
-                    style="display:none;",
-                ),
+                loading_indicator("Setting up auto-sync...", "loading-sync"),
                 hx_post="/setup_sync",
                 hx_target="#sync-panel",
                 hx_swap="outerHTML",
@@ -1703,7 +1970,7 @@ def validate_octopus(octopus_url: str, sess, csrf_token: str | None = None):
     return Article(
         Header(H3(f"Found {pub_count} publications")),
         P(f"Ready to sync to @{bsky_handle}"),
-        Ul(*pub_items),
+        Ul(NotStr("".join(pub_items))),
         Hr(),
         H4("Step 3: Sync your publications"),
         P("Click below to sync your existing Octopus publications to the atmosphere."),
@@ -1712,15 +1979,7 @@ def validate_octopus(octopus_url: str, sess, csrf_token: str | None = None):
             Button("Sync Now", type="submit", cls="contrast", style="width: 100%;"),
             Input(type="hidden", name="action", value="sync_once"),
             Div(
-                P(
-                    Span(aria_busy="true", style="margin-right: 0.5rem;"),
-                    "Syncing your publications to the atmosphere...",
-                    style="text-align: center; padding: 1rem 0;",
-                ),
-                P(
-                    Small("This may take a moment depending on how many publications you have."),
-                    style="text-align: center; color: var(--pico-muted-color);",
-                ),
+                *_SYNCING_BODY,
                 id="loading-sync",
                 cls="htmx-indicator",
                 style="display:none;",
@@ -1736,13 +1995,13 @@ def validate_octopus(octopus_url: str, sess, csrf_token: str | None = None):
 
 
 @rt
-def setup_sync(action: str, sess, csrf_token: str | None = None):
+def setup_sync(action: str, sess, auth, csrf_token: str | None = None, autosync_token: str | None = None):
     """Handle both one-time sync and auto-sync setup."""
     # Verify CSRF token
     if not verify_csrf_token(sess, csrf_token):
         return _status_panel("Invalid request. Please try again.", "error")
 
-    profile = _require_login(sess)
+    profile = auth
     if not profile:
         return _status_panel("Login with ORCID first.", "error")
 
@@ -1752,43 +2011,54 @@ def setup_sync(action: str, sess, csrf_token: str | None = None):
 
     # Get Bluesky credentials from session only (never from form for security)
     bsky_handle = sess.get("bsky_handle")
-    bsky_password = sess.get("bsky_app_password")
 
-    if not bsky_handle or not bsky_password:
+    # A token from the sync_once results means these credentials were just used
+    # and saved, so enabling auto-sync only has to flip the active flag (and
+    # never needs the password decrypted)
+    pending = _autosync_tokens.pop(autosync_token) if autosync_token else None
+    already_saved = action == "auto_sync" and pending == (profile.orcid, bsky_handle)
+    bsky_password = None if already_saved else _session_bsky_password(sess)
+
+    if not bsky_handle or not (already_saved or bsky_password):
         return _status_panel("Bluesky credentials not found. Please start over.", "error")
 
+    # Reuse the publication list validate_octopus just fetched, if still cached.
+    # A one-time sync needs the list, so on a miss it is fetched while the
+    # Bluesky login below is in flight rather than after it.
+    publications = _pub_cache.get(octopus_user_id)
+    pubs_future = None
+    if action != "auto_sync" and publications is None:
+        pubs_future = _octopus_executor.submit(_octopus_client().get_user_publications, octopus_user_id)
+
     # Validate Bluesky credentials
-    atproto = _atproto_client()
-    try:
-        auth = atproto.create_session(bsky_handle, bsky_password)
-    except Exception as e:
-        logger.warning(f"Bluesky auth failed for handle: {e}")
-        return _status_panel("Invalid Bluesky credentials. Please check your handle and app password.", "error")
-    
-    # Get publication count
-    octopus = _octopus_client()
-    try:
-        publications = octopus.get_user_publications(octopus_user_id)
-        pub_count = len(publications)
-    except Exception:
-        pub_count = 0
-    
-    encrypted_pw = encrypt_password(bsky_password)
+    if not already_saved:
+        try:
+            _bsky_login(bsky_handle, bsky_password)
+        except Exception as e:
+            if pubs_future:
+                pubs_future.cancel()
+            logger.warning(f"Bluesky auth failed for handle: {e}")
+            return _status_panel("Invalid Bluesky credentials. Please check your handle and app password.", "error")
     
     if action == "auto_sync":
-        # Store/update credentials for ongoing sync (use upsert in case user already exists from sync_once)
-        users.upsert(
-            orcid=profile.orcid,
-            bsky_handle=bsky_handle,
-            encrypted_app_password=encrypted_pw,
-            octopus_user_id=octopus_user_id,
-            active=1,
-            pk="orcid",
-        )
+        if already_saved:
+            set_user_active(profile.orcid, True)
+        else:
+            # Store/update credentials for ongoing sync (use upsert in case user already exists from sync_once)
+            _save_user(
+                profile.orcid, bsky_handle, bsky_password, octopus_user_id, active=1,
+                encrypted_password=sess.get("bsky_app_password_enc"),
+            )
         
-        if pub_count > 0:
-            message = P(f"Syncing {pub_count} publications in the background...")
-            background = BackgroundTask(task_sync_user, orcid=profile.orcid)
+        if publications is None:
+            # Don't hold the response for an Octopus round trip just to show a
+            # count; the background sync fetches the list itself
+            message = P("Syncing your publications in the background...")
+            background = BackgroundTask(_run_auto_sync_in_background, orcid=profile.orcid)
+        elif publications:
+            # Hand over the list validate_octopus fetched so the sync doesn't refetch it
+            message = P(f"Syncing {len(publications)} publications in the background...")
+            background = BackgroundTask(_run_auto_sync_in_background, orcid=profile.orcid, publications=publications)
         else:
             message = P("We'll sync your publications when you publish on Octopus.")
             background = None
@@ -1809,16 +2079,20 @@ def setup_sync(action: str, sess, csrf_token: str | None = None):
     else:  # sync_once
         # Store user in database with active=0 so they appear in feed but don't auto-sync
         # Use upsert in case user already exists (allows re-syncing)
-        users.upsert(
-            orcid=profile.orcid,
-            bsky_handle=bsky_handle,
-            encrypted_app_password=encrypted_pw,  # Still encrypted, but won't be used for auto-sync
-            octopus_user_id=octopus_user_id,
-            active=0,  # Not active for auto-sync, but will appear in feed
-            pk="orcid",
+        # Password is still stored encrypted, but won't be used for auto-sync
+        _save_user(
+            profile.orcid, bsky_handle, bsky_password, octopus_user_id, active=0,
+            encrypted_password=sess.get("bsky_app_password_enc"),
         )
         
-        if pub_count == 0:
+        if publications is None:
+            try:
+                publications = pubs_future.result()
+                _pub_counts.set(octopus_user_id, len(publications))
+            except Exception:
+                publications = []
+        
+        if not publications:
             return Article(
                 Header(H3("Nothing to sync")),
                 P("You don't have any publications on Octopus yet."),
@@ -1827,54 +2101,30 @@ def setup_sync(action: str, sess, csrf_token: str | None = None):
                 id="sync-panel",
             )
         
-        # Get already synced publications to prevent duplicates
-        already_synced = {
-            (s.get("octopus_pub_id"), s.get("octopus_version_id"))
-            for s in synced_publications()
-            if s.get("orcid") == profile.orcid
-        }
-        
         # Set initial sync status and start background thread
-        with _sync_lock:
-            _sync_status[profile.orcid] = {
-                "status": "syncing",
-                "bsky_handle": bsky_handle,
-            }
+        _set_sync_status(profile.orcid, {
+            "status": "syncing",
+            "bsky_handle": bsky_handle,
+        })
         
-        # Start sync in background thread
-        sync_thread = threading.Thread(
-            target=_run_sync_in_background,
-            args=(profile.orcid, octopus_user_id, bsky_handle, bsky_password, already_synced),
-            daemon=True,
+        # Queue the sync on the shared worker pool
+        _sync_executor.submit(
+            _run_sync_in_background,
+            profile.orcid, octopus_user_id, bsky_handle, bsky_password, publications=publications,
         )
-        sync_thread.start()
         
-        # Return polling UI that checks /sync_status/{orcid} every second
-        return Article(
-            P(
-                Span(aria_busy="true", style="margin-right: 0.5rem;"),
-                "Syncing your publications to the atmosphere...",
-                style="text-align: center; padding: 1rem 0;",
-            ),
-            P(
-                Small("This may take a moment depending on how many publications you have."),
-                style="text-align: center; color: var(--pico-muted-color);",
-            ),
-            id="sync-panel",
-            hx_get=f"/sync_status/{profile.orcid}",
-            hx_trigger="every 1s",
-            hx_swap="outerHTML",
-        )
+        # Return the panel that streams progress from /sync_status/{orcid}/stream
+        return _syncing_article(profile.orcid)
 
 
 @rt
-def manual_sync(sess, csrf_token: str | None = None):
+def manual_sync(sess, auth, csrf_token: str | None = None):
     """Manually trigger a sync for the current user."""
     # Verify CSRF token
     if not verify_csrf_token(sess, csrf_token):
         return _status_panel("Invalid request. Please try again.", "error")
 
-    profile = _require_login(sess)
+    profile = auth
     if not profile:
         return _status_panel("Login with ORCID first.", "error")
 
@@ -1883,41 +2133,31 @@ def manual_sync(sess, csrf_token: str | None = None):
     if not existing or not existing.get("active"):
         return _status_panel("Auto-sync not enabled.", "error")
 
-    # Trigger background sync
-    from octosphere.tasks import task_sync_user
-    task_sync_user(profile.orcid)
+    bsky_handle = existing.get("bsky_handle", "")
 
-    # Update last_sync timestamp
-    users.update({
-        "orcid": profile.orcid,
-        "last_sync": datetime.utcnow().isoformat() + "Z",
+    # Queue the sync on the shared executor and hand back the progress UI
+    _set_sync_status(profile.orcid, {
+        "status": "syncing",
+        "kind": "manual",
+        "bsky_handle": bsky_handle,
     })
+    _sync_executor.submit(_run_manual_sync_in_background, profile.orcid, bsky_handle)
 
-    # Return to sync panel (it will refresh and show updated stats)
-    return Div(
-        Article(
-            Header(H3("✅ Sync Complete")),
-            P("Your publications have been synced."),
-            P(A("Refresh dashboard", href="/sync_panel", hx_get="/sync_panel", hx_target="#sync-panel")),
-            id="sync-panel",
-        ),
-        # Auto-refresh after 2 seconds
-        Script("setTimeout(() => htmx.ajax('GET', '/sync_panel', '#sync-panel'), 2000);"),
-    )
+    return _syncing_article(profile.orcid)
 
 
 @rt
-def disable_sync(sess, csrf_token: str | None = None):
+def disable_sync(sess, auth, csrf_token: str | None = None):
     """Disable auto-sync for the current user."""
     # Verify CSRF token
     if not verify_csrf_token(sess, csrf_token):
         return _status_panel("Invalid request. Please try again.", "error")
 
-    profile = _require_login(sess)
+    profile = auth
     if not profile:
         return _status_panel("Login with ORCID first.", "error")
 
-    users.update({"orcid": profile.orcid, "active": 0})
+    set_user_active(profile.orcid, False)
 
     return Article(
         Header(H3("Auto-sync disabled")),
@@ -1927,127 +2167,70 @@ def disable_sync(sess, csrf_token: str | None = None):
     )
 
 
+@rt("/sync_status/{orcid}/stream")
+async def sync_status_stream(orcid: str, auth):
+    """SSE endpoint pushing sync progress to the syncing panel."""
+    if not auth or auth.orcid != orcid:
+        return Response("Unauthorized", status_code=403)
+    return EventStream(_sync_progress_events(orcid))
+
+
 @rt("/sync_status/{orcid}")
-def sync_status(orcid: str, sess):
-    """Polling endpoint for sync status - returns syncing UI or final results."""
-    profile = _require_login(sess)
+def sync_status(orcid: str, sess, auth):
+    """Sync status panel - returns syncing UI or final results."""
+    # Mid-sync frames must never be served from a proxy or browser cache
+    return _sync_status_panel(orcid, sess, auth), HttpHeader("Cache-Control", "no-store")
+
+
+def _sync_status_panel(orcid: str, sess, profile: OrcidProfile | None):
+    """Build the sync status panel for /sync_status."""
     if not profile or profile.orcid != orcid:
         return _status_panel("Unauthorized.", "error")
     
-    with _sync_lock:
-        status = _sync_status.get(orcid)
-    
+    status = _sync_status.get(orcid)
     if not status:
-        # No status found - sync may not have started yet
-        return Article(
-            P(
-                Span(aria_busy="true", style="margin-right: 0.5rem;"),
-                "Starting sync...",
-                style="text-align: center; padding: 1rem 0;",
-            ),
-            id="sync-panel",
-            hx_get=f"/sync_status/{orcid}",
-            hx_trigger="every 1s",
-            hx_swap="outerHTML",
-        )
+        # Both sync routes record a status before returning the syncing panel, so
+        # none means a restart or another tab already collected the results.
+        # Answer with a final panel rather than a stream that would never close.
+        return _status_panel("No sync is running. Reload the dashboard to see your synced publications.", "info")
     
     if status["status"] == "syncing":
-        # Still syncing - show spinner and keep polling
-        return Article(
-            P(
-                Span(aria_busy="true", style="margin-right: 0.5rem;"),
-                "Syncing your publications to the atmosphere...",
-                style="text-align: center; padding: 1rem 0;",
-            ),
-            P(
-                Small("This may take a moment depending on how many publications you have."),
-                style="text-align: center; color: var(--pico-muted-color);",
-            ),
-            id="sync-panel",
-            hx_get=f"/sync_status/{orcid}",
-            hx_trigger="every 1s",
-            hx_swap="outerHTML",
-        )
+        # Still syncing - show progress (once the first publication is done) and keep streaming
+        if status.get("total"):
+            return _syncing_article(
+                orcid, _progress_body(status["done"], status["total"], status.get("recent"))
+            )
+        return _syncing_article(orcid)
     
     if status["status"] == "error":
         # Sync failed - clean up and show error
-        with _sync_lock:
-            _sync_status.pop(orcid, None)
-        return _status_panel(f"Sync failed: {status.get('error', 'Unknown error')}", "error")
+        _sync_status.pop(orcid, None)
+        return _build_status_panel(f"Sync failed: {status.get('error', 'Unknown error')}", "error")
     
     # status == "complete" - show results
     results = status.get("results", [])
     bsky_handle = status.get("bsky_handle", "")
     
     # Clean up status
-    with _sync_lock:
-        _sync_status.pop(orcid, None)
-    
-    # Get session data for auto-sync form
-    bsky_password = sess.get("bsky_app_password", "")
-    
-    # Build results table
-    rows = [
-        Tr(
-            Td(r.publication_id[:12] + "..."),
-            Td(A("View on pdsls", href=f"https://pdsls.dev/{r.uri}" if r.uri else "#", target="_blank")),
-        )
-        for r in results[:10]
-    ]
+    _sync_status.pop(orcid, None)
+
+    if status.get("kind") == "manual":
+        # Dashboard "Sync Now" - user already has auto-sync, so no Step 4 prompt.
+        # The dashboard's sync-done listener reloads the panel once this settles.
+        return Article(
+            Header(H3("✅ Sync Complete")),
+            P("Your publications have been synced."),
+            id="sync-panel",
+        ), HtmxResponseHeaders(trigger_after_settle="sync-done")
     
     # Step 4: Show success and prompt for auto-sync
-    return Article(
-        # Success header with checkmark
-        Header(
-            H3("✅ Synced ", Strong(f"{len(results)}"), " publications!"),
-            style="text-align: center;",
-        ),
-        P(
-            f"Your research is now live on @{bsky_handle}",
-            style="text-align: center; color: var(--pico-muted-color);",
-        ),
-        # Results table
-        Table(
-            Thead(Tr(Th("Publication ID"), Th("Link"))),
-            Tbody(*rows),
-        ) if rows else None,
-        P(
-            Small(f"Showing {min(len(results), 10)} of {len(results)} publications"),
-            style="text-align: center;",
-        ) if len(results) > 10 else None,
-        Hr(),
-        # Step 4: Auto-sync CTA
-        H4("Step 4: Keep your publications in sync"),
-        P(
-            "Enable auto-sync to automatically publish future Octopus publications "
-            "to the atmosphere. We'll check for new publications every 7 days."
-        ),
-        Form(
-            csrf_input(sess),  # CSRF protection
-            # Note: handle and password read from session, not form (security)
-            Input(type="hidden", name="action", value="auto_sync"),
-            Button("Enable auto-sync", type="submit", cls="contrast", style="width: 100%;"),
-            Div(
-                Span("Setting up auto-sync...", aria_busy="true"),
-                id="loading-autosync",
-                cls="htmx-indicator",
-                style="display:none;",
-            ),
-            hx_post="/setup_sync",
-            hx_target="#sync-panel",
-            hx_swap="outerHTML",
-            hx_indicator="#loading-autosync",
-        ),
-        P(
-            A("No thanks, I'm done", href="/"),
-            style="text-align: center; margin-top: 1rem;",
-        ),
-        id="sync-panel",
-    )
+    token = secrets.token_urlsafe(16)
+    _autosync_tokens.set(token, (orcid, bsky_handle))
+    return sync_results_panel(csrf_input(sess), results, bsky_handle, autosync_token=token)
 
 
 @rt
-def delete_account(sess, csrf_token: str | None = None):
+def delete_account(sess, auth, csrf_token: str | None = None):
     """Delete the user's Octosphere account.
 
     This removes the user from the database and clears synced_publications,
@@ -2057,17 +2240,12 @@ def delete_account(sess, csrf_token: str | None = None):
     if not verify_csrf_token(sess, csrf_token):
         return _status_panel("Invalid request. Please try again.", "error")
 
-    profile = _require_login(sess)
+    profile = auth
     if not profile:
         return _status_panel("Login with ORCID first.", "error")
     
     # Delete synced_publications entries for this user
-    user_synced = [s for s in synced_publications() if s.get("orcid") == profile.orcid]
-    for s in user_synced:
-        try:
-            synced_publications.delete(s.get("id"))
-        except Exception:
-            pass
+    delete_synced_publications(profile.orcid)
     
     # Delete user from users table
     try:
@@ -2079,9 +2257,7 @@ def delete_account(sess, csrf_token: str | None = None):
     sess.pop("orcid", None)
     sess.pop("orcid_state", None)
     sess.pop("octopus_user_id", None)
-    sess.pop("bsky_handle", None)
-    sess.pop("bsky_app_password", None)
-    sess.pop("bsky_authenticated", None)
+    _clear_bluesky_session(sess)
     
     # Return a page that redirects to home (HTMX can't do full redirects easily)
     return Response(
@@ -2094,7 +2270,7 @@ def delete_account(sess, csrf_token: str | None = None):
 
 
 @rt
-def delete_all_records(confirm_password: str, sess, csrf_token: str | None = None):
+def delete_all_records(confirm_password: str, sess, auth, csrf_token: str | None = None):
     """Delete all Octosphere publication records and disable auto-sync.
 
     This only deletes social.octosphere.publication records - not posts, likes, follows, etc.
@@ -2103,7 +2279,7 @@ def delete_all_records(confirm_password: str, sess, csrf_token: str | None = Non
     if not verify_csrf_token(sess, csrf_token):
         return _status_panel("Invalid request. Please try again.", "error")
 
-    profile = _require_login(sess)
+    profile = auth
     if not profile:
         return _status_panel("Login with ORCID first.", "error")
 
@@ -2149,16 +2325,10 @@ def delete_all_records(confirm_password: str, sess, csrf_token: str | None = Non
                 errors.append(uri)  # Only store URI, not error details
 
     # Clear synced_publications entries for this user
-    # We need to delete them one by one since fastlite doesn't have bulk delete
-    user_synced = [s for s in synced_publications() if s.get("orcid") == profile.orcid]
-    for s in user_synced:
-        try:
-            synced_publications.delete(s.get("id"))
-        except Exception:
-            pass  # Ignore errors when clearing local records
+    delete_synced_publications(profile.orcid)
 
     # Disable auto-sync
-    users.update({"orcid": profile.orcid, "active": 0})
+    set_user_active(profile.orcid, False)
 
     # Build result message
     if errors:
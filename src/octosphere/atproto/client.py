@@ -5,14 +5,45 @@ Supports any PDS through identity resolution, not just bsky.social.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Any, Optional
 
 import httpx
-from atproto import Client, models
+from atproto import Client, Request, models
 from atproto_identity.resolver import IdResolver
 
 from octosphere.atproto.models import OCTOSPHERE_PUBLICATION_NSID
 
+# Keep-alive pool shared by all AtprotoClient instances for unauthenticated
+# XRPC reads, so repeat feed fetches from the same PDS skip the TLS handshake.
+# It is shared across users, so cookies are never stored.
+_http = httpx.Client(
+    cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+)
+
+
+class _SharedTransport(httpx.HTTPTransport):
+    """HTTP transport (and so connection pool) shared by every SDK Client."""
+
+    def close(self) -> None:
+        pass  # outlives any one Client; closing one must not close the others
+
+
+# Connection pool behind every SDK Client (logins, session restores, record
+# writes). The SDK would otherwise open a new pool, and so a new TLS handshake,
+# per Client. Each Client still gets its own Request and httpx.Client through
+# the SDK's public constructor, so auth headers and cookies stay per Client.
+_xrpc_transport = _SharedTransport(
+    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+)
+
+
+def _sdk_client(base_url: str) -> Client:
+    """SDK Client for a PDS that reuses the shared connection pool."""
+    return Client(base_url=base_url, request=Request(transport=_xrpc_transport))
+
 
 @dataclass
 class AtprotoAuth:
@@ -43,15 +74,25 @@ class AtprotoClient:
         result = client.create_publication_record(auth, record_dict)
     """
     
-    def __init__(self, default_pds_url: Optional[str] = None):
+    def __init__(
+        self,
+        default_pds_url: Optional[str] = None,
+        resolver: Optional[IdResolver] = None,
+        http: Optional[httpx.Client] = None,
+    ):
         """Initialize the client.
         
         Args:
             default_pds_url: Fallback PDS URL if identity resolution fails.
                            Defaults to bsky.social.
+            resolver: Identity resolver to share between clients. A new one
+                      is created if not given.
+            http: HTTP client for unauthenticated reads. Defaults to the
+                  module's shared keep-alive pool.
         """
         self.default_pds_url = (default_pds_url or "https://bsky.social").rstrip("/")
-        self._resolver = IdResolver()
+        self._resolver = resolver or IdResolver()
+        self._http = http or _http
         self._client: Optional[Client] = None
         self._auth: Optional[AtprotoAuth] = None
     
@@ -98,12 +139,15 @@ class AtprotoClient:
         pds_endpoint = self._resolve_pds_endpoint(handle)
         
         # Create client for the user's PDS
-        self._client = Client(base_url=pds_endpoint)
+        self._client = _sdk_client(pds_endpoint)
         
         # Login and get session
         profile = self._client.login(handle, app_password)
         
-        # Extract session info
+        return self._set_auth(profile, pds_endpoint)
+    
+    def _set_auth(self, profile: Any, pds_endpoint: str) -> AtprotoAuth:
+        """Record the logged-in client's session as this client's auth."""
         session = self._client._session  # Access internal session for JWT tokens
         
         self._auth = AtprotoAuth(
@@ -120,6 +164,28 @@ class AtprotoClient:
         """Alias for login() to maintain backward compatibility."""
         return self.login(handle, app_password)
     
+    def export_session(self) -> str:
+        """Export the current session so another client can resume it."""
+        if self._client is None:
+            raise RuntimeError("Not logged in")
+        return self._client.export_session_string()
+    
+    def restore_session(self, session_string: str, pds_endpoint: str) -> AtprotoAuth:
+        """Resume a session from export_session() without a password login.
+        
+        Skips PDS resolution and createSession (which is rate limited).
+        
+        Args:
+            session_string: Value returned by export_session()
+            pds_endpoint: PDS the session was created on
+            
+        Returns:
+            AtprotoAuth for the resumed session
+        """
+        self._client = _sdk_client(pds_endpoint)
+        profile = self._client.login(session_string=session_string)
+        return self._set_auth(profile, pds_endpoint)
+    
     def _ensure_client(self, auth: AtprotoAuth) -> Client:
         """Ensure we have a client for the given auth session.
         
@@ -129,7 +195,7 @@ class AtprotoClient:
             return self._client
         
         # Create new client for this auth
-        client = Client(base_url=auth.pds_endpoint)
+        client = _sdk_client(auth.pds_endpoint)
         # Restore session using the login method with stored credentials would be ideal,
         # but for simplicity we'll create a fresh client
         # In production, you'd want to use session string export/import
@@ -277,15 +343,14 @@ class AtprotoClient:
         }
         
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                return [
-                    {"uri": r["uri"], "cid": r["cid"], "value": r["value"]}
-                    for r in data.get("records", [])
-                ]
+            response = self._http.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+            
+            return [
+                {"uri": r["uri"], "cid": r["cid"], "value": r["value"]}
+                for r in data.get("records", [])
+            ]
         except Exception as e:
             # Log error but return empty list rather than failing
             print(f"Error listing records for {did}: {e}")
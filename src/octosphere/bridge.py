@@ -1,20 +1,31 @@
 """Bridge logic for mapping Octopus publications to AT Proto records."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
 
 from octosphere.atproto.client import AtprotoAuth, AtprotoClient, CreateRecordResult
 from octosphere.octopus.client import OctopusClient, OctopusPublication
 
+# Publications posted to the PDS at once by sync_publications; kept small so a
+# large backlog stays under AT Protocol rate limits
+DEFAULT_SYNC_CONCURRENCY = 6
 
-@dataclass
+
+@dataclass(slots=True)
 class SyncResult:
     publication_id: str
     version_id: str
     uri: str
     cid: str
+    # Where the results table links the record, derived once from uri
+    web_url: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.web_url = f"https://pdsls.dev/{self.uri}" if self.uri else "#"
 
 
 def _safe_text(value: str | None) -> str:
@@ -124,6 +135,10 @@ def sync_publications(
     auth: AtprotoAuth,
     user_id: str,
     already_synced: set[tuple[str, str]] | None = None,
+    publications: list[dict[str, Any]] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+    max_workers: int = DEFAULT_SYNC_CONCURRENCY,
+    on_result: Callable[[SyncResult], None] | None = None,
 ) -> list[SyncResult]:
     """Sync Octopus publications to AT Protocol.
     
@@ -134,21 +149,44 @@ def sync_publications(
         user_id: Octopus user ID
         already_synced: Set of (publication_id, version_id) tuples that have already been synced.
                        If provided, these will be skipped to prevent duplicates.
+        publications: The user's publication list if the caller already fetched it;
+                      otherwise it is fetched from Octopus.
+        on_progress: Called as on_progress(done, total) after each publication
+                     is synced or skipped.
+        max_workers: How many publications are fetched and posted concurrently.
+        on_result: Called with each SyncResult as soon as its record is created,
+                   before the matching on_progress call. Calls never overlap.
     
     Returns:
-        List of SyncResult for newly synced publications
+        List of SyncResult for newly synced publications, in publication order
     """
-    results: list[SyncResult] = []
     already_synced = already_synced or set()
     
-    publications = octopus.get_user_publications(user_id)
-    for item in publications:
+    if publications is None:
+        publications = octopus.get_user_publications(user_id)
+    total = len(publications)
+    done = 0
+    progress_lock = threading.Lock()
+    
+    def advance(result: SyncResult | None = None) -> None:
+        nonlocal done
+        if not (on_progress or on_result):
+            return
+        with progress_lock:
+            done += 1
+            if result is not None and on_result:
+                on_result(result)
+            if on_progress:
+                on_progress(done, total)
+    
+    def post_one(item: dict[str, Any]) -> SyncResult | None:
         mapped = octopus.map_publication(item)
         
         # Skip if already synced (duplicate prevention)
         if (mapped.publication_id, mapped.version_id) in already_synced:
             print(f"Skipping already synced: {mapped.publication_id}/{mapped.version_id}")
-            continue
+            advance()
+            return None
         
         # Use get_publication_chain which returns full version data including content
         # (the /publication-versions endpoint returns 403 Forbidden)
@@ -165,12 +203,20 @@ def sync_publications(
         # This ensures that even if we accidentally sync twice, it updates rather than duplicates
         rkey = f"octopus-{mapped.publication_id}"
         created = atproto.create_publication_record(auth, record, rkey=rkey)
-        results.append(
-            SyncResult(
-                publication_id=mapped.publication_id,
-                version_id=mapped.version_id,
-                uri=created.uri,
-                cid=created.cid,
-            )
+        result = SyncResult(
+            publication_id=mapped.publication_id,
+            version_id=mapped.version_id,
+            uri=created.uri,
+            cid=created.cid,
         )
-    return results
+        advance(result)
+        return result
+    
+    if not publications:
+        return []
+    # Each publication is an independent round trip to Octopus and the PDS,
+    # so a small pool overlaps the network waits; map keeps input order
+    workers = max(1, min(max_workers, total))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync-pub") as ex:
+        outcomes = list(ex.map(post_one, publications))
+    return [r for r in outcomes if r is not None]
@@ -3,9 +3,18 @@ from __future__ import annotations
 
 import os
 import sqlite3
+import threading
+from functools import lru_cache
 from pathlib import Path
+
+import apsw
 from cryptography.fernet import Fernet
 
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks, single-process dev only
+    fcntl = None
+
 # Re-export NotFoundError for use in other modules
 try:
     from fastlite import NotFoundError
@@ -18,6 +27,37 @@ except ImportError:
 db_path = os.getenv("DATABASE_PATH", "octosphere.db")
 migrations_path = os.getenv("MIGRATIONS_PATH", "migrations")
 
+def _create_db_if_missing(path: Path, migrations: Path) -> bool:
+    """Create and migrate a new database; return False if one already exists.
+
+    Must run before fastlite.database() opens the connection, which would
+    otherwise create an empty file that looks like an existing database.
+
+    Every worker that finds the file returns at once, without touching the
+    lock; that is the path taken on each restart. Only when the file is
+    missing do workers queue on an exclusive lock on ``<path>.lock``: the
+    first creates and migrates the database, and the rest, once they hold
+    the lock, find the file and return.
+    """
+    if path.exists():
+        return False
+    with open(f"{path}.lock", "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)  # released when the file closes
+        if path.exists():
+            return False
+        from fastmigrate import create_db, run_migrations
+
+        print(f"[Octosphere] Creating new database at {path}")
+        create_db(path)
+        run_migrations(path, migrations)
+    return True
+
+
+# Deployments whose release step prepares the database can skip the check
+if db_path != ":memory:" and os.getenv("SKIP_MIGRATIONS") != "1":
+    _create_db_if_missing(Path(db_path), Path(migrations_path))
+
 # CRITICAL: Enroll existing databases BEFORE calling fastlite's database()
 # This is because fastlite/fastmigrate validates the _meta table on connection
 def _ensure_db_enrolled():
@@ -50,7 +90,43 @@ _ensure_db_enrolled()
 
 # NOW it's safe to import and connect via fastlite
 from fastlite import database, Table
+
+# Per-connection tuning on top of fastlite's WAL mode. NORMAL sync is durable
+# across app crashes under WAL (only an OS crash can lose the last commits).
+# apsw already caches prepared statements per connection.
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",  # ~20 MB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped reads
+    "PRAGMA temp_store=MEMORY",  # sorts/temp b-trees never touch disk
+)
+
+
+def _configure_connection(database_) -> None:
+    """Apply Octosphere's performance pragmas to a fastlite database."""
+    for pragma in _PRAGMAS:
+        database_.execute(pragma)
+
+
 db = database(db_path)
+_configure_connection(db)
+
+# Read-only connections, one per thread. Under WAL any number of readers run
+# alongside the single writer (db), so dashboard reads from concurrent request
+# threads no longer queue on one connection.
+_readers = threading.local()
+
+
+def _reader():
+    """Return this thread's read-only connection (db itself for in-memory databases)."""
+    if db_path == ":memory:":
+        return db
+    conn = getattr(_readers, "db", None)
+    if conn is None:
+        conn = database(db_path, wal=False, flags=apsw.SQLITE_OPEN_READONLY)
+        _configure_connection(conn)
+        _readers.db = conn
+    return conn
 
 # SQL-first approach: Don't create tables here - let migrations handle schema.
 # Tables are accessed AFTER migrations run via db.t.tablename
@@ -113,12 +189,102 @@ users = LazyTable(get_users_table)
 synced_publications = LazyTable(get_synced_publications_table)
 
 
+def count_synced_publications(orcid: str) -> int:
+    """Count a user's synced publications in SQL (uses idx_synced_publications_orcid)."""
+    rows = _reader().q("SELECT COUNT(*) AS n FROM synced_publications WHERE orcid = ?", [orcid])
+    return rows[0]["n"]
+
+
+def synced_publication_keys(orcid: str) -> set[tuple[str, str]]:
+    """(publication_id, version_id) pairs already synced for a user, filtered in SQL."""
+    rows = _reader().q(
+        "SELECT octopus_pub_id, octopus_version_id FROM synced_publications WHERE orcid = ?", [orcid]
+    )
+    return {(r["octopus_pub_id"], r["octopus_version_id"]) for r in rows}
+
+
+def get_user_summary(orcid: str) -> dict | None:
+    """A user's dashboard fields by primary key, without the encrypted password."""
+    rows = _reader().q(
+        "SELECT orcid, bsky_handle, octopus_user_id, active, last_sync FROM users WHERE orcid = ?",
+        [orcid],
+    )
+    return rows[0] if rows else None
+
+
+def bluesky_handles() -> list[str]:
+    """Distinct Bluesky handles of every enrolled user (active or one-time sync)."""
+    rows = db.q("SELECT DISTINCT bsky_handle FROM users WHERE bsky_handle IS NOT NULL AND bsky_handle != ''")
+    return [r["bsky_handle"] for r in rows]
+
+
+def users_due_for_sync(cutoff: str) -> list[dict]:
+    """Active users never synced or last synced before cutoff, filtered in SQL."""
+    return db.q(
+        "SELECT * FROM users WHERE active AND (last_sync IS NULL OR last_sync = '' OR last_sync < ?)",
+        [cutoff],
+    )
+
+
+def record_synced_publications(orcid: str, results, last_sync: str | None = None) -> None:
+    """Insert one synced_publications row per SyncResult in a single transaction.
+
+    Rows already recorded (same orcid, publication and version) are skipped by
+    the table's UNIQUE constraint, so overlapping syncs never fail the batch.
+    If last_sync is given, the user's last_sync is updated in the same
+    transaction, so a finished sync is one commit.
+    """
+    rows = [(orcid, r.publication_id, r.version_id, r.uri) for r in results]
+    if not rows and last_sync is None:
+        return
+    with db.conn:
+        if rows:
+            db.conn.executemany(
+                "INSERT OR IGNORE INTO synced_publications (orcid, octopus_pub_id, octopus_version_id, at_uri) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        if last_sync is not None:
+            db.conn.execute("UPDATE users SET last_sync = ? WHERE orcid = ?", (last_sync, orcid))
+
+
+def delete_synced_publications(orcid: str) -> None:
+    """Forget every publication synced for a user with one DELETE on the orcid index."""
+    db.execute("DELETE FROM synced_publications WHERE orcid = ?", (orcid,))
+
+
+def upsert_user(
+    orcid: str, bsky_handle: str, encrypted_app_password: str, octopus_user_id: str, active: int
+) -> None:
+    """Insert or update a user's sync settings in one INSERT ... ON CONFLICT statement."""
+    db.execute(
+        "INSERT INTO users (orcid, bsky_handle, encrypted_app_password, octopus_user_id, active) "
+        "VALUES (?, ?, ?, ?, ?) ON CONFLICT(orcid) DO UPDATE SET "
+        "bsky_handle = excluded.bsky_handle, "
+        "encrypted_app_password = excluded.encrypted_app_password, "
+        "octopus_user_id = excluded.octopus_user_id, "
+        "active = excluded.active",
+        (orcid, bsky_handle, encrypted_app_password, octopus_user_id, active),
+    )
+
+
+def set_user_active(orcid: str, active: bool) -> None:
+    """Turn a user's auto-sync on or off with a single UPDATE (other columns untouched)."""
+    db.execute("UPDATE users SET active = ? WHERE orcid = ?", (int(active), orcid))
+
+
+@lru_cache(maxsize=4)
+def _fernet_for_key(key: str) -> Fernet:
+    """Build the Fernet instance for a key once and reuse it on later calls."""
+    return Fernet(key.encode())
+
+
 def get_fernet() -> Fernet:
     """Get Fernet instance for encrypting/decrypting passwords."""
     key = os.getenv("ENCRYPTION_KEY")
     if not key:
         raise RuntimeError("ENCRYPTION_KEY environment variable not set")
-    return Fernet(key.encode())
+    return _fernet_for_key(key)
 
 
 def encrypt_password(password: str) -> str:
@@ -0,0 +1,21 @@
+"""Shared HTTP sessions for outbound API calls."""
+from __future__ import annotations
+
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def pooled_session(pool_size: int = 20) -> requests.Session:
+    """Return a requests.Session that keeps connections alive between calls.
+
+    Sessions are shared by every user's requests, so cookies are never stored
+    (auth is always passed explicitly in headers).
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,11 +1,20 @@
 """Octopus API client and mapping helpers."""
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Any
 
 import requests
 
+from octosphere.http import pooled_session
+
+# The ID must fill the whole path segment, so "/authors/abc-def" is rejected
+# rather than truncated to "abc"
+_AUTHOR_ID_RE = re.compile(r"/authors/([a-zA-Z0-9]+)(?=[/?#]|$)")
+# Keep-alive pool shared by all OctopusClient instances (tokens go in headers)
+_http = pooled_session()
+
 
 @dataclass
 class OctopusPublication:
@@ -24,10 +33,17 @@ class OctopusPublication:
 
 
 class OctopusClient:
-    def __init__(self, api_url: str, web_url: str, access_token: str | None = None):
+    def __init__(
+        self,
+        api_url: str,
+        web_url: str,
+        access_token: str | None = None,
+        http: requests.Session | None = None,
+    ):
         self.api_url = api_url.rstrip("/")
         self.web_url = web_url.rstrip("/")
         self.access_token = access_token
+        self.http = http or _http
 
     def _headers(self) -> dict[str, str]:
         headers: dict[str, str] = {"Accept": "application/json"}
@@ -37,7 +53,7 @@ class OctopusClient:
 
     def get_user_publications(self, user_id: str) -> list[dict[str, Any]]:
         url = f"{self.api_url}/users/{user_id}/publications"
-        response = requests.get(url, headers=self._headers(), timeout=30)
+        response = self.http.get(url, headers=self._headers(), timeout=30)
         response.raise_for_status()
         data = response.json()
         if isinstance(data, dict) and "data" in data:
@@ -48,13 +64,13 @@ class OctopusClient:
 
     def get_publication_chain(self, publication_id: str) -> dict[str, Any]:
         url = f"{self.api_url}/publications/{publication_id}"
-        response = requests.get(url, headers=self._headers(), timeout=30)
+        response = self.http.get(url, headers=self._headers(), timeout=30)
         response.raise_for_status()
         return response.json()
 
     def get_version_content(self, version_id: str) -> dict[str, Any]:
         url = f"{self.api_url}/publication-versions/{version_id}"
-        response = requests.get(url, headers=self._headers(), timeout=30)
+        response = self.http.get(url, headers=self._headers(), timeout=30)
         response.raise_for_status()
         return response.json()
 
@@ -85,7 +101,7 @@ class OctopusClient:
     def get_user_info(self, user_id: str) -> dict[str, Any]:
         """Get user info by internal Octopus user ID."""
         url = f"{self.api_url}/users/{user_id}"
-        response = requests.get(url, headers=self._headers(), timeout=30)
+        response = self.http.get(url, headers=self._headers(), timeout=30)
         response.raise_for_status()
         return response.json()
 
@@ -98,7 +114,7 @@ class OctopusClient:
         # Search using ORCID - the search will match text but we filter exactly
         url = f"{self.api_url}/publication-versions"
         params = {"limit": limit}
-        response = requests.get(url, headers=self._headers(), params=params, timeout=30)
+        response = self.http.get(url, headers=self._headers(), params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
         
@@ -117,6 +133,5 @@ class OctopusClient:
         Example: https://www.octopus.ac/authors/cl5smny4a000009ieqml45bhz
         Returns: cl5smny4a000009ieqml45bhz
         """
-        import re
-        match = re.search(r'/authors/([a-zA-Z0-9]+)', url)
+        match = _AUTHOR_ID_RE.search(url)
         return match.group(1) if match else None
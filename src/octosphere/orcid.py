@@ -1,17 +1,26 @@
 """Minimal ORCID OAuth helper."""
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from typing import Any
 
 import requests
 
+from octosphere.http import pooled_session
 
-@dataclass
+_http = pooled_session(pool_size=4)
+
+
+@dataclass(frozen=True)
 class OrcidProfile:
     orcid: str
     access_token: str
     name: str | None = None
+    expires_at: float | None = None  # Unix time the access token expires
+
+    def is_expired(self, leeway: float = 60) -> bool:
+        return self.expires_at is not None and time.time() > self.expires_at - leeway
 
 
 class OrcidClient:
@@ -23,6 +32,7 @@ class OrcidClient:
         base_url: str,
         token_url: str,
         scope: str,
+        http: requests.Session | None = None,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
@@ -30,6 +40,7 @@ class OrcidClient:
         self.base_url = base_url.rstrip("/")
         self.token_url = token_url
         self.scope = scope
+        self.http = http or _http
 
     def auth_url(self, state: str) -> str:
         return (
@@ -46,20 +57,22 @@ class OrcidClient:
             "code": code,
             "redirect_uri": self.redirect_uri,
         }
-        response = requests.post(self.token_url, data=payload, timeout=30)
+        response = self.http.post(self.token_url, data=payload, timeout=30)
         response.raise_for_status()
         data = response.json()
+        expires_in = data.get("expires_in")
         return OrcidProfile(
             orcid=data.get("orcid") or data.get("orcid_id") or "",
             access_token=data.get("access_token") or "",
             name=data.get("name"),
+            expires_at=time.time() + float(expires_in) if expires_in else None,
         )
 
     def fetch_record(self, profile: OrcidProfile) -> dict[str, Any]:
         if not profile.orcid:
             return {}
         url = f"{self.base_url}/v3.0/{profile.orcid}/record"
-        response = requests.get(
+        response = self.http.get(
             url,
             headers={
                 "Authorization": f"Bearer {profile.access_token}",
@@ -0,0 +1,408 @@
+"""Panel builders for the Octosphere dashboard and onboarding flow.
+
+These are pure functions of their (typed) arguments, kept separate from the
+route handlers in app.py so the request handlers only gather data.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from html import escape
+
+from fasthtml.common import *
+
+from octosphere.bridge import SyncResult
+
+_BAR_STYLE = "width: {}%; background: var(--pico-primary); height: 100%; border-radius: 0.25rem;"
+# Prebuilt bar styles for round percentages (the common cases)
+_PROGRESS_STYLES = {pct: _BAR_STYLE.format(pct) for pct in range(0, 101, 10)}
+
+
+@lru_cache(maxsize=16)
+def loading_indicator(message: str, id_: str, style: str = "display:none;") -> FT:
+    """Return the shared (never mutated) htmx busy indicator for a form."""
+    return Div(Span(message, aria_busy="true"), id=id_, cls="htmx-indicator", style=style)
+
+
+def sync_stats(pub_count: int, synced_count: int) -> FT:
+    """Render the sync progress bar and "N of M publications synced" line."""
+    # Calculate sync progress percentage
+    sync_pct = min((100 * synced_count) // pub_count, 100) if pub_count else 0
+    sync_complete = synced_count >= pub_count and pub_count > 0
+
+    return Div(
+        # Progress bar
+        Div(
+            Div(style=_PROGRESS_STYLES.get(sync_pct) or _BAR_STYLE.format(sync_pct)) if sync_pct else None,
+            style="background: var(--pico-muted-border-color); height: 0.5rem; border-radius: 0.25rem; margin-bottom: 0.5rem;",
+        ),
+        Div(
+            Strong(f"{synced_count} of {pub_count} publications synced"),
+            " ✓" if sync_complete else "",
+            style="margin-bottom: 0.5rem;",
+            cls="octo-success-text" if sync_complete else "",
+        ),
+        id="sync-stats",
+    )
+
+
+# Shown until /sync_panel/stats answers, so the dashboard paints without waiting on Octopus
+_SYNC_STATS_PLACEHOLDER = Div(
+    Div(
+        style="background: var(--pico-muted-border-color); height: 0.5rem; border-radius: 0.25rem; margin-bottom: 0.5rem;",
+    ),
+    Div(Span("Counting publications...", aria_busy="true"), style="margin-bottom: 0.5rem;"),
+    id="sync-stats",
+    hx_get="/sync_panel/stats",
+    hx_trigger="load",
+    hx_swap="outerHTML",
+)
+
+
+def dashboard_panel(
+    csrf: FT,
+    orcid: str,
+    bsky_handle: str,
+    bsky_did: str | None,
+    last_sync_display: str,
+) -> FT:
+    """Render the dashboard for a user with auto-sync enabled.
+
+    Publication counts load afterwards from /sync_panel/stats (see sync_stats).
+    """
+    return Div(
+        # Status Card
+        Article(
+            # Header with status badge
+            Div(
+                Span(
+                    I(cls="fa-solid fa-circle", style="font-size: 0.5rem; margin-right: 0.5rem;"),
+                    "Auto-sync Active",
+                    cls="octo-badge-success",
+                ),
+                style="margin-bottom: 1rem;",
+            ),
+            # Connections section
+            H4(
+                I(cls="fa-solid fa-link", style="margin-right: 0.5rem; color: var(--pico-muted-color);"),
+                "Connected Accounts",
+            ),
+            Div(
+                Div(
+                    Strong("ORCID: "),
+                    A(
+                        orcid,
+                        href=f"https://orcid.org/{orcid}",
+                        target="_blank",
+                    ),
+                    style="margin-bottom: 0.5rem;",
+                ),
+                Div(
+                    Strong("Bluesky: "),
+                    A(
+                        f"@{bsky_handle}",
+                        href=f"https://bsky.app/profile/{bsky_handle}",
+                        target="_blank",
+                    ),
+                ),
+                style="margin-bottom: 1.5rem;",
+            ),
+        ),
+        # Sync Status Card
+        Article(
+            H4(
+                I(cls="fa-solid fa-sync", style="margin-right: 0.5rem; color: var(--pico-muted-color);"),
+                "Sync Status",
+            ),
+            _SYNC_STATS_PLACEHOLDER,
+            Small(
+                I(cls="fa-regular fa-clock", style="margin-right: 0.25rem;"),
+                f"Last sync: {last_sync_display}",
+                style="color: var(--pico-muted-color);",
+            ),
+        ),
+        # Actions Card
+        Article(
+            H4(
+                I(cls="fa-solid fa-bolt", style="margin-right: 0.5rem; color: var(--pico-muted-color);"),
+                "Actions",
+            ),
+            Div(
+                Form(
+                    csrf,  # CSRF protection
+                    Button(
+                        I(cls="fa-solid fa-rotate", style="margin-right: 0.5rem;"),
+                        "Sync Now",
+                        type="submit",
+                        cls="contrast",
+                        style=" margin-bottom: 0px;",
+                    ),
+                    loading_indicator("Syncing...", "sync-loading", "display:none; margin-left: 0.5rem;"),
+                    hx_post="/manual_sync",
+                    hx_target="#sync-panel",
+                    hx_swap="outerHTML",
+                    hx_indicator="#sync-loading",
+                    style="display: flex; align-items: center;",
+                ),
+                A(
+                    I(cls="fa-solid fa-arrow-up-right-from-square", style="margin-right: 0.5rem;"),
+                    "View on PDSLS",
+                    href=f"https://pdsls.dev/at://{bsky_did}/social.octosphere.publication" if bsky_did else f"https://bsky.app/profile/{bsky_handle}",
+                    target="_blank",
+                    role="button",
+                    cls="outline",
+                ),
+                style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1rem;",
+            ),
+            Hr(),
+            Form(
+                csrf,  # CSRF protection
+                Button(
+                    I(cls="fa-solid fa-power-off", style="margin-right: 0.5rem;"),
+                    "Disable auto-sync",
+                    type="submit",
+                    cls="secondary outline",
+                ),
+                hx_post="/disable_sync",
+                hx_target="#sync-panel",
+                hx_swap="outerHTML",
+            ),
+        ),
+        # Hidden Advanced Options section
+        Details(
+            Summary(
+                I(cls="fa-solid fa-gear", style="margin-right: 0.5rem;"),
+                "Advanced options",
+                style="cursor: pointer; color: var(--pico-muted-color); font-size: 0.875rem;",
+            ),
+            Article(
+                H4(
+                    I(cls="fa-solid fa-triangle-exclamation octo-danger-text", style="margin-right: 0.5rem;"),
+                    "Danger Zone",
+                    cls="octo-danger-text",
+                ),
+                P(
+                    "Delete all your Octosphere publication records from the AT Protocol network "
+                    "and disable auto-sync. This only removes ",
+                    Code("social.octosphere.publication"),
+                    " records — your Bluesky posts, likes, and follows are not affected.",
+                    style="font-size: 0.875rem; color: var(--pico-muted-color);",
+                ),
+                Form(
+                    csrf,  # CSRF protection
+                    Fieldset(
+                        Label(
+                            "Confirm with your Bluesky app password",
+                            Input(
+                                id="confirm_password",
+                                name="confirm_password",
+                                type="password",
+                                placeholder="App password",
+                                required=True,
+                            ),
+                        ),
+                        Small(
+                            "For security, re-enter your app password to confirm this destructive action.",
+                            style="color: var(--pico-muted-color);",
+                        ),
+                    ),
+                    Button(
+                        I(cls="fa-solid fa-trash", style="margin-right: 0.5rem;"),
+                        "Delete All Records & Disconnect",
+                        type="submit",
+                        cls="octo-danger-btn",
+                    ),
+                    loading_indicator("Deleting records...", "delete-loading"),
+                    hx_post="/delete_all_records",
+                    hx_target="#sync-panel",
+                    hx_swap="outerHTML",
+                    hx_indicator="#delete-loading",
+                    hx_confirm="Are you sure? This will permanently delete all your Octosphere publication records from the AT Protocol network.",
+                ),
+                Hr(cls="octo-danger-text", style="margin: 1.5rem 0; border-color: var(--octo-danger-border);"),
+                # Delete Account section
+                H4(
+                    I(cls="fa-solid fa-user-slash octo-danger-text", style="margin-right: 0.5rem;"),
+                    "Delete Account",
+                    cls="octo-danger-text",
+                ),
+                P(
+                    "Remove your Octosphere account entirely. ",
+                    Strong("Note: "),
+                    "This will NOT delete your publication records from the AT Protocol network. "
+                    "Use 'Delete All Records' above first if you want to remove those.",
+                    style="font-size: 0.875rem; color: var(--pico-muted-color);",
+                ),
+                Form(
+                    csrf,  # CSRF protection
+                    Button(
+                        I(cls="fa-solid fa-user-minus", style="margin-right: 0.5rem;"),
+                        "Delete My Account",
+                        type="submit",
+                        cls="octo-danger-btn",
+                    ),
+                    loading_indicator("Deleting account...", "delete-account-loading"),
+                    hx_post="/delete_account",
+                    hx_indicator="#delete-account-loading",
+                    hx_confirm="Are you sure you want to delete your Octosphere account? This will NOT delete your publication records from the AT Protocol network - use 'Delete All Records' first if you want to remove those.",
+                ),
+                cls="octo-danger-zone",
+                style="margin-top: 1rem;",
+            ),
+            style="margin-top: 1.5rem;",
+        ),
+        id="sync-panel",
+    )
+
+
+# Onboarding form fields are the same for everyone; only the CSRF token varies
+_STEP1_FIELDS = Fieldset(
+    Label(
+        "Bluesky handle",
+        Input(id="handle", placeholder="user.bsky.social", required=True),
+        Small("Your full handle including domain, e.g. alice.bsky.social or yourname.com", style="font-weight: normal;"),
+    ),
+    Label(
+        "App password",
+        Input(id="app_password", type="password", required=True),
+        Small(
+            "You need to generate an app password at ",
+            A("bsky.app/settings/app-passwords", href="https://bsky.app/settings/app-passwords", target="_blank"),
+            style="font-weight: normal;",
+        ),
+    ),
+)
+_STEP2_FIELDS = Fieldset(
+    Label(
+        "Octopus author page URL",
+        Input(
+            id="octopus_url",
+            placeholder="https://www.octopus.ac/authors/your-id",
+            required=True,
+        ),
+    ),
+    Small(
+        "Find this at octopus.ac by clicking your profile. "
+        "Example: https://www.octopus.ac/authors/cl5smny4a000009ieqml45bhz"
+    ),
+)
+
+
+def _prerender(*elms) -> NotStr:
+    return NotStr("".join(to_xml(el) for el in elms))
+
+
+# Everything in the onboarding panels except the CSRF input (and Step 2's
+# handle) is rendered once; each request builds only the Article and Form nodes
+_STEP1_INTRO = _prerender(
+    Header(H3("Step 1: Sign in with Bluesky")),
+    P("First, connect your Bluesky account to sync your publications."),
+)
+_STEP1_FORM_BODY = _prerender(
+    _STEP1_FIELDS,
+    Button("Sign in with Bluesky", type="submit", cls="contrast"),
+    loading_indicator("Connecting to Bluesky...", "loading"),
+)
+_STEP1_FORM_ATTRS = dict(hx_post="/validate_bluesky", hx_target="#sync-panel", hx_swap="outerHTML", hx_indicator="#loading")
+
+_STEP2_HEADER = _prerender(Header(H3("Step 2: Connect your Octopus profile")))
+_STEP2_INTRO = _prerender(P("Now, let's find your Octopus publications."))
+_STEP2_FORM_BODY = _prerender(
+    _STEP2_FIELDS,
+    Button("Find my publications", type="submit", cls="contrast"),
+    loading_indicator("Looking up publications...", "loading"),
+)
+_STEP2_FORM_ATTRS = dict(hx_post="/validate_octopus", hx_target="#sync-panel", hx_swap="outerHTML", hx_indicator="#loading")
+_STEP2_DISCONNECT = _prerender(
+    P(A("Disconnect Bluesky", href="/disconnect_bluesky", hx_get="/disconnect_bluesky", hx_target="#sync-panel", cls="secondary")),
+)
+
+
+def step1_panel(csrf: FT) -> FT:
+    """Render Step 1: sign in with Bluesky / AT Proto."""
+    return Article(
+        _STEP1_INTRO,
+        Form(csrf, _STEP1_FORM_BODY, **_STEP1_FORM_ATTRS),  # csrf: CSRF protection
+        id="sync-panel",
+    )
+
+
+def step2_panel(csrf: FT, bsky_handle: str) -> FT:
+    """Render Step 2: connect an Octopus author profile."""
+    return Article(
+        _STEP2_HEADER,
+        P(f"Connected to Bluesky as @{bsky_handle}"),
+        _STEP2_INTRO,
+        Form(csrf, _STEP2_FORM_BODY, **_STEP2_FORM_ATTRS),  # csrf: CSRF protection
+        _STEP2_DISCONNECT,
+        id="sync-panel",
+    )
+
+
+_RESULTS_HEAD = "<thead><tr><th>Publication ID</th><th>Link</th></tr></thead>"
+
+
+def _result_row(result: SyncResult) -> str:
+    """Render one results-table row as an HTML string."""
+    return (
+        f"<tr><td>{escape(result.publication_id[:12])}...</td>"
+        f'<td><a href="{escape(result.web_url)}" target="_blank">View on pdsls</a></td></tr>'
+    )
+
+
+def results_table(results: list[SyncResult]) -> FT | None:
+    """Pre-rendered table of up to 10 sync results, or None when there are none."""
+    # Build the whole results table as one pre-rendered string
+    rows = "".join(_result_row(r) for r in results[:10])
+    return NotStr(f"<table>{_RESULTS_HEAD}<tbody>{rows}</tbody></table>") if rows else None
+
+
+def sync_results_panel(
+    csrf: FT, results: list[SyncResult], bsky_handle: str, autosync_token: str | None = None
+) -> FT:
+    """Render the sync_once results with the Step 4 auto-sync prompt.
+
+    ``autosync_token`` is the one-shot token that lets the auto-sync POST skip
+    re-validating the Bluesky credentials the sync just used.
+    """
+    # Step 4: Show success and prompt for auto-sync
+    return Article(
+        # Success header with checkmark
+        Header(
+            H3("✅ Synced ", Strong(f"{len(results)}"), " publications!"),
+            style="text-align: center;",
+        ),
+        P(
+            f"Your research is now live on @{bsky_handle}",
+            style="text-align: center; color: var(--pico-muted-color);",
+        ),
+        # Results table
+        results_table(results),
+        P(
+            Small(f"Showing {min(len(results), 10)} of {len(results)} publications"),
+            style="text-align: center;",
+        ) if len(results) > 10 else None,
+        Hr(),
+        # Step 4: Auto-sync CTA
+        H4("Step 4: Keep your publications in sync"),
+        P(
+            "Enable auto-sync to automatically publish future Octopus publications "
+            "to the atmosphere. We'll check for new publications every 7 days."
+        ),
+        Form(
+            csrf,  # CSRF protection
+            # Note: handle and password read from session, not form (security)
+            Input(type="hidden", name="action", value="auto_sync"),
+            Input(type="hidden", name="autosync_token", value=autosync_token) if autosync_token else None,
+            Button("Enable auto-sync", type="submit", cls="contrast", style="width: 100%;"),
+            loading_indicator("Setting up auto-sync...", "loading-autosync"),
+            hx_post="/setup_sync",
+            hx_target="#sync-panel",
+            hx_swap="outerHTML",
+            hx_indicator="#loading-autosync",
+        ),
+        P(
+            A("No thanks, I'm done", href="/"),
+            style="text-align: center; margin-top: 1rem;",
+        ),
+        id="sync-panel",
+    )
@@ -12,7 +12,7 @@ def _env(name: str, default: str | None = None) -> str | None:
     return value
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     octopus_api_url: str
     octopus_web_url: str
@@ -25,6 +25,7 @@ class Settings:
     atproto_pds_url: str = "https://bsky.social"
     session_secret: str | None = None
     sync_interval_days: int = 7
+    sync_concurrency: int = 6
     encryption_key: str | None = None
 
     @classmethod
@@ -52,6 +53,7 @@ class Settings:
             or "https://bsky.social",
             session_secret=_env("OCTOSPHERE_SESSION_SECRET"),
             sync_interval_days=int(_env("SYNC_INTERVAL_DAYS", "7") or "7"),
+            sync_concurrency=int(_env("SYNC_CONCURRENCY", "6") or "6"),
             encryption_key=_env("ENCRYPTION_KEY"),
         )
 
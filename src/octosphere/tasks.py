@@ -3,15 +3,32 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
-from octosphere.database import decrypt_password, users, synced_publications
+from atproto_identity.resolver import IdResolver
+
+from octosphere.database import decrypt_password, record_synced_publications, synced_publication_keys, users, users_due_for_sync
 from octosphere.atproto.client import AtprotoClient
-from octosphere.bridge import sync_publications
+from octosphere.bridge import DEFAULT_SYNC_CONCURRENCY, sync_publications
 from octosphere.octopus.client import OctopusClient
 
 logger = logging.getLogger(__name__)
 
+# Shared by every task's AtprotoClient so identity lookups reuse one resolver
+# (and its connections) instead of building a new one per user sync
+_id_resolver = IdResolver()
+
+_ISO_UTC = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _now_iso(delta: timedelta | None = None) -> str:
+    """Current UTC time (optionally shifted by delta) as an ISO-8601 'Z' string."""
+    now = datetime.now(timezone.utc)
+    if delta is not None:
+        now += delta
+    return now.strftime(_ISO_UTC)
+
 
 def get_sync_interval_days() -> int:
     """Get sync interval from env var, default 7 days."""
@@ -20,15 +37,16 @@ def get_sync_interval_days() -> int:
 
 def get_already_synced(orcid: str) -> set[tuple[str, str]]:
     """Get set of (publication_id, version_id) tuples already synced for a user."""
-    return {
-        (s.get("octopus_pub_id"), s.get("octopus_version_id"))
-        for s in synced_publications()
-        if s.get("orcid") == orcid
-    }
+    return synced_publication_keys(orcid)
 
 
-def task_sync_user(orcid: str) -> None:
-    """Sync publications for a single user (runs as background task)."""
+def task_sync_user(orcid: str, publications: list[dict[str, Any]] | None = None) -> None:
+    """Sync publications for a single user (runs as background task).
+
+    publications is the user's Octopus list if the caller fetched it moments
+    ago; otherwise it is fetched during the sync. A failed sync is logged and
+    re-raised, so callers decide whether to report it or swallow it.
+    """
     user = users[orcid]
     if not user or not user.get("active"):
         return
@@ -47,40 +65,34 @@ def task_sync_user(orcid: str) -> None:
             web_url=os.getenv("OCTOPUS_WEB_URL", ""),
             access_token=None,  # Public API doesn't need auth
         )
-        atproto = AtprotoClient(default_pds_url=os.getenv("ATPROTO_PDS_URL"))
+        atproto = AtprotoClient(default_pds_url=os.getenv("ATPROTO_PDS_URL"), resolver=_id_resolver)
         auth = atproto.create_session(user["bsky_handle"], password)
 
         # Get already synced publications to prevent duplicates
         already_synced = get_already_synced(orcid)
 
         # Use octopus_user_id (internal ID) not orcid
-        results = sync_publications(octopus, atproto, auth, octopus_user_id, already_synced=already_synced)
-
-        # Record synced publications
-        for r in results:
-            synced_publications.insert(
-                orcid=orcid,
-                octopus_pub_id=r.publication_id,
-                octopus_version_id=r.version_id,
-                at_uri=r.uri,
-            )
+        results = sync_publications(
+            octopus, atproto, auth, octopus_user_id,
+            already_synced=already_synced,
+            publications=publications,
+            max_workers=int(os.getenv("SYNC_CONCURRENCY") or DEFAULT_SYNC_CONCURRENCY),
+        )
 
-        # Update last sync time (with Z suffix to indicate UTC)
-        users.update({"orcid": orcid, "last_sync": datetime.utcnow().isoformat() + "Z"})
+        # Record synced publications and the last sync time (with Z suffix to
+        # indicate UTC) in one transaction
+        record_synced_publications(orcid, results, last_sync=_now_iso())
 
         logger.info(f"Synced {len(results)} new publications for user")
 
     except Exception as e:
-        # Log error but don't crash - this is a background task
         logger.error(f"Sync failed for user: {e}")
+        raise
 
 
 def get_users_needing_sync() -> list[dict]:
     """Get users who need syncing based on interval."""
     interval = get_sync_interval_days()
-    cutoff = (datetime.utcnow() - timedelta(days=interval)).isoformat()
-    
-    return [
-        u for u in users()
-        if u.get("active") and (not u.get("last_sync") or u["last_sync"] < cutoff)
-    ]
+    cutoff = _now_iso(-timedelta(days=interval))
+
+    return users_due_for_sync(cutoff)
@@ -114,9 +114,9 @@ class TestRunSyncInBackground:
     @patch('octosphere.app._octopus_client')
     @patch('octosphere.app._atproto_client')
     @patch('octosphere.app.sync_publications')
-    @patch('octosphere.app.synced_publications')
+    @patch('octosphere.app.record_synced_publications')
     def test_updates_status_to_complete_on_success(
-        self, mock_synced_pubs, mock_sync_pubs, mock_atproto, mock_octopus
+        self, mock_record, mock_sync_pubs, mock_atproto, mock_octopus
     ):
         """Test that successful sync updates status to complete."""
         from octosphere.app import _run_sync_in_background, _sync_status, _sync_lock
@@ -131,7 +131,6 @@ class TestRunSyncInBackground:
             SyncResult(publication_id="pub-1", version_id="v1", uri="at://did/nsid/rkey1", cid="cid1"),
         ]
         mock_sync_pubs.return_value = results
-        mock_synced_pubs.insert = MagicMock()
         
         # Clear status
         with _sync_lock:
@@ -154,6 +153,30 @@ class TestRunSyncInBackground:
             assert len(status["results"]) == 1
             # Cleanup
             _sync_status.clear()
+        mock_record.assert_called_once_with("test-orcid", results)
+
+    @patch('octosphere.app._bsky_login', return_value=(MagicMock(), MagicMock()))
+    @patch('octosphere.app._octopus_client')
+    @patch('octosphere.app.synced_publication_keys', return_value={("pub-1", "v1")})
+    @patch('octosphere.app.sync_publications', return_value=[])
+    @patch('octosphere.app.record_synced_publications')
+    def test_looks_up_already_synced_when_not_given(
+        self, mock_record, mock_sync_pubs, mock_keys, mock_octopus, mock_login
+    ):
+        """The duplicate check runs in the worker, not the request that queued it."""
+        from octosphere.app import _run_sync_in_background, _sync_status, _sync_lock
+
+        _run_sync_in_background(
+            orcid="test-orcid",
+            octopus_user_id="octopus-123",
+            bsky_handle="test.bsky.social",
+            bsky_password="test-password",
+        )
+
+        mock_keys.assert_called_once_with("test-orcid")
+        assert mock_sync_pubs.call_args.kwargs["already_synced"] == {("pub-1", "v1")}
+        with _sync_lock:
+            _sync_status.clear()
 
     @patch('octosphere.app._octopus_client')
     @patch('octosphere.app._atproto_client')
@@ -196,6 +219,585 @@ class TestRunSyncInBackground:
             _sync_status.clear()
 
 
+class TestRunManualSyncInBackground:
+    """Test the dashboard "Sync Now" background runner."""
+
+    @patch('octosphere.app.task_sync_user')
+    def test_marks_manual_sync_complete(self, mock_task):
+        """Test that a finished manual sync is reported with kind=manual."""
+        from octosphere.app import _run_manual_sync_in_background, _sync_status, _sync_lock
+
+        with _sync_lock:
+            _sync_status.clear()
+
+        _run_manual_sync_in_background("test-orcid", "test.bsky.social")
+
+        mock_task.assert_called_once_with("test-orcid")
+        with _sync_lock:
+            status = _sync_status.get("test-orcid")
+            assert status["status"] == "complete"
+            assert status["kind"] == "manual"
+            _sync_status.clear()
+
+    @patch('octosphere.app.task_sync_user')
+    def test_marks_manual_sync_error(self, mock_task):
+        """Test that an unexpected failure is surfaced to the polling UI."""
+        from octosphere.app import _run_manual_sync_in_background, _sync_status, _sync_lock
+
+        mock_task.side_effect = RuntimeError("Database locked")
+        with _sync_lock:
+            _sync_status.clear()
+
+        _run_manual_sync_in_background("test-orcid", "test.bsky.social")
+
+        with _sync_lock:
+            status = _sync_status.get("test-orcid")
+            assert status["status"] == "error"
+            assert "Database locked" in status["error"]
+            _sync_status.clear()
+
+    @patch("octosphere.tasks.AtprotoClient")
+    @patch("octosphere.tasks.decrypt_password", return_value="app-pass")
+    @patch("octosphere.tasks.users")
+    def test_failed_login_in_real_task_is_reported(self, mock_users, mock_decrypt, mock_atproto_class):
+        """A sync that fails inside task_sync_user is not reported as complete."""
+        from octosphere.app import _run_manual_sync_in_background, _sync_status, _sync_lock
+
+        mock_users.__getitem__.return_value = {
+            "orcid": "test-orcid", "bsky_handle": "test.bsky.social",
+            "encrypted_app_password": "enc", "octopus_user_id": "octo-1", "active": 1,
+        }
+        mock_atproto_class.return_value.create_session.side_effect = RuntimeError("Invalid app password")
+        with _sync_lock:
+            _sync_status.clear()
+
+        _run_manual_sync_in_background("test-orcid", "test.bsky.social")
+
+        with _sync_lock:
+            status = _sync_status.get("test-orcid")
+            assert status["status"] == "error"
+            assert "Invalid app password" in status["error"]
+            _sync_status.clear()
+
+    @patch('octosphere.app.task_sync_user', side_effect=RuntimeError("PDS down"))
+    def test_auto_sync_background_run_swallows_failures(self, mock_task):
+        """The post-enable sync runs after the response, so a failure must not escape."""
+        from octosphere.app import _run_auto_sync_in_background
+
+        _run_auto_sync_in_background("test-orcid", publications=[{}])
+
+        mock_task.assert_called_once_with("test-orcid", publications=[{}])
+
+
+class TestSyncStatusPanel:
+    """Tests for the sync status polling panel."""
+
+    def test_manual_completion_triggers_dashboard_refresh(self):
+        """Manual sync completion should signal the dashboard via HX-Trigger-After-Settle."""
+        from fasthtml.common import HttpHeader
+        from octosphere.app import _sync_status_panel, _sync_status, _sync_lock
+        from octosphere.orcid import OrcidProfile
+
+        with _sync_lock:
+            _sync_status["test-orcid"] = {"status": "complete", "kind": "manual", "results": [], "bsky_handle": ""}
+
+        resp = _sync_status_panel("test-orcid", {}, OrcidProfile(orcid="test-orcid", access_token="token"))
+
+        headers = [o for o in resp if isinstance(o, HttpHeader)]
+        assert [(h.k, h.v) for h in headers] == [("HX-Trigger-After-Settle", "sync-done")]
+        assert "test-orcid" not in _sync_status
+
+    def test_rejects_other_users_orcid(self):
+        from fasthtml.common import to_xml
+        from octosphere.app import _sync_status_panel
+        from octosphere.orcid import OrcidProfile
+
+        html = to_xml(_sync_status_panel("other-orcid", {}, OrcidProfile(orcid="test-orcid", access_token="token")))
+
+        assert "Unauthorized." in html
+
+    def test_keeps_streaming_while_syncing(self):
+        from fasthtml.common import to_xml
+        from octosphere.app import _sync_status_panel, _sync_status, _sync_lock
+        from octosphere.orcid import OrcidProfile
+
+        with _sync_lock:
+            _sync_status["test-orcid"] = {"status": "syncing", "bsky_handle": ""}
+        try:
+            html = to_xml(_sync_status_panel("test-orcid", {}, OrcidProfile(orcid="test-orcid", access_token="token")))
+        finally:
+            _sync_status.clear()
+
+        assert 'sse-connect="/sync_status/test-orcid/stream"' in html
+        assert 'hx-get="/sync_status/test-orcid"' in html
+        assert 'hx-trigger="sse:done"' in html
+
+    def test_shows_progress_once_reported(self):
+        from fasthtml.common import to_xml
+        from octosphere.app import _sync_status_panel, _sync_status, _sync_lock
+        from octosphere.orcid import OrcidProfile
+
+        with _sync_lock:
+            _sync_status["test-orcid"] = {"status": "syncing", "bsky_handle": "", "done": 3, "total": 8}
+        try:
+            html = to_xml(_sync_status_panel("test-orcid", {}, OrcidProfile(orcid="test-orcid", access_token="token")))
+        finally:
+            _sync_status.clear()
+
+        assert "Synced 3 of 8 publications..." in html
+        assert '<progress value="3" max="8">' in html
+        assert 'hx-get="/sync_status/test-orcid"' in html
+
+    def test_shows_rows_synced_so_far(self):
+        from fasthtml.common import to_xml
+        from octosphere.app import _sync_status_panel, _sync_status, _sync_lock
+        from octosphere.orcid import OrcidProfile
+
+        recent = [SyncResult(publication_id="pub-early", version_id="v1", uri="at://did/nsid/1", cid="c")]
+        with _sync_lock:
+            _sync_status["test-orcid"] = {"status": "syncing", "bsky_handle": "", "done": 1, "total": 8, "recent": recent}
+        try:
+            html = to_xml(_sync_status_panel("test-orcid", {}, OrcidProfile(orcid="test-orcid", access_token="token")))
+        finally:
+            _sync_status.clear()
+
+        assert "pub-early" in html
+        assert "https://pdsls.dev/at://did/nsid/1" in html
+
+
+class TestSyncProgressStream:
+    """Tests for the SSE stream behind the syncing panel."""
+
+    def test_pushes_progress_then_done(self):
+        import asyncio
+        from octosphere.app import _set_sync_status, _sync_progress_events, _sync_status, _sync_watchers
+
+        async def collect():
+            _set_sync_status("test-orcid", {"status": "syncing", "bsky_handle": ""})
+            events = _sync_progress_events("test-orcid")
+            frames = [await anext(events)]
+            # Updates from a worker thread wake the stream without polling
+            worker = threading.Thread(target=_set_sync_status, args=(
+                "test-orcid", {"status": "syncing", "bsky_handle": "", "done": 1, "total": 2},
+            ))
+            worker.start()
+            frames.append(await asyncio.wait_for(anext(events), timeout=2))
+            worker.join()
+            _set_sync_status("test-orcid", {"status": "complete", "results": [], "bsky_handle": ""})
+            frames.append(await asyncio.wait_for(anext(events), timeout=2))
+            frames.extend([e async for e in events])
+            return frames
+
+        try:
+            frames = asyncio.run(collect())
+        finally:
+            _sync_status.clear()
+
+        assert frames[0].startswith("event: progress\n") and "Syncing your publications" in frames[0]
+        assert "Synced 1 of 2 publications..." in frames[1]
+        assert frames[2:] == ["event: done\ndata: done\n\n"]
+        assert "test-orcid" not in _sync_watchers
+
+    def test_closes_when_no_sync_status_appears(self):
+        import asyncio
+        from octosphere.app import _sync_progress_events, _sync_status, _sync_watchers
+
+        async def collect():
+            return [e async for e in _sync_progress_events("test-orcid")]
+
+        _sync_status.clear()
+        with patch("octosphere.app._SYNC_STREAM_KEEPALIVE", 0.01):
+            frames = asyncio.run(asyncio.wait_for(collect(), timeout=2))
+
+        assert "Starting sync..." in frames[0]
+        assert frames[1:] == [": keepalive\n\n", "event: done\ndata: done\n\n"]
+        assert "test-orcid" not in _sync_watchers
+
+    def test_missing_status_renders_final_panel(self):
+        from fasthtml.common import to_xml
+        from octosphere.app import _sync_status, _sync_status_panel
+        from octosphere.orcid import OrcidProfile
+
+        _sync_status.clear()
+        html = to_xml(_sync_status_panel("test-orcid", {}, OrcidProfile(orcid="test-orcid", access_token="token")))
+
+        assert "No sync is running" in html
+        assert "sse-connect" not in html
+
+    def test_stream_rejects_other_users_orcid(self):
+        import asyncio
+        from octosphere.app import sync_status_stream
+        from octosphere.orcid import OrcidProfile
+
+        resp = asyncio.run(sync_status_stream("other-orcid", OrcidProfile(orcid="test-orcid", access_token="token")))
+
+        assert resp.status_code == 403
+
+class TestAutosyncToken:
+    """Tests for enabling auto-sync straight after a one-time sync."""
+
+    def _setup(self, token):
+        from octosphere.app import setup_sync
+        from octosphere.orcid import OrcidProfile
+
+        sess = {"octopus_user_id": "octo-1", "bsky_handle": "test.bsky.social"}
+        profile = OrcidProfile(orcid="test-orcid", access_token="token")
+        with patch("octosphere.app.verify_csrf_token", return_value=True), \
+             patch("octosphere.app._session_bsky_password", return_value="app-pw") as password, \
+             patch("octosphere.app._pub_cache") as pub_cache, \
+             patch("octosphere.app._bsky_login") as login, \
+             patch("octosphere.app._save_user") as save_user, \
+             patch("octosphere.app.set_user_active") as set_active:
+            pub_cache.get.return_value = []
+            setup_sync("auto_sync", sess, profile, csrf_token="x", autosync_token=token)
+        self.password = password
+        return login, save_user, set_active
+
+    def test_completed_sync_mints_token_for_its_user(self):
+        from octosphere.app import _sync_status_panel, _sync_status, _sync_lock, _autosync_tokens
+        from octosphere.orcid import OrcidProfile
+
+        with _sync_lock:
+            _sync_status["test-orcid"] = {"status": "complete", "results": [], "bsky_handle": "test.bsky.social"}
+        with patch("octosphere.app.sync_results_panel") as panel:
+            _sync_status_panel("test-orcid", {}, OrcidProfile(orcid="test-orcid", access_token="token"))
+
+        token = panel.call_args.kwargs["autosync_token"]
+        assert _autosync_tokens.get(token) == ("test-orcid", "test.bsky.social")
+        _autosync_tokens.clear()
+
+    def test_valid_token_skips_login_and_is_single_use(self):
+        from octosphere.app import _autosync_tokens
+
+        _autosync_tokens.set("tok", ("test-orcid", "test.bsky.social"))
+
+        login, save_user, set_active = self._setup("tok")
+        assert not login.called and not save_user.called
+        assert not self.password.called
+        set_active.assert_called_once_with("test-orcid", True)
+
+        login, save_user, _ = self._setup("tok")
+        assert login.called and save_user.called
+
+    def test_auto_sync_does_not_wait_on_octopus_for_count(self):
+        from starlette.background import BackgroundTask
+        from octosphere.app import setup_sync
+        from octosphere.orcid import OrcidProfile
+
+        sess = {"octopus_user_id": "octo-1", "bsky_handle": "test.bsky.social"}
+        with patch("octosphere.app.verify_csrf_token", return_value=True), \
+             patch("octosphere.app._session_bsky_password", return_value="app-pw"), \
+             patch("octosphere.app._pub_cache") as pub_cache, \
+             patch("octosphere.app._bsky_login"), \
+             patch("octosphere.app._save_user"), \
+             patch("octosphere.app._octopus_client") as octopus_client:
+            pub_cache.get.return_value = None
+            resp = setup_sync("auto_sync", sess, OrcidProfile(orcid="test-orcid", access_token="t"), csrf_token="x")
+
+        octopus_client.assert_not_called()
+        assert any(isinstance(o, BackgroundTask) for o in resp)
+
+    def test_auto_sync_hands_cached_publications_to_task(self):
+        from starlette.background import BackgroundTask
+        from octosphere.app import setup_sync
+        from octosphere.orcid import OrcidProfile
+
+        cached = [{"id": "pub-1"}, {"id": "pub-2"}]
+        sess = {"octopus_user_id": "octo-1", "bsky_handle": "test.bsky.social"}
+        with patch("octosphere.app.verify_csrf_token", return_value=True), \
+             patch("octosphere.app._session_bsky_password", return_value="app-pw"), \
+             patch("octosphere.app._pub_cache") as pub_cache, \
+             patch("octosphere.app._bsky_login"), \
+             patch("octosphere.app._save_user"):
+            pub_cache.get.return_value = cached
+            resp = setup_sync("auto_sync", sess, OrcidProfile(orcid="test-orcid", access_token="t"), csrf_token="x")
+
+        task = next(o for o in resp if isinstance(o, BackgroundTask))
+        assert task.kwargs == {"orcid": "test-orcid", "publications": cached}
+
+    def test_sync_once_fetches_publications_during_bluesky_login(self):
+        from fasthtml.common import to_xml
+        from octosphere.app import setup_sync
+        from octosphere.orcid import OrcidProfile
+
+        started = threading.Event()
+        octopus = MagicMock()
+
+        def get_publications(user_id):
+            started.set()
+            return []
+
+        def login(handle, password):
+            # Only succeeds if the publications request is already in flight
+            assert started.wait(timeout=2)
+
+        octopus.get_user_publications.side_effect = get_publications
+        sess = {"octopus_user_id": "octo-1", "bsky_handle": "test.bsky.social"}
+        with patch("octosphere.app.verify_csrf_token", return_value=True), \
+             patch("octosphere.app._session_bsky_password", return_value="app-pw"), \
+             patch("octosphere.app._pub_cache") as pub_cache, \
+             patch("octosphere.app._bsky_login", side_effect=login), \
+             patch("octosphere.app._save_user"), \
+             patch("octosphere.app._octopus_client", return_value=octopus):
+            pub_cache.get.return_value = None
+            resp = setup_sync("sync_once", sess, OrcidProfile(orcid="test-orcid", access_token="t"), csrf_token="x")
+
+        assert "Nothing to sync" in to_xml(resp)
+        octopus.get_user_publications.assert_called_once_with("octo-1")
+
+    def test_token_for_another_user_is_ignored(self):
+        from octosphere.app import _autosync_tokens
+
+        _autosync_tokens.set("tok", ("other-orcid", "test.bsky.social"))
+
+        login, save_user, set_active = self._setup("tok")
+
+        assert login.called and save_user.called
+        assert not set_active.called
+
+
+class TestSyncPanelDid:
+    """The dashboard panel never waits on handle -> DID resolution."""
+
+    def _render(self, user):
+        from octosphere.app import sync_panel
+
+        sess = {"orcid": {"orcid": "test-orcid", "access_token": "token"}}
+        with patch("octosphere.app.get_user_summary", return_value=user), \
+             patch("octosphere.app._id_resolver") as resolver:
+            resolver.handle.resolve.return_value = "did:plc:alice"
+            resp = sync_panel(sess, MagicMock(headers={}), MagicMock(orcid="test-orcid"))
+        return resp, resolver
+
+    def test_cache_miss_resolves_after_response(self):
+        from starlette.background import BackgroundTask
+        from octosphere.app import _handle_dids, _warm_handle_did
+
+        _handle_dids.clear()
+        resp, resolver = self._render({"active": 1, "bsky_handle": "alice.bsky.social", "last_sync": None})
+
+        resolver.handle.resolve.assert_not_called()
+        tasks = [o for o in resp if isinstance(o, BackgroundTask)]
+        assert len(tasks) == 1 and tasks[0].func is _warm_handle_did
+
+        with patch("octosphere.app._id_resolver") as resolver:
+            resolver.handle.resolve.return_value = "did:plc:alice"
+            _warm_handle_did("alice.bsky.social")
+        assert _handle_dids.get("alice.bsky.social") == "did:plc:alice"
+        _handle_dids.clear()
+
+    def test_cache_hit_links_pdsls(self):
+        from fasthtml.common import to_xml
+        from octosphere.app import _handle_dids
+
+        _handle_dids.set("alice.bsky.social", "did:plc:alice")
+        resp, _ = self._render({"active": 1, "bsky_handle": "alice.bsky.social", "last_sync": None})
+        _handle_dids.clear()
+
+        assert "pdsls.dev/at://did:plc:alice" in to_xml(resp)
+
+
+    def test_unchanged_dashboard_revalidates_to_304(self):
+        from fasthtml.common import HttpHeader
+        from octosphere.app import sync_panel, _handle_dids
+
+        sess = {"orcid": {"orcid": "test-orcid", "access_token": "token"}}
+        user = {"active": 1, "bsky_handle": "alice.bsky.social", "last_sync": "2026-01-01T00:00:00Z"}
+        _handle_dids.set("alice.bsky.social", "did:plc:alice")
+        profile = MagicMock(orcid="test-orcid")
+        with patch("octosphere.app.get_user_summary", return_value=user) as summary:
+            first = sync_panel(sess, MagicMock(headers={}, url="http://testserver/sync_panel"), profile)
+            etag = next(o.v for o in first if isinstance(o, HttpHeader) and o.k == "ETag")
+            req = MagicMock(headers={"if-none-match": etag}, url="http://testserver/sync_panel")
+
+            assert sync_panel(sess, req, profile).status_code == 304
+
+            summary.return_value = {**user, "last_sync": "2026-02-01T00:00:00Z"}
+            assert isinstance(sync_panel(sess, req, profile), tuple)
+        _handle_dids.clear()
+
+class TestValidateOctopus:
+    """Tests for the Step 2 Octopus lookup."""
+
+    def test_fetches_publications_while_verifying_user(self):
+        from fasthtml.common import to_xml
+        from octosphere.app import validate_octopus, _pub_cache
+        from octosphere.orcid import OrcidProfile
+
+        started = threading.Event()
+        octopus = MagicMock()
+
+        def get_publications(user_id):
+            started.set()
+            return [{"type": "HYPOTHESIS", "versions": [{"title": "Overlapping fetch"}]}]
+
+        def get_user_info(user_id):
+            # Only succeeds if the publications request is already in flight
+            return {"id": user_id} if started.wait(timeout=2) else {}
+
+        octopus.get_user_publications.side_effect = get_publications
+        octopus.get_user_info.side_effect = get_user_info
+        sess = {"bsky_handle": "test.bsky.social", "bsky_authenticated": True}
+
+        _pub_cache.clear()
+        with patch("octosphere.app.verify_csrf_token", return_value=True), \
+             patch("octosphere.app._octopus_author_known", return_value=False), \
+             patch("octosphere.app._octopus_client", return_value=octopus):
+            html = to_xml(validate_octopus(
+                "https://www.octopus.ac/authors/cl5smny4a000009ieqml45bhz",
+                sess, OrcidProfile(orcid="test-orcid", access_token="token"), csrf_token="x",
+            ))
+
+        assert "Overlapping fetch" in html
+        assert _pub_cache.get("cl5smny4a000009ieqml45bhz") is not None
+        _pub_cache.clear()
+
+    def test_seeds_dashboard_publication_count(self):
+        from octosphere.app import validate_octopus, _pub_cache, _pub_counts
+        from octosphere.orcid import OrcidProfile
+
+        octopus = MagicMock()
+        octopus.get_user_info.return_value = {"id": "octo"}
+        octopus.get_user_publications.return_value = [{}, {}, {}]
+        sess = {"bsky_handle": "test.bsky.social", "bsky_authenticated": True}
+
+        _pub_counts.clear()
+        with patch("octosphere.app.verify_csrf_token", return_value=True), \
+             patch("octosphere.app._octopus_author_known", return_value=False), \
+             patch("octosphere.app._octopus_client", return_value=octopus):
+            validate_octopus(
+                "https://www.octopus.ac/authors/cl5smny4a000009ieqml45bhz",
+                sess, OrcidProfile(orcid="test-orcid", access_token="token"), csrf_token="x",
+            )
+
+        assert _pub_counts.get("cl5smny4a000009ieqml45bhz") == 3
+        _pub_cache.clear()
+        _pub_counts.clear()
+
+    def test_known_author_skips_user_info(self):
+        from octosphere.app import validate_octopus, _pub_cache, _verified_authors
+        from octosphere.orcid import OrcidProfile
+
+        octopus = MagicMock()
+        octopus.get_user_publications.return_value = []
+        sess = {"bsky_handle": "test.bsky.social", "bsky_authenticated": True}
+
+        with patch("octosphere.app.verify_csrf_token", return_value=True), \
+             patch("octosphere.app.get_user_summary", return_value={"octopus_user_id": "cl5smny4a000009ieqml45bhz"}), \
+             patch("octosphere.app._octopus_client", return_value=octopus):
+            validate_octopus(
+                "https://www.octopus.ac/authors/cl5smny4a000009ieqml45bhz",
+                sess, OrcidProfile(orcid="test-orcid", access_token="token"), csrf_token="x",
+            )
+
+        octopus.get_user_info.assert_not_called()
+        octopus.get_user_publications.assert_called_once_with("cl5smny4a000009ieqml45bhz")
+        _pub_cache.clear()
+        _verified_authors.clear()
+
+    def test_verified_author_is_remembered(self):
+        from octosphere.app import _octopus_author_known, _verified_authors
+
+        _verified_authors.clear()
+        with patch("octosphere.app.get_user_summary", return_value=None):
+            assert not _octopus_author_known("test-orcid", "octo-1")
+            _verified_authors.set("octo-1", True)
+            assert _octopus_author_known("test-orcid", "octo-1")
+        _verified_authors.clear()
+
+
+class TestSaveUser:
+    """Tests for skipping no-op user upserts."""
+
+    def _existing(self, active=1):
+        from octosphere.database import encrypt_password
+        return {
+            "orcid": "test-orcid",
+            "bsky_handle": "test.bsky.social",
+            "encrypted_app_password": encrypt_password("app-pass"),
+            "octopus_user_id": "octo-1",
+            "active": active,
+        }
+
+    @patch("octosphere.app.upsert_user")
+    @patch("octosphere.app._get_user")
+    def test_skips_upsert_when_unchanged(self, mock_get_user, mock_upsert):
+        from octosphere.app import _save_user
+        mock_get_user.return_value = self._existing()
+
+        _save_user("test-orcid", "test.bsky.social", "app-pass", "octo-1", active=1)
+
+        mock_upsert.assert_not_called()
+
+    @patch("octosphere.app.upsert_user")
+    @patch("octosphere.app._get_user")
+    def test_upserts_when_changed(self, mock_get_user, mock_upsert):
+        from octosphere.app import _save_user
+        mock_get_user.return_value = self._existing(active=0)
+
+        _save_user("test-orcid", "test.bsky.social", "app-pass", "octo-1", active=1)
+
+        mock_upsert.assert_called_once()
+        assert mock_upsert.call_args.args[4] == 1
+
+    @patch("octosphere.app.encrypt_password")
+    @patch("octosphere.app.upsert_user")
+    @patch("octosphere.app._get_user", return_value=None)
+    def test_stores_session_ciphertext_without_reencrypting(self, mock_get_user, mock_upsert, mock_encrypt):
+        from octosphere.app import _save_user
+
+        _save_user("test-orcid", "test.bsky.social", "app-pass", "octo-1", active=1, encrypted_password="enc-token")
+
+        mock_encrypt.assert_not_called()
+        assert mock_upsert.call_args.args[2] == "enc-token"
+
+
+class TestSyncPanelStats:
+    """Tests for the deferred dashboard stats endpoint."""
+
+    @patch("octosphere.app.count_synced_publications", return_value=2)
+    @patch("octosphere.app._octopus_client")
+    @patch("octosphere.app.get_user_summary")
+    def test_caches_octopus_publication_count(self, mock_get_user, mock_octopus_client, mock_count):
+        from fasthtml.common import to_xml
+        from octosphere.app import sync_panel_stats, _pub_counts
+        from octosphere.orcid import OrcidProfile
+
+        _pub_counts.clear()
+        mock_get_user.return_value = {"orcid": "test-orcid", "octopus_user_id": "octo-1", "active": 1}
+        mock_octopus_client.return_value.get_user_publications.return_value = [{}, {}, {}, {}]
+        profile = OrcidProfile(orcid="test-orcid", access_token="token")
+
+        first = to_xml(sync_panel_stats(profile))
+        second = to_xml(sync_panel_stats(profile))
+
+        assert "2 of 4 publications synced" in first
+        assert first == second
+        mock_octopus_client.return_value.get_user_publications.assert_called_once_with("octo-1")
+        mock_count.assert_called_with("test-orcid")
+
+    @patch("octosphere.app.count_synced_publications", return_value=0)
+    @patch("octosphere.app._octopus_client")
+    @patch("octosphere.app.get_user_summary")
+    def test_failed_count_lookup_is_not_retried_immediately(self, mock_get_user, mock_octopus_client, mock_count):
+        from fasthtml.common import to_xml
+        from octosphere.app import sync_panel_stats, _pub_counts, _pub_count_failures
+        from octosphere.orcid import OrcidProfile
+
+        _pub_counts.clear()
+        _pub_count_failures.clear()
+        mock_get_user.return_value = {"orcid": "test-orcid", "octopus_user_id": "octo-1", "active": 1}
+        mock_octopus_client.return_value.get_user_publications.side_effect = RuntimeError("Octopus down")
+        profile = OrcidProfile(orcid="test-orcid", access_token="token")
+
+        first = to_xml(sync_panel_stats(profile))
+        second = to_xml(sync_panel_stats(profile))
+
+        assert first == second
+        mock_octopus_client.return_value.get_user_publications.assert_called_once_with("octo-1")
+        _pub_count_failures.clear()
+
+
 class TestSyncResultDataclass:
     """Test the SyncResult dataclass used in results."""
     
@@ -224,3 +826,607 @@ class TestSyncResultDataclass:
         
         assert result.uri is None
         assert result.cid is None
+
+
+class TestResponseCompression:
+    """Tests for gzip compression of larger responses."""
+
+    def test_large_responses_are_gzipped(self):
+        from starlette.testclient import TestClient
+        from octosphere.app import app
+
+        client = TestClient(app)
+        response = client.get(
+            "/lexicon/social.octosphere.publication.json",
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+
+
+class TestStaticCaching:
+    """Tests for cache headers on static and lexicon files."""
+
+    def test_static_files_send_cache_control(self):
+        from starlette.testclient import TestClient
+        from octosphere.app import app
+
+        response = TestClient(app).get("/favicon.ico")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=86400"
+
+    def test_lexicon_returns_304_for_matching_etag(self):
+        from starlette.testclient import TestClient
+        from octosphere.app import app
+
+        client = TestClient(app)
+        first = client.get("/lexicon/social.octosphere.publication.json")
+        second = client.get(
+            "/lexicon/social.octosphere.publication.json",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_static_files_honour_if_modified_since(self):
+        from starlette.testclient import TestClient
+        from octosphere.app import app
+
+        client = TestClient(app)
+        last_modified = client.get("/favicon.ico").headers["last-modified"]
+
+        assert client.get("/favicon.ico", headers={"If-Modified-Since": last_modified}).status_code == 304
+        assert client.get("/favicon.ico", headers={"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"}).status_code == 200
+        # A stale ETag wins over a matching date
+        assert client.get(
+            "/favicon.ico", headers={"If-Modified-Since": last_modified, "If-None-Match": 'W/"stale"'},
+        ).status_code == 200
+
+    def test_small_static_files_are_served_from_memory(self, tmp_path):
+        from starlette.testclient import TestClient
+        from octosphere.app import _STATIC_MEMORY_LIMIT, _load_static, app
+
+        (tmp_path / "logo.png").write_bytes(b"png")
+        (tmp_path / "big.bin").write_bytes(b"x" * (_STATIC_MEMORY_LIMIT + 1))
+        loaded = _load_static(tmp_path, frozenset({"logo.png", "big.bin"}))
+
+        assert set(loaded) == {"logo.png"}
+        assert loaded["logo.png"][0] == b"png" and loaded["logo.png"][3] == "image/png"
+
+        client = TestClient(app)
+        with patch("pathlib.Path.stat", side_effect=AssertionError("static file read from disk")):
+            first = client.get("/static/octosphere.png")
+            second = client.get("/static/octosphere.png", headers={"If-None-Match": first.headers["etag"]})
+
+        assert first.status_code == 200 and first.headers["content-type"] == "image/png"
+        assert second.status_code == 304
+
+    def test_missing_static_file_is_404(self):
+        from starlette.testclient import TestClient
+        from octosphere.app import app
+
+        assert TestClient(app).get("/static/missing.png").status_code == 404
+
+    def test_static_file_index_lists_files_relative_to_root(self, tmp_path):
+        from octosphere.app import _list_files
+
+        (tmp_path / "img").mkdir()
+        (tmp_path / "img" / "logo.png").write_bytes(b"png")
+        (tmp_path / "site.css").write_text("body {}")
+
+        assert _list_files(tmp_path) == frozenset({"img/logo.png", "site.css"})
+        assert _list_files(tmp_path / "missing") == frozenset()
+
+
+class TestPageChrome:
+    """Tests for the prebuilt navigation variants."""
+
+    def test_nav_variants_follow_login_state(self):
+        from fasthtml.common import Div, to_xml
+        from octosphere.app import _nav
+        from octosphere.orcid import OrcidProfile
+
+        anon = to_xml(Div(_nav(None)))
+        signed_in = to_xml(Div(_nav(OrcidProfile(orcid="test-orcid", access_token="token"))))
+
+        assert "/login" in anon and "/dashboard" not in anon
+        assert "/dashboard" in signed_in and "/logout" in signed_in
+
+    def test_pages_embed_prerendered_chrome(self):
+        from starlette.testclient import TestClient
+        from octosphere.app import app
+
+        html = TestClient(app).get("/feed").text
+
+        assert "<nav" in html and "Octosphere" in html
+        assert "AndreasThinks" in html
+        assert html.index("<nav") < html.index("Research Feed") < html.index("AndreasThinks")
+
+    def test_homepage_body_is_prerendered_per_login_state(self):
+        from octosphere.app import _HOME_ANON, _HOME_AUTH
+
+        anon, signed_in = str(_HOME_ANON), str(_HOME_AUTH)
+
+        assert "What is Octosphere?" in anon and "What is Octosphere?" in signed_in
+        assert 'href="/login"' in anon and "Go to Dashboard" not in anon
+        assert "Go to Dashboard" in signed_in and 'href="/login"' not in signed_in
+
+    def test_settings_error_page_reuses_prerendered_body(self):
+        import octosphere.app as app_module
+
+        body = app_module.NotStr("<article>prebuilt</article>")
+        with patch.object(app_module, "settings_error", "Missing ORCID_CLIENT_ID"), \
+             patch.object(app_module, "_SETTINGS_ERROR_BODY", body):
+            page = app_module.index(None, MagicMock(headers={}))
+
+        main = next(el for el in page if getattr(el, "tag", None) == "main")
+        assert main.children[0] is body
+
+    def test_homepage_revalidates_to_304(self):
+        from starlette.testclient import TestClient
+        from octosphere.app import app
+
+        client = TestClient(app)
+        first = client.get("/")
+        etag = first.headers["etag"]
+
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+        assert client.get("/", headers={"If-None-Match": etag, "HX-Request": "true"}).status_code == 200
+
+    def test_shared_head_elements_land_in_head(self):
+        from starlette.testclient import TestClient
+        from octosphere.app import app
+
+        html = TestClient(app).get("/feed").text
+        head = html[:html.index("</head>")]
+
+        assert 'name="color-scheme"' in head
+        assert "font-awesome" in head
+        assert "--octo-success" in head
+
+
+class TestProfileFromSession:
+    def test_reuses_profile_for_the_same_login(self):
+        from octosphere.app import _profile_from_session
+
+        sess = {"orcid": {"orcid": "test-orcid", "access_token": "token", "name": "A", "expires_at": 123.0}}
+
+        first = _profile_from_session(sess)
+
+        assert _profile_from_session(dict(sess)) is first
+        assert first.orcid == "test-orcid" and first.expires_at == 123.0
+
+    def test_new_token_builds_new_profile(self):
+        from octosphere.app import _profile_from_session
+
+        first = _profile_from_session({"orcid": {"orcid": "test-orcid", "access_token": "old"}})
+        second = _profile_from_session({"orcid": {"orcid": "test-orcid", "access_token": "new"}})
+
+        assert second is not first and second.access_token == "new"
+        assert _profile_from_session({}) is None
+
+    def test_logout_drops_cached_profile(self):
+        from octosphere.app import _profile_from_session, _profiles, logout
+
+        data = {"orcid": "test-orcid", "access_token": "secret-token", "expires_at": 456.0}
+        _profile_from_session({"orcid": data})
+
+        assert _profiles.get(("test-orcid", 456.0)).access_token == "secret-token"
+        assert all("secret-token" not in key for key in _profiles._data)
+
+        logout({"orcid": dict(data)})
+
+        assert _profiles.get(("test-orcid", 456.0)) is None
+
+
+class TestOrcidCallback:
+    def _callback(self, sess, state):
+        from fasthtml.common import to_xml
+        from octosphere.app import callback
+        from octosphere.orcid import OrcidProfile
+
+        with patch("octosphere.app._orcid_client") as client:
+            client.return_value.exchange_code.return_value = OrcidProfile(orcid="test-orcid", access_token="t")
+            resp = callback(code="code", state=state, sess=sess)
+        return resp, client
+
+    def test_rejects_mismatched_or_missing_state(self):
+        for sess in ({"orcid_state": "expected"}, {}):
+            resp, client = self._callback(sess, "forged")
+            assert "Invalid ORCID callback state." in str(resp)
+            client.return_value.exchange_code.assert_not_called()
+
+    def test_state_is_single_use(self):
+        sess = {"orcid_state": "expected"}
+
+        resp, _ = self._callback(sess, "expected")
+        assert resp.status_code == 303 and sess["orcid"]["orcid"] == "test-orcid"
+
+        resp, client = self._callback(sess, "expected")
+        client.return_value.exchange_code.assert_not_called()
+
+
+class TestStatusPanel:
+    def test_fixed_messages_share_one_panel(self):
+        from fasthtml.common import to_xml
+        from octosphere.app import _status_panel, _build_status_panel
+
+        first = _status_panel("Login with ORCID first.", "error")
+
+        assert _status_panel("Login with ORCID first.", "error") is first
+        assert to_xml(first) == to_xml(_build_status_panel("Login with ORCID first.", "error"))
+        assert "octo-status-error" in to_xml(first)
+
+
+class TestRoutes:
+    """Guards against handlers being registered twice."""
+
+    def test_each_path_is_registered_once(self):
+        from collections import Counter
+        from octosphere.app import app
+
+        counts = Counter(
+            (route.path, tuple(sorted(getattr(route, "methods", None) or ())))
+            for route in app.routes
+        )
+
+        assert [key for key, n in counts.items() if n > 1] == []
+
+
+class TestResolveDidHandle:
+    """Tests for cached DID -> handle resolution in the live feed."""
+
+    def test_caches_resolved_handle(self):
+        from octosphere.app import _resolve_did_handle, _handle_cache
+
+        _handle_cache.clear()
+        with patch("octosphere.app._id_resolver") as mock_resolver:
+            mock_resolver.did.resolve_atproto_data.return_value = MagicMock(handle="alice.bsky.social")
+
+            assert _resolve_did_handle("did:plc:alice") == "alice.bsky.social"
+            assert _resolve_did_handle("did:plc:alice") == "alice.bsky.social"
+
+        mock_resolver.did.resolve_atproto_data.assert_called_once_with("did:plc:alice")
+
+    def test_caches_failures_as_no_handle(self):
+        from octosphere.app import _resolve_did_handle, _handle_cache
+
+        _handle_cache.clear()
+        with patch("octosphere.app._id_resolver") as mock_resolver:
+            mock_resolver.did.resolve_atproto_data.side_effect = Exception("network down")
+
+            assert _resolve_did_handle("did:plc:bad") is None
+            assert _resolve_did_handle("did:plc:bad") is None
+
+        mock_resolver.did.resolve_atproto_data.assert_called_once()
+
+
+class TestJetstreamConsumer:
+    """Tests for the live Jetstream consumer."""
+
+    def test_yields_card_for_publication_create(self):
+        import asyncio
+        import json
+        from octosphere.app import jetstream_consumer
+        from octosphere.atproto.models import OCTOSPHERE_PUBLICATION_NSID
+
+        messages = [
+            json.dumps({"kind": "identity", "did": "did:plc:other"}),
+            json.dumps({
+                "kind": "commit",
+                "did": "did:plc:alice",
+                "commit": {
+                    "operation": "create",
+                    "collection": OCTOSPHERE_PUBLICATION_NSID,
+                    "record": {"title": "Live Paper", "createdAt": "2024-01-01T00:00:00Z"},
+                },
+            }),
+        ]
+
+        class FakeSocket:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __aiter__(self):
+                return self._iter()
+
+            async def _iter(self):
+                for m in messages:
+                    yield m
+
+            async def close(self):
+                pass
+
+        async def first_event():
+            agen = jetstream_consumer()
+            try:
+                return await agen.__anext__()
+            finally:
+                await agen.aclose()
+
+        with patch("octosphere.app.websockets.connect", return_value=FakeSocket()) as mock_connect, \
+                patch("octosphere.app._resolve_did_handle", return_value="alice.bsky.social"):
+            event = asyncio.run(first_event())
+
+        assert "Live Paper" in event
+        assert "alice.bsky.social" in event
+        assert mock_connect.call_args.kwargs["ping_interval"] == 20
+
+
+class TestFeedBroadcast:
+    """Tests for fanning one Jetstream connection out to many feed clients."""
+
+    def test_each_subscriber_receives_every_event(self):
+        import asyncio
+        import octosphere.app as app_module
+
+        started = 0
+
+        async def fake_consumer():
+            nonlocal started
+            started += 1
+            # Wait until both clients are subscribed before publishing
+            while len(app_module._feed_subscribers) < 2:
+                await asyncio.sleep(0)
+            yield "event: message\ndata: one\n\n"
+            yield "event: message\ndata: two\n\n"
+
+        async def take_two():
+            return [event async for event in app_module.feed_subscription()]
+
+        async def run():
+            return await asyncio.gather(take_two(), take_two())
+
+        with patch("octosphere.app.jetstream_consumer", fake_consumer):
+            first, second = asyncio.run(run())
+
+        expected = [b"event: message\ndata: one\n\n", b"event: message\ndata: two\n\n"]
+        assert first == expected
+        assert second == expected
+        assert started == 1
+        assert app_module._feed_subscribers == set()
+
+    def test_full_queue_drops_oldest_event(self):
+        import asyncio
+        import octosphere.app as app_module
+
+        queue = asyncio.Queue(maxsize=2)
+        dropped = app_module._feed_dropped
+
+        for payload in (b"one", b"two", b"three"):
+            app_module._enqueue_latest(queue, payload)
+
+        assert [queue.get_nowait(), queue.get_nowait()] == [b"two", b"three"]
+        assert app_module._feed_dropped == dropped + 1
+
+
+class TestFormatTimestamp:
+    """Tests for feed/dashboard timestamp formatting."""
+
+    def test_matches_strftime_output(self):
+        from datetime import datetime
+        from octosphere.app import _format_timestamp
+
+        value = "2024-03-05T09:07:00Z"
+        expected = datetime.fromisoformat(value).strftime("%b %d, %Y at %H:%M")
+
+        assert _format_timestamp(value) == expected == "Mar 05, 2024 at 09:07"
+
+    def test_returns_unparseable_input_unchanged(self):
+        from octosphere.app import _format_timestamp
+
+        assert _format_timestamp("yesterday") == "yesterday"
+
+
+class TestTruncate:
+    def test_leaves_short_text_alone(self):
+        from octosphere.app import _truncate
+
+        assert _truncate("short", 10) == "short"
+        assert _truncate("exactly10!", 10) == "exactly10!"
+
+    def test_cuts_long_text_to_limit(self):
+        from octosphere.app import _truncate
+
+        result = _truncate("a" * 20, 10)
+
+        assert result == "a" * 9 + "…"
+        assert len(result) == 10
+
+
+class TestSessionBlueskyPassword:
+    """Tests for keeping the onboarding app password encrypted in the session."""
+
+    def test_roundtrips_encrypted_password(self):
+        from octosphere.app import _session_bsky_password
+        from octosphere.database import encrypt_password
+
+        sess = {"bsky_app_password_enc": encrypt_password("app-pass")}
+
+        assert _session_bsky_password(sess) == "app-pass"
+        assert "app-pass" not in sess["bsky_app_password_enc"]
+
+    def test_invalid_token_reads_as_missing(self):
+        from octosphere.app import _session_bsky_password
+
+        assert _session_bsky_password({"bsky_app_password_enc": "not-a-token"}) is None
+        assert _session_bsky_password({}) is None
+
+    def test_clear_removes_legacy_plaintext_key(self):
+        from octosphere.app import _clear_bluesky_session
+
+        sess = {"orcid": {}, "bsky_handle": "h", "bsky_app_password": "p", "bsky_app_password_enc": "e", "bsky_authenticated": True}
+
+        _clear_bluesky_session(sess)
+
+        assert sess == {"orcid": {}}
+
+
+class TestLexiconCompression:
+    """Tests for serving precompressed lexicon schemas."""
+
+    def test_serves_precompressed_gzip(self):
+        import json
+        from starlette.testclient import TestClient
+        from octosphere.app import app, _LEXICONS
+
+        response = TestClient(app).get(
+            "/lexicon/social.octosphere.publication.json",
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        raw, _, etag = _LEXICONS["social.octosphere.publication.json"]
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == etag
+        assert response.content == raw  # client transparently decompresses
+        assert json.loads(response.content)["id"]
+
+    def test_serves_identity_without_gzip_support(self):
+        from starlette.testclient import TestClient
+        from octosphere.app import app
+
+        response = TestClient(app).get(
+            "/lexicon/social.octosphere.publication.json",
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-type"].startswith("application/json")
+
+
+class TestClientFactories:
+    """Tests for reusing API clients across requests."""
+
+    @pytest.fixture(autouse=True)
+    def configured(self):
+        from octosphere.app import _anonymous_octopus_client, _orcid_client, _public_atproto_client
+
+        settings = MagicMock(octopus_api_url="https://api.octopus.test", octopus_web_url="https://octopus.test")
+        with patch("octosphere.app.settings", settings):
+            yield
+        for factory in (_orcid_client, _anonymous_octopus_client, _public_atproto_client):
+            factory.cache_clear()
+
+    def test_orcid_and_anonymous_octopus_clients_are_shared(self):
+        from octosphere.app import _octopus_client, _orcid_client
+
+        assert _orcid_client() is _orcid_client()
+        assert _octopus_client() is _octopus_client()
+
+    def test_authenticated_clients_are_per_call(self):
+        from octosphere.app import _atproto_client, _id_resolver, _octopus_client
+        from octosphere.orcid import OrcidProfile
+
+        profile = OrcidProfile(orcid="0000-0001-2345-6789", access_token="token")
+        octopus = _octopus_client(profile)
+        first, second = _atproto_client(), _atproto_client()
+
+        assert octopus is not _octopus_client(profile)
+        assert octopus.access_token == "token"
+        assert first is not second
+        assert first._resolver is second._resolver is _id_resolver
+
+
+class TestRequireLogin:
+    """Tests for resolving the ORCID login from the session."""
+
+    def test_returns_profile_for_live_token(self):
+        from octosphere.app import _require_login
+
+        sess = {"orcid": {"orcid": "0000-0001-2345-6789", "access_token": "token", "expires_at": time.time() + 3600}}
+
+        profile = _require_login(sess)
+
+        assert profile.orcid == "0000-0001-2345-6789"
+
+    def test_expired_token_logs_out_without_upstream_call(self):
+        from octosphere.app import _require_login
+
+        sess = {"orcid": {"orcid": "0000-0001-2345-6789", "access_token": "token", "expires_at": time.time() + 30}}
+
+        assert _require_login(sess) is None
+        assert "orcid" not in sess
+
+    def test_sessions_without_expiry_stay_valid(self):
+        from octosphere.app import _require_login
+
+        sess = {"orcid": {"orcid": "0000-0001-2345-6789", "access_token": "token"}}
+
+        assert _require_login(sess) is not None
+
+
+    def test_auth_before_runs_on_the_event_loop(self):
+        import asyncio
+        from octosphere.app import auth_before
+
+        private = MagicMock(scope={}, url=MagicMock(path="/dashboard"))
+        public = MagicMock(scope={}, url=MagicMock(path="/feed/stream"))
+
+        assert asyncio.iscoroutinefunction(auth_before)
+        assert asyncio.run(auth_before(private, {})).status_code == 303
+        assert asyncio.run(auth_before(public, {})) is None
+
+    def test_assets_skip_auth_beforeware(self):
+        import re
+        from octosphere.app import bware
+
+        for path in ("/static/octosphere.css", "/favicon.ico", "/lexicon/social/octosphere/publication.json"):
+            assert any(re.fullmatch(r, path) for r in bware.skip)
+        assert not any(re.fullmatch(r, "/") for r in bware.skip)
+
+class TestBskyLogin:
+    """Tests for reusing Bluesky sessions across onboarding and sync."""
+
+    @pytest.fixture(autouse=True)
+    def clear_sessions(self):
+        from octosphere.app import _bsky_sessions
+
+        _bsky_sessions.clear()
+        yield
+        _bsky_sessions.clear()
+
+    @patch("octosphere.app._atproto_client")
+    def test_resumes_session_for_same_credentials(self, mock_atproto):
+        from octosphere.app import _bsky_login
+
+        client = mock_atproto.return_value
+        client.export_session.return_value = "session-string"
+        client.create_session.return_value.pds_endpoint = "https://pds.example.com"
+
+        _bsky_login("test.bsky.social", "app-pass")
+        _, auth = _bsky_login("Test.bsky.social", "app-pass")
+
+        client.create_session.assert_called_once_with("test.bsky.social", "app-pass")
+        client.restore_session.assert_called_once_with("session-string", "https://pds.example.com")
+        assert auth is client.restore_session.return_value
+
+    @patch("octosphere.app._atproto_client")
+    def test_different_password_logs_in_again(self, mock_atproto):
+        from octosphere.app import _bsky_login
+
+        client = mock_atproto.return_value
+        _bsky_login("test.bsky.social", "app-pass")
+        client.create_session.side_effect = RuntimeError("AuthenticationRequired")
+
+        with pytest.raises(RuntimeError):
+            _bsky_login("test.bsky.social", "wrong-pass")
+        client.restore_session.assert_not_called()
+
+    @patch("octosphere.app._atproto_client")
+    def test_falls_back_to_password_when_resume_fails(self, mock_atproto):
+        from octosphere.app import _bsky_login
+
+        client = mock_atproto.return_value
+        _bsky_login("test.bsky.social", "app-pass")
+        client.restore_session.side_effect = RuntimeError("ExpiredToken")
+
+        _bsky_login("test.bsky.social", "app-pass")
+
+        assert client.create_session.call_count == 2
@@ -128,6 +128,29 @@ class TestAtprotoClient:
         assert auth.handle == "test.bsky.social"
         mock_client.login.assert_called_once_with("test.bsky.social", "password")
 
+    @patch("octosphere.atproto.client.Client")
+    @patch("octosphere.atproto.client.IdResolver")
+    def test_restore_session_skips_password_login(self, mock_resolver_class, mock_client_class):
+        """Test resuming an exported session on its PDS without resolving the handle."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        mock_profile = MagicMock()
+        mock_profile.did = "did:plc:test"
+        mock_profile.handle = "test.bsky.social"
+        mock_client.login.return_value = mock_profile
+        mock_client._session.access_jwt = "token"
+        mock_client._session.refresh_jwt = "refresh"
+        
+        client = AtprotoClient()
+        auth = client.restore_session("session-string", "https://test.pds.com")
+        
+        assert auth.did == "did:plc:test"
+        assert auth.pds_endpoint == "https://test.pds.com"
+        mock_client_class.assert_called_once()
+        assert mock_client_class.call_args.kwargs["base_url"] == "https://test.pds.com"
+        mock_client.login.assert_called_once_with(session_string="session-string")
+        mock_resolver_class.return_value.handle.resolve.assert_not_called()
+
     def test_create_publication_record_requires_login(self):
         """Test that create_publication_record raises without login."""
         client = AtprotoClient()
@@ -226,6 +249,63 @@ class TestAtprotoClient:
             client.delete_record(auth, "at://did:plc:test/collection")  # Missing rkey
 
 
+    def test_list_records_public_uses_shared_pool(self):
+        """Unauthenticated reads go through the module's keep-alive client."""
+        from octosphere.atproto import client as client_module
+
+        resolver = MagicMock()
+        resolver.did.resolve.return_value = MagicMock(pds_endpoint="https://pds.example.com/")
+        record = {"uri": "at://did:plc:abc/x/1", "cid": "bafy", "value": {"title": "T"}}
+        with patch.object(client_module, "_http") as mock_http:
+            mock_http.get.return_value.json.return_value = {"records": [record]}
+            client = AtprotoClient(resolver=resolver)
+            other = AtprotoClient(resolver=resolver)
+
+            records = client.list_records_public("did:plc:abc", limit=5)
+
+        assert other._http is client._http
+        assert records == [record]
+        mock_http.get.assert_called_once_with(
+            "https://pds.example.com/xrpc/com.atproto.repo.listRecords",
+            params={"repo": "did:plc:abc", "collection": OCTOSPHERE_PUBLICATION_NSID, "limit": 5},
+        )
+
+    def test_sdk_clients_share_one_pool_but_not_headers(self):
+        """Requests from every SDK Client go through one transport with their own auth headers."""
+        import httpx
+        from octosphere.atproto.client import _sdk_client, _xrpc_transport
+
+        sent = []
+
+        def handle(request):
+            sent.append(request)
+            return httpx.Response(200, json={}, request=request)
+
+        first = _sdk_client("https://pds-a.example.com")
+        second = _sdk_client("https://pds-b.example.com")
+        first.request.add_additional_header("Authorization", "Bearer a")
+
+        with patch.object(_xrpc_transport, "handle_request", side_effect=handle):
+            first.request.get("https://pds-a.example.com/xrpc/com.atproto.server.getSession")
+            second.request.get("https://pds-b.example.com/xrpc/com.atproto.server.getSession")
+            first.request.close()
+            second.request.get("https://pds-b.example.com/xrpc/com.atproto.server.getSession")
+
+        assert [r.url.host for r in sent] == ["pds-a.example.com", "pds-b.example.com", "pds-b.example.com"]
+        assert sent[0].headers["Authorization"] == "Bearer a"
+        assert "Authorization" not in sent[1].headers
+
+    def test_shared_pool_does_not_store_cookies(self):
+        import httpx
+        from octosphere.atproto.client import _http
+
+        request = httpx.Request("GET", "https://pds.example.com/xrpc/com.atproto.repo.listRecords")
+        response = httpx.Response(200, headers={"Set-Cookie": "sid=secret; Path=/"}, request=request)
+        _http.cookies.extract_cookies(response)
+
+        assert len(_http.cookies) == 0
+
+
 class TestOctosphereNSID:
     def test_nsid_value(self):
         """Test that the NSID constant is correct."""
@@ -10,6 +10,7 @@ from octosphere.bridge import (
     _publication_type,
     _peer_review_of,
     SyncResult,
+    sync_publications,
 )
 from octosphere.octopus.client import OctopusPublication
 
@@ -178,3 +179,87 @@ class TestSyncResult:
         assert result.version_id == "ver-1"
         assert result.uri == "at://did:plc:xxx/social.octosphere.publication/abc"
         assert result.cid == "bafyrei..."
+
+    def test_web_url_derived_from_uri(self):
+        result = SyncResult(publication_id="pub-1", version_id="ver-1", uri="at://did:plc:xxx/nsid/abc", cid="c")
+        missing = SyncResult(publication_id="pub-2", version_id="ver-1", uri=None, cid=None)
+
+        assert result.web_url == "https://pdsls.dev/at://did:plc:xxx/nsid/abc"
+        assert missing.web_url == "#"
+        assert not hasattr(result, "__dict__")
+
+
+class TestSyncPublications:
+    def test_uses_prefetched_publications(self):
+        octopus = MagicMock()
+        octopus.map_publication.return_value = OctopusPublication(
+            publication={"id": "pub-1"}, version={"id": "ver-1"}, linked_to=[], linked_from=[]
+        )
+        octopus.get_publication_chain.return_value = {"versions": []}
+        atproto = MagicMock()
+        
+        with patch("octosphere.bridge.build_record", return_value={}):
+            results = sync_publications(
+                octopus, atproto, MagicMock(), "user-1", publications=[{"id": "pub-1"}]
+            )
+        
+        octopus.get_user_publications.assert_not_called()
+        assert [r.publication_id for r in results] == ["pub-1"]
+
+    def test_reports_progress_for_synced_and_skipped(self):
+        octopus = MagicMock()
+        octopus.map_publication.side_effect = lambda item: OctopusPublication(
+            publication=item, version={"id": "ver-1"}, linked_to=[], linked_from=[]
+        )
+        octopus.get_publication_chain.return_value = {"versions": []}
+        progress = []
+        
+        with patch("octosphere.bridge.build_record", return_value={}):
+            sync_publications(
+                octopus, MagicMock(), MagicMock(), "user-1",
+                already_synced={("pub-1", "ver-1")},
+                publications=[{"id": "pub-1"}, {"id": "pub-2"}],
+                on_progress=lambda done, total: progress.append((done, total)),
+            )
+        
+        assert progress == [(1, 2), (2, 2)]
+
+    def test_reports_each_new_result_before_its_progress(self):
+        octopus = MagicMock()
+        octopus.map_publication.side_effect = lambda item: OctopusPublication(
+            publication=item, version={"id": "ver-1"}, linked_to=[], linked_from=[]
+        )
+        octopus.get_publication_chain.return_value = {"versions": []}
+        events = []
+        
+        with patch("octosphere.bridge.build_record", return_value={}):
+            sync_publications(
+                octopus, MagicMock(), MagicMock(), "user-1",
+                already_synced={("pub-1", "ver-1")},
+                publications=[{"id": "pub-1"}, {"id": "pub-2"}],
+                on_progress=lambda done, total: events.append(("progress", done)),
+                on_result=lambda result: events.append(("result", result.publication_id)),
+                max_workers=1,
+            )
+        
+        assert events == [("progress", 1), ("result", "pub-2"), ("progress", 2)]
+
+    def test_concurrent_posts_keep_publication_order(self):
+        octopus = MagicMock()
+        octopus.map_publication.side_effect = lambda item: OctopusPublication(
+            publication=item, version={"id": "ver-1"}, linked_to=[], linked_from=[]
+        )
+        octopus.get_publication_chain.return_value = {"versions": []}
+        publications = [{"id": f"pub-{i}"} for i in range(10)]
+        
+        with patch("octosphere.bridge.build_record", return_value={}):
+            results = sync_publications(
+                octopus, MagicMock(), MagicMock(), "user-1",
+                already_synced={("pub-3", "ver-1")},
+                publications=publications,
+                max_workers=4,
+            )
+        
+        assert [r.publication_id for r in results] == [
+            f"pub-{i}" for i in range(10) if i != 3
+        ]
@@ -0,0 +1,38 @@
+"""Tests for cache.py - in-process TTL cache."""
+from unittest.mock import patch
+
+from octosphere.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_returns_value_before_expiry(self):
+        cache = TTLCache(ttl=60)
+        cache.set("key", [1, 2, 3])
+
+        assert cache.get("key") == [1, 2, 3]
+
+    def test_returns_default_after_expiry(self):
+        cache = TTLCache(ttl=60)
+        with patch("octosphere.cache.time.monotonic", return_value=1000.0):
+            cache.set("key", "value")
+        with patch("octosphere.cache.time.monotonic", return_value=1061.0):
+            assert cache.get("key", "missing") == "missing"
+
+        assert len(cache) == 0
+
+    def test_evicts_oldest_entry_at_maxsize(self):
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_pop_removes_entry(self):
+        cache = TTLCache(ttl=60)
+        cache.set("key", "value")
+
+        assert cache.pop("key") == "value"
+        assert cache.get("key") is None
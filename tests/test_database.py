@@ -46,6 +46,16 @@ class TestEncryption:
         # Fernet includes timestamp and IV, so same input = different output
         assert encrypted1 != encrypted2
 
+    def test_fernet_is_reused_for_the_same_key(self, monkeypatch):
+        """Test that the Fernet instance is built once per key."""
+        from octosphere.database import get_fernet
+
+        assert get_fernet() is get_fernet()
+
+        monkeypatch.setenv("ENCRYPTION_KEY", Fernet.generate_key().decode())
+        rotated = get_fernet()
+        assert rotated is get_fernet()
+
     def test_missing_encryption_key_raises_error(self, monkeypatch):
         """Test that missing ENCRYPTION_KEY raises RuntimeError."""
         monkeypatch.delenv("ENCRYPTION_KEY", raising=False)
@@ -55,3 +65,268 @@ class TestEncryption:
         
         with pytest.raises(RuntimeError, match="ENCRYPTION_KEY"):
             get_fernet()
+
+
+class TestSyncQueries:
+    @pytest.fixture
+    def memory_db(self, monkeypatch):
+        """Swap the module database for an in-memory one with the app schema."""
+        from fastlite import database
+        import octosphere.database as database_module
+
+        mem = database(":memory:")
+        mem.execute(
+            "CREATE TABLE users (orcid TEXT PRIMARY KEY, last_sync TEXT, "
+            "active INTEGER DEFAULT 1, encrypted_app_password TEXT)"
+        )
+        mem.execute(
+            "CREATE TABLE synced_publications (id INTEGER PRIMARY KEY, orcid TEXT, "
+            "octopus_pub_id TEXT, octopus_version_id TEXT, at_uri TEXT, "
+            "UNIQUE(orcid, octopus_pub_id, octopus_version_id))"
+        )
+        monkeypatch.setattr(database_module, "db", mem)
+        monkeypatch.setattr(database_module, "_reader", lambda: mem)
+        return mem
+
+    def test_count_synced_publications_filters_by_orcid(self, memory_db):
+        from octosphere.database import count_synced_publications
+
+        for orcid, pub in [("a", "p1"), ("a", "p2"), ("b", "p3")]:
+            memory_db.execute(
+                "INSERT INTO synced_publications (orcid, octopus_pub_id) VALUES (?, ?)", (orcid, pub)
+            )
+
+        assert count_synced_publications("a") == 2
+        assert count_synced_publications("missing") == 0
+
+    def test_synced_publication_keys_filters_by_orcid(self, memory_db):
+        from octosphere.database import synced_publication_keys
+
+        memory_db.execute(
+            "INSERT INTO synced_publications (orcid, octopus_pub_id, octopus_version_id) "
+            "VALUES ('a', 'p1', 'v1'), ('a', 'p1', 'v2'), ('b', 'p2', 'v1')"
+        )
+
+        assert synced_publication_keys("a") == {("p1", "v1"), ("p1", "v2")}
+        assert synced_publication_keys("missing") == set()
+
+    def test_record_synced_publications_inserts_batch(self, memory_db):
+        from octosphere.bridge import SyncResult
+        from octosphere.database import record_synced_publications
+
+        results = [
+            SyncResult(publication_id=f"pub-{i}", version_id="v1", uri=f"at://did/nsid/{i}", cid="cid")
+            for i in range(3)
+        ]
+
+        record_synced_publications("a", results)
+        record_synced_publications("a", [])
+
+        rows = memory_db.q("SELECT orcid, octopus_pub_id, at_uri FROM synced_publications ORDER BY id")
+        assert [r["octopus_pub_id"] for r in rows] == ["pub-0", "pub-1", "pub-2"]
+        assert rows[2] == {"orcid": "a", "octopus_pub_id": "pub-2", "at_uri": "at://did/nsid/2"}
+
+    def test_record_synced_publications_ignores_already_recorded(self, memory_db):
+        from octosphere.bridge import SyncResult
+        from octosphere.database import record_synced_publications
+
+        first = SyncResult(publication_id="pub-1", version_id="v1", uri="at://did/nsid/1", cid="cid")
+        second = SyncResult(publication_id="pub-2", version_id="v1", uri="at://did/nsid/2", cid="cid")
+
+        record_synced_publications("a", [first])
+        record_synced_publications("a", [first, second])
+
+        rows = memory_db.q("SELECT octopus_pub_id FROM synced_publications ORDER BY id")
+        assert [r["octopus_pub_id"] for r in rows] == ["pub-1", "pub-2"]
+
+    def test_record_synced_publications_sets_last_sync(self, memory_db):
+        from octosphere.bridge import SyncResult
+        from octosphere.database import record_synced_publications
+
+        memory_db.execute("INSERT INTO users (orcid) VALUES ('a'), ('b')")
+        result = SyncResult(publication_id="pub-1", version_id="v1", uri="at://did/nsid/1", cid="cid")
+
+        record_synced_publications("a", [result], last_sync="2024-01-01T00:00:00Z")
+        record_synced_publications("b", [], last_sync="2024-02-01T00:00:00Z")
+
+        rows = {r["orcid"]: r["last_sync"] for r in memory_db.q("SELECT orcid, last_sync FROM users")}
+        assert rows == {"a": "2024-01-01T00:00:00Z", "b": "2024-02-01T00:00:00Z"}
+        assert memory_db.q("SELECT COUNT(*) AS n FROM synced_publications")[0]["n"] == 1
+
+    def test_delete_synced_publications_only_removes_that_user(self, memory_db):
+        from octosphere.database import delete_synced_publications
+
+        memory_db.execute(
+            "INSERT INTO synced_publications (orcid, octopus_pub_id, octopus_version_id) "
+            "VALUES ('a', 'p1', 'v1'), ('a', 'p2', 'v1'), ('b', 'p1', 'v1')"
+        )
+
+        delete_synced_publications("a")
+
+        rows = memory_db.q("SELECT orcid FROM synced_publications")
+        assert rows == [{"orcid": "b"}]
+
+    def test_bluesky_handles_are_distinct_and_non_empty(self, memory_db):
+        from octosphere.database import bluesky_handles
+
+        memory_db.execute("ALTER TABLE users ADD COLUMN bsky_handle TEXT")
+        memory_db.execute(
+            "INSERT INTO users (orcid, bsky_handle) VALUES "
+            "('a', 'x.bsky.social'), ('b', 'x.bsky.social'), ('c', ''), ('d', NULL), ('e', 'y.bsky.social')"
+        )
+
+        assert sorted(bluesky_handles()) == ["x.bsky.social", "y.bsky.social"]
+
+    def test_get_user_summary_omits_password(self, memory_db):
+        from octosphere.database import get_user_summary
+
+        memory_db.execute("ALTER TABLE users ADD COLUMN bsky_handle TEXT")
+        memory_db.execute("ALTER TABLE users ADD COLUMN octopus_user_id TEXT")
+        memory_db.execute(
+            "INSERT INTO users (orcid, bsky_handle, octopus_user_id, active, encrypted_app_password) "
+            "VALUES ('a', 'x.bsky.social', 'octo-1', 1, 'secret')"
+        )
+
+        summary = get_user_summary("a")
+
+        assert summary == {
+            "orcid": "a", "bsky_handle": "x.bsky.social", "octopus_user_id": "octo-1",
+            "active": 1, "last_sync": None,
+        }
+        assert get_user_summary("missing") is None
+
+    def test_upsert_user_inserts_then_updates(self, memory_db):
+        from octosphere.database import upsert_user
+
+        memory_db.execute("ALTER TABLE users ADD COLUMN bsky_handle TEXT")
+        memory_db.execute("ALTER TABLE users ADD COLUMN octopus_user_id TEXT")
+        memory_db.execute("INSERT INTO users (orcid, last_sync) VALUES ('a', '2024-01-01T00:00:00Z')")
+
+        upsert_user("a", "x.bsky.social", "enc-1", "octo-1", 1)
+        upsert_user("b", "y.bsky.social", "enc-2", "octo-2", 0)
+
+        rows = {r["orcid"]: r for r in memory_db.q("SELECT * FROM users")}
+        assert rows["a"]["bsky_handle"] == "x.bsky.social"
+        assert rows["a"]["last_sync"] == "2024-01-01T00:00:00Z"  # untouched columns survive
+        assert (rows["b"]["encrypted_app_password"], rows["b"]["active"]) == ("enc-2", 0)
+
+    def test_set_user_active_leaves_other_columns(self, memory_db):
+        from octosphere.database import set_user_active
+
+        memory_db.execute(
+            "INSERT INTO users (orcid, active, encrypted_app_password) VALUES ('a', 1, 'secret'), ('b', 1, 'other')"
+        )
+
+        set_user_active("a", False)
+
+        rows = {r["orcid"]: (r["active"], r["encrypted_app_password"])
+                for r in memory_db.q("SELECT orcid, active, encrypted_app_password FROM users")}
+        assert rows == {"a": (0, "secret"), "b": (1, "other")}
+
+
+class TestReaders:
+    def test_reader_is_per_thread_and_read_only(self, tmp_path, monkeypatch):
+        import threading
+        import apsw
+        from fastlite import database
+        import octosphere.database as database_module
+
+        path = tmp_path / "readers.db"
+        writer = database(path)
+        writer.execute("CREATE TABLE t (x INTEGER)")
+        writer.execute("INSERT INTO t VALUES (1)")
+        monkeypatch.setattr(database_module, "db_path", str(path))
+        monkeypatch.setattr(database_module, "_readers", threading.local())
+
+        mine = database_module._reader()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(database_module._reader()))
+        thread.start()
+        thread.join()
+
+        assert database_module._reader() is mine
+        assert other[0] is not mine
+        assert mine.q("SELECT x FROM t") == [{"x": 1}]
+        with pytest.raises(apsw.ReadOnlyError):
+            mine.execute("INSERT INTO t VALUES (2)")
+
+
+class TestConnectionPragmas:
+    def test_applies_wal_and_synchronous_normal(self, tmp_path):
+        from fastlite import database
+        from octosphere.database import _configure_connection
+
+        db = database(tmp_path / "pragmas.db")
+        _configure_connection(db)
+
+        assert db.q("PRAGMA journal_mode")[0]["journal_mode"] == "wal"
+        assert db.q("PRAGMA synchronous")[0]["synchronous"] == 1  # NORMAL
+        assert db.q("PRAGMA cache_size")[0]["cache_size"] == -20000
+        assert db.q("PRAGMA temp_store")[0]["temp_store"] == 2  # MEMORY
+
+
+class TestSchemaIndexes:
+    """The initial migration already indexes users and synced_publications by orcid."""
+
+    @pytest.fixture
+    def schema_db(self):
+        from pathlib import Path
+        from fastlite import database
+
+        mem = database(":memory:")
+        sql = Path(__file__).parent.parent / "migrations" / "0001-initial.sql"
+        mem.conn.execute(sql.read_text())
+        return mem
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT COUNT(*) AS n FROM synced_publications WHERE orcid = ?",
+        "SELECT octopus_pub_id, octopus_version_id FROM synced_publications WHERE orcid = ?",
+        "DELETE FROM synced_publications WHERE orcid = ?",
+    ])
+    def test_per_user_queries_use_an_index(self, schema_db, sql):
+        plan = " ".join(row["detail"] for row in schema_db.q(f"EXPLAIN QUERY PLAN {sql}", ["a"]))
+
+        assert "USING COVERING INDEX" in plan
+        assert "SCAN" not in plan
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT orcid, bsky_handle, active, last_sync FROM users WHERE orcid = ?",
+        "UPDATE users SET active = 0 WHERE orcid = ?",
+    ])
+    def test_user_lookups_use_the_primary_key(self, schema_db, sql):
+        plan = " ".join(row["detail"] for row in schema_db.q(f"EXPLAIN QUERY PLAN {sql}", ["a"]))
+
+        assert "USING INDEX sqlite_autoindex_users_1" in plan
+        assert "SCAN" not in plan
+
+
+class TestCreateDbIfMissing:
+    """Tests for creating a new database before fastlite connects."""
+
+    def test_creates_and_migrates_new_database(self, tmp_path):
+        import sqlite3
+        from pathlib import Path
+        from octosphere.database import _create_db_if_missing
+
+        db_file = tmp_path / "fresh.db"
+        migrations = Path(__file__).parent.parent / "migrations"
+
+        assert _create_db_if_missing(db_file, migrations) is True
+
+        conn = sqlite3.connect(db_file)
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        conn.close()
+        assert {"users", "synced_publications", "_meta"} <= tables
+
+    def test_existing_database_skips_lock_and_migrations(self, tmp_path):
+        from unittest.mock import patch
+        from octosphere.database import _create_db_if_missing
+
+        db_file = tmp_path / "existing.db"
+        db_file.write_bytes(b"")
+
+        with patch("fastmigrate.run_migrations") as mock_migrate:
+            assert _create_db_if_missing(db_file, tmp_path) is False
+
+        mock_migrate.assert_not_called()
+        assert not (tmp_path / "existing.db.lock").exists()
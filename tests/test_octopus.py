@@ -125,6 +125,23 @@ class TestOctopusClient:
         
         assert url == "https://www.octopus.ac/publications/pub-123/versions/ver-456"
 
+    @responses.activate
+    def test_clients_share_one_cookieless_session(self, client):
+        """Test that per-user clients reuse the pooled session without keeping cookies."""
+        responses.add(
+            responses.GET,
+            "https://prod.api.octopus.ac/v1/users/abc",
+            json={"id": "abc"},
+            headers={"Set-Cookie": "sid=secret; Path=/"},
+            status=200,
+        )
+        other = OctopusClient("https://prod.api.octopus.ac/v1", "https://www.octopus.ac", access_token="token")
+        
+        client.get_user_info("abc")
+        
+        assert other.http is client.http
+        assert len(client.http.cookies) == 0
+
     def test_extract_user_id_from_url(self):
         """Test extracting internal user ID from author page URL."""
         url = "https://www.octopus.ac/authors/cl5smny4a000009ieqml45bhz"
@@ -135,3 +152,10 @@ class TestOctopusClient:
         """Test extract returns None for invalid URLs."""
         assert OctopusClient.extract_user_id_from_url("https://example.com") is None
         assert OctopusClient.extract_user_id_from_url("not-a-url") is None
+
+    def test_extract_user_id_from_url_requires_whole_segment(self):
+        """Trailing slashes and query strings are fine; a partial ID is not."""
+        base = "https://www.octopus.ac/authors/cl5smny4a000009ieqml45bhz"
+        assert OctopusClient.extract_user_id_from_url(base + "/") == "cl5smny4a000009ieqml45bhz"
+        assert OctopusClient.extract_user_id_from_url(base + "?tab=pubs") == "cl5smny4a000009ieqml45bhz"
+        assert OctopusClient.extract_user_id_from_url(base + "-copy") is None
@@ -0,0 +1,129 @@
+"""Tests for panels.py - dashboard and onboarding panel builders."""
+from fasthtml.common import Input, to_xml
+
+from octosphere.bridge import SyncResult
+from octosphere.panels import dashboard_panel, step1_panel, step2_panel, sync_results_panel, sync_stats
+
+
+def _csrf():
+    return Input(type="hidden", name="csrf_token", value="test-token")
+
+
+class TestDashboardPanel:
+    def test_defers_counts_to_stats_endpoint(self):
+        html = to_xml(dashboard_panel(
+            _csrf(),
+            orcid="0000-0001-2345-6789",
+            bsky_handle="test.bsky.social",
+            bsky_did=None,
+            last_sync_display="Never",
+        ))
+
+        assert 'hx-get="/sync_panel/stats"' in html
+        assert "Last sync: Never" in html
+        assert 'id="sync-panel"' in html
+
+    def test_links_to_pdsls_when_did_resolved(self):
+        html = to_xml(dashboard_panel(
+            _csrf(),
+            orcid="0000-0001-2345-6789",
+            bsky_handle="test.bsky.social",
+            bsky_did="did:plc:abc123",
+            last_sync_display="Never",
+        ))
+
+        assert "https://pdsls.dev/at://did:plc:abc123/social.octosphere.publication" in html
+
+
+class TestSyncStats:
+    def test_shows_sync_counts(self):
+        html = to_xml(sync_stats(pub_count=4, synced_count=2))
+
+        assert "2 of 4 publications synced" in html
+        assert 'id="sync-stats"' in html
+
+    def test_progress_bar_uses_integer_percentage(self):
+        html = to_xml(sync_stats(pub_count=3, synced_count=1))
+
+        assert "width: 33%;" in html
+
+    def test_omits_progress_bar_when_nothing_synced(self):
+        html = to_xml(sync_stats(pub_count=0, synced_count=0))
+
+        assert "var(--pico-primary); height: 100%" not in html
+
+
+class TestOnboardingPanels:
+    def test_step1_posts_to_validate_bluesky(self):
+        html = to_xml(step1_panel(_csrf()))
+
+        assert 'hx-post="/validate_bluesky"' in html
+        assert "test-token" in html
+
+    def test_step1_form_carries_each_users_csrf_token(self):
+        first = to_xml(step1_panel(Input(type="hidden", name="csrf_token", value="token-a")))
+        second = to_xml(step1_panel(Input(type="hidden", name="csrf_token", value="token-b")))
+
+        assert "token-a" in first and "token-b" not in first
+        assert "token-b" in second
+        assert 'name="app_password"' in second
+
+    def test_step2_shows_connected_handle(self):
+        html = to_xml(step2_panel(_csrf(), "test.bsky.social"))
+
+        assert "Connected to Bluesky as @test.bsky.social" in html
+        assert 'hx-post="/validate_octopus"' in html
+
+    def test_step2_escapes_handle_and_keeps_prerendered_form(self):
+        html = to_xml(step2_panel(_csrf(), "<b>evil</b>"))
+
+        assert "<b>evil</b>" not in html and "&lt;b&gt;evil&lt;/b&gt;" in html
+        assert html.index("test-token") < html.index('name="octopus_url"') < html.index("Find my publications")
+        assert "/disconnect_bluesky" in html
+
+
+class TestSyncResultsPanel:
+    def test_caps_table_at_ten_rows(self):
+        results = [
+            SyncResult(publication_id=f"pub-{i:03d}", version_id="v1", uri=f"at://did/nsid/{i}", cid="cid")
+            for i in range(12)
+        ]
+
+        html = to_xml(sync_results_panel(_csrf(), results, "test.bsky.social"))
+
+        assert html.count("<tr>") == 11  # header row + 10 results
+        assert "Showing 10 of 12 publications" in html
+
+    def test_escapes_result_values(self):
+        results = [SyncResult(publication_id="<script>", version_id="v1", uri=None, cid=None)]
+
+        html = to_xml(sync_results_panel(_csrf(), results, "test.bsky.social"))
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+        assert 'href="#"' in html
+
+    def test_auto_sync_form_carries_no_credentials(self):
+        results = [SyncResult(publication_id="pub-1", version_id="v1", uri=None, cid=None)]
+
+        html = to_xml(sync_results_panel(_csrf(), results, "test.bsky.social"))
+
+        assert 'name="app_password"' not in html
+        assert 'name="handle"' not in html
+
+    def test_auto_sync_form_carries_one_shot_token(self):
+        results = [SyncResult(publication_id="pub-1", version_id="v1", uri=None, cid=None)]
+
+        html = to_xml(sync_results_panel(_csrf(), results, "test.bsky.social", autosync_token="tok-123"))
+
+        assert 'name="autosync_token"' in html and 'value="tok-123"' in html
+
+
+class TestLoadingIndicator:
+    def test_reuses_one_instance_per_message(self):
+        from octosphere.panels import loading_indicator
+
+        first = loading_indicator("Working...", "loading")
+
+        assert loading_indicator("Working...", "loading") is first
+        assert 'class="htmx-indicator"' in to_xml(first)
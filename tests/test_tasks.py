@@ -29,45 +29,52 @@ class TestGetSyncIntervalDays:
 
 class TestGetUsersNeedingSync:
     @pytest.fixture
-    def mock_users_table(self):
-        """Create a mock users table."""
-        users_data = []
-        
-        def users_callable():
-            return users_data
-        
-        return users_callable, users_data
+    def mock_users_table(self, monkeypatch):
+        """Swap the module database for an in-memory users table."""
+        from fastlite import database
+        import octosphere.database as database_module
+
+        mem = database(":memory:")
+        mem.execute("CREATE TABLE users (orcid TEXT PRIMARY KEY, active INTEGER, last_sync TEXT)")
+        monkeypatch.setattr(database_module, "db", mem)
+
+        def add_users(rows):
+            for row in rows:
+                mem.execute(
+                    "INSERT INTO users (orcid, active, last_sync) VALUES (?, ?, ?)",
+                    (row["orcid"], int(row["active"]), row["last_sync"]),
+                )
+
+        return add_users
 
     def test_returns_users_with_no_last_sync(self, mock_users_table, monkeypatch):
-        users_callable, users_data = mock_users_table
-        users_data.extend([
+        add_users = mock_users_table
+        add_users([
             {"orcid": "0000-0001", "active": True, "last_sync": None},
             {"orcid": "0000-0002", "active": True, "last_sync": "2024-01-01T00:00:00"},
         ])
         
-        with patch("octosphere.tasks.users", users_callable):
-            from octosphere.tasks import get_users_needing_sync
-            result = get_users_needing_sync()
+        from octosphere.tasks import get_users_needing_sync
+        result = get_users_needing_sync()
         
         # User with no last_sync should need sync
         orcids = [u["orcid"] for u in result]
         assert "0000-0001" in orcids
 
     def test_returns_users_past_interval(self, mock_users_table, monkeypatch):
-        users_callable, users_data = mock_users_table
+        add_users = mock_users_table
         old_date = (datetime.utcnow() - timedelta(days=10)).isoformat()
         recent_date = (datetime.utcnow() - timedelta(days=1)).isoformat()
         
-        users_data.extend([
+        add_users([
             {"orcid": "0000-0001", "active": True, "last_sync": old_date},
             {"orcid": "0000-0002", "active": True, "last_sync": recent_date},
         ])
         
         monkeypatch.setenv("SYNC_INTERVAL_DAYS", "7")
         
-        with patch("octosphere.tasks.users", users_callable):
-            from octosphere.tasks import get_users_needing_sync
-            result = get_users_needing_sync()
+        from octosphere.tasks import get_users_needing_sync
+        result = get_users_needing_sync()
         
         # Only user with old last_sync should need sync
         orcids = [u["orcid"] for u in result]
@@ -75,15 +82,14 @@ class TestGetUsersNeedingSync:
         assert "0000-0002" not in orcids
 
     def test_excludes_inactive_users(self, mock_users_table, monkeypatch):
-        users_callable, users_data = mock_users_table
-        users_data.extend([
+        add_users = mock_users_table
+        add_users([
             {"orcid": "0000-0001", "active": False, "last_sync": None},
             {"orcid": "0000-0002", "active": True, "last_sync": None},
         ])
         
-        with patch("octosphere.tasks.users", users_callable):
-            from octosphere.tasks import get_users_needing_sync
-            result = get_users_needing_sync()
+        from octosphere.tasks import get_users_needing_sync
+        result = get_users_needing_sync()
         
         orcids = [u["orcid"] for u in result]
         assert "0000-0001" not in orcids
@@ -128,10 +134,10 @@ class TestTaskSyncUser:
     @patch("octosphere.tasks.AtprotoClient")
     @patch("octosphere.tasks.OctopusClient")
     @patch("octosphere.tasks.decrypt_password")
-    @patch("octosphere.tasks.synced_publications")
+    @patch("octosphere.tasks.record_synced_publications")
     def test_syncs_publications_successfully(
         self,
-        mock_synced_pubs,
+        mock_record,
         mock_decrypt,
         mock_octopus_class,
         mock_atproto_class,
@@ -159,9 +165,9 @@ class TestTaskSyncUser:
         monkeypatch.setenv("OCTOPUS_WEB_URL", "https://www.octopus.ac")
         monkeypatch.setenv("ATPROTO_PDS_URL", "https://bsky.social")
         
-        with patch("octosphere.tasks.users") as mock_users:
+        with patch("octosphere.tasks.users") as mock_users, \
+                patch("octosphere.tasks.synced_publication_keys", return_value=set()):
             mock_users.__getitem__.return_value = mock_user
-            mock_users.update = MagicMock()
             
             from octosphere.tasks import task_sync_user
             task_sync_user("0000-0001-2345-6789")
@@ -169,11 +175,20 @@ class TestTaskSyncUser:
         # Verify sync was called
         mock_sync.assert_called_once()
         
-        # Verify publications were recorded
-        mock_synced_pubs.insert.assert_called_once()
+        # Verify publications and the last sync time were recorded together
+        mock_record.assert_called_once()
+        assert mock_record.call_args.args == ("0000-0001-2345-6789", [mock_result])
+        assert mock_record.call_args.kwargs["last_sync"].endswith("Z")
+
+        # The AT Proto client shares the module's identity resolver
+        from octosphere.tasks import _id_resolver
+        assert mock_atproto_class.call_args.kwargs["resolver"] is _id_resolver
+
+        # Without a prefetched list, sync_publications fetches it itself
+        assert mock_sync.call_args.kwargs["publications"] is None
 
     @patch("octosphere.tasks.decrypt_password")
-    def test_handles_sync_errors_gracefully(self, mock_decrypt, mock_user, caplog, monkeypatch):
+    def test_logs_and_reraises_sync_errors(self, mock_decrypt, mock_user, caplog, monkeypatch):
         mock_decrypt.side_effect = Exception("Decryption failed")
 
         monkeypatch.setenv("OCTOPUS_API_URL", "https://api.octopus.ac")
@@ -184,8 +199,25 @@ class TestTaskSyncUser:
 
             with caplog.at_level(logging.ERROR):
                 from octosphere.tasks import task_sync_user
-                # Should not raise, just log error
-                task_sync_user("0000-0001-2345-6789")
+                # Logged, then raised so "Sync Now" can report the failure
+                with pytest.raises(Exception, match="Decryption failed"):
+                    task_sync_user("0000-0001-2345-6789")
 
         assert "Sync failed" in caplog.text
         assert "Decryption failed" in caplog.text
+
+
+class TestNowIso:
+    def test_formats_utc_with_z_suffix(self):
+        from octosphere.tasks import _now_iso
+
+        value = _now_iso()
+
+        assert value.endswith("Z")
+        assert len(value) == len("2024-01-01T00:00:00Z")
+        assert datetime.fromisoformat(value).tzinfo is not None
+
+    def test_applies_delta(self):
+        from octosphere.tasks import _now_iso
+
+        assert _now_iso(-timedelta(days=1)) < _now_iso()